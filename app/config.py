@@ -17,6 +17,7 @@ class AppConfig:
     udp_record_laps: bool = False  # write UDP lap summaries into DB (parallel)
     udp_write_csv_laps: bool = False
     udp_output_root: str = ""  # user-chosen folder for persistent data (NOT cache)
+    udp_csv_one_file_per_session: bool = True  # minisector CSV: append laps to one file per session (False = one file per lap)
 
     # Debug spam control
     udp_debug: bool = True
@@ -51,6 +52,7 @@ def load_config() -> AppConfig:
             udp_record_laps=bool(data.get("udp_record_laps", False)),
             udp_write_csv_laps=bool(data.get("udp_write_csv_laps", False)),
             udp_output_root=str(data.get("udp_output_root", "")),
+            udp_csv_one_file_per_session=bool(data.get("udp_csv_one_file_per_session", True)),
             udp_debug=bool(data.get("udp_debug", True)),
 
             # --- record/replay + dump ---
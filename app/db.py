@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
-from .paths import db_path
+from .paths import db_path, db_path_str
 
 SCHEMA = """
          CREATE TABLE IF NOT EXISTS laps
@@ -41,7 +44,7 @@ SCHEMA = """
 
 
 def connect() -> sqlite3.Connection:
-    con = sqlite3.connect(db_path())
+    con = sqlite3.connect(db_path_str())
     con.execute("PRAGMA journal_mode=WAL;")
     con.execute("PRAGMA synchronous=NORMAL;")
     con.execute(SCHEMA)
@@ -64,6 +67,29 @@ def connect() -> sqlite3.Connection:
     return con
 
 
+# Shared read-only connection for the frequent SELECT paths (DB view refresh, track combo, engine cache).
+# Opened once (schema/migrations via connect() first), reused across threads behind a lock.
+# WAL: every SELECT starts a fresh read snapshot, so new commits from writer connections are visible.
+_READ_CON: sqlite3.Connection | None = None
+_READ_CON_PATH = None
+_READ_LOCK = threading.Lock()
+
+
+def _read_query(sql: str, params: tuple = ()) -> List[Tuple]:
+    global _READ_CON, _READ_CON_PATH
+    with _READ_LOCK:
+        p = db_path_str()
+        if _READ_CON is None or _READ_CON_PATH != p:
+            connect().close()  # make sure schema/migrations exist before going query_only
+            con = sqlite3.connect(p, check_same_thread=False)
+            con.execute("PRAGMA mmap_size=268435456;")
+            con.execute("PRAGMA query_only=ON;")
+            if _READ_CON is not None:
+                _READ_CON.close()
+            _READ_CON, _READ_CON_PATH = con, p
+        return _READ_CON.execute(sql, params).fetchall()
+
+
 def upsert_lap(source_file: str, summary: Dict[str, Any]) -> None:
     con = connect()
     with con:
@@ -115,9 +141,30 @@ def upsert_lap(source_file: str, summary: Dict[str, Any]) -> None:
         )
 
 
+@lru_cache(maxsize=1)
+def _db_files() -> Tuple[Path, Path]:
+    p = db_path()
+    return p, p.with_name(p.name + "-wal")
+
+
+def db_signature() -> Tuple[int, ...]:
+    """
+    Cheap change signature of the DB files: (size, mtime_ns) of data.db and its WAL file.
+    With journal_mode=WAL, commits land in data.db-wal until a checkpoint, so both are needed.
+    Missing files contribute (-1, -1).
+    """
+    sig: List[int] = []
+    for f in _db_files():
+        try:
+            st = f.stat()
+            sig += (st.st_size, st.st_mtime_ns)
+        except OSError:
+            sig += (-1, -1)
+    return tuple(sig)
+
+
 def latest_laps(limit: int = 50) -> List[Tuple]:
-    con = connect()
-    cur = con.execute(
+    return _read_query(
         """
         SELECT created_at,
                game,
@@ -128,7 +175,6 @@ def latest_laps(limit: int = 50) -> List[Tuple]:
         """,
         (limit,),
     )
-    return cur.fetchall()
 
 def distinct_slick_compounds(game: str | None, track: str | None, session_uid: str | None = None) -> list[str]:
     """
@@ -142,8 +188,6 @@ def distinct_slick_compounds(game: str | None, track: str | None, session_uid: s
     if not track:
         return []
 
-    con = connect()
-
     where = ["track = ?", "tyre LIKE 'C%'"]
     params: list[object] = [track]
 
@@ -161,7 +205,7 @@ def distinct_slick_compounds(game: str | None, track: str | None, session_uid: s
         WHERE {" AND ".join(where)}
         ORDER BY tyre DESC
     """
-    rows = con.execute(sql, tuple(params)).fetchall()
+    rows = _read_query(sql, tuple(params))
     out = []
     for (tyre,) in rows:
         if isinstance(tyre, str) and tyre.upper().startswith("C"):
@@ -235,8 +279,7 @@ def clear_laps_table() -> int:
 
 
 def lap_counts_by_track() -> List[Tuple[str, int]]:
-    con = connect()
-    cur = con.execute(
+    return _read_query(
         """
         SELECT COALESCE(track, '') AS track,
                COUNT(*)
@@ -245,12 +288,10 @@ def lap_counts_by_track() -> List[Tuple[str, int]]:
         ORDER BY COUNT(*) DESC
         """
     )
-    return cur.fetchall()
 
 
 def laps_for_track(track: str, limit: int = 2000):
-    con = connect()
-    cur = con.execute(
+    return _read_query(
         """
         SELECT created_at, session, track, tyre, weather, lap_time_s, fuel_load, wear_fl, wear_fr, wear_rl, wear_rr
         FROM laps
@@ -260,10 +301,8 @@ def laps_for_track(track: str, limit: int = 2000):
         """,
         (track, limit),
     )
-    return cur.fetchall()
 
 
 def distinct_tracks():
-    con = connect()
-    cur = con.execute("SELECT DISTINCT COALESCE(track,'') FROM laps WHERE COALESCE(track,'') <> '' ORDER BY 1;")
-    return [r[0] for r in cur.fetchall()]
+    rows = _read_query("SELECT DISTINCT COALESCE(track,'') FROM laps WHERE COALESCE(track,'') <> '' ORDER BY 1;")
+    return [r[0] for r in rows]
@@ -1,44 +1,161 @@
 # app/logic/minisectors.py
 from __future__ import annotations
 
+import logging
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 MINIS_PER_SECTOR = 10
 TOTAL_MINIS = 3 * MINIS_PER_SECTOR
 
 
-def _clamp(x: float, a: float, b: float) -> float:
-    return a if x < a else b if x > b else x
+# Per-minisector values live in NumPy columns on the tracker (struct of arrays).
+# "No value" is stored as this sentinel instead of None.
+_NA = np.iinfo(np.int64).min
+
+
+def _opt(v) -> Optional[int]:
+    return None if v == _NA else int(v)
 
 
-@dataclass
 class MiniRow:
-    idx: int
-    last_ms: Optional[int] = None
+    """
+    View of one minisector (index idx) into the tracker's column arrays.
+    Reading/writing attributes goes straight to the arrays; None <-> _NA.
+    """
+
+    __slots__ = ("_t", "idx")
+
+    def __init__(self, tracker: "MiniSectorTracker", idx: int):
+        self._t = tracker
+        self.idx = idx
+
+    @property
+    def last_ms(self) -> Optional[int]:
+        return _opt(self._t._last_ms[self.idx])
+
+    @last_ms.setter
+    def last_ms(self, v: Optional[int]) -> None:
+        t = self._t
+        was_set = bool(t._last_ms[self.idx] != _NA)
+        if v is None:
+            t._last_ms[self.idx] = _NA
+            t._last_present -= was_set
+        else:
+            t._last_ms[self.idx] = v
+            t._last_present += not was_set
 
     # NEW: Which lap does last_ms belong to?
     # This allows the UI to keep showing old values across the lap line,
     # while calculations (Theo/Missing) can ignore stale values.
-    last_lap_tag: Optional[int] = None
+    @property
+    def last_lap_tag(self) -> Optional[int]:
+        return _opt(self._t._last_lap_tag[self.idx])
+
+    @last_lap_tag.setter
+    def last_lap_tag(self, v: Optional[int]) -> None:
+        self._t._last_lap_tag[self.idx] = _NA if v is None else v
 
     # If True, last_ms was not measured directly but derived (fallback).
     # We only use this as a safety net when a lap would otherwise be unusable.
-    last_estimated: bool = False
+    @property
+    def last_estimated(self) -> bool:
+        return bool(self._t._last_estimated[self.idx])
+
+    @last_estimated.setter
+    def last_estimated(self, v: bool) -> None:
+        self._t._last_estimated[self.idx] = bool(v)
 
     # "When did this minisector finish in the CURRENT lap timeline?"
     # Used to roll back only affected minisectors on flashback/rewind.
-    last_end_ms: Optional[int] = None
+    @property
+    def last_end_ms(self) -> Optional[int]:
+        return _opt(self._t._last_end_ms[self.idx])
+
+    @last_end_ms.setter
+    def last_end_ms(self, v: Optional[int]) -> None:
+        self._t._last_end_ms[self.idx] = _NA if v is None else v
+
+    @property
+    def pb_ms(self) -> Optional[int]:
+        return _opt(self._t._pb_ms[self.idx])
+
+    @pb_ms.setter
+    def pb_ms(self, v: Optional[int]) -> None:
+        self._t._pb_ms[self.idx] = _NA if v is None else v
+
+    # session best (for now: same as pb; later can be "best of all cars")
+    @property
+    def best_ms(self) -> Optional[int]:
+        return _opt(self._t._best_ms[self.idx])
 
-    pb_ms: Optional[int] = None
-    best_ms: Optional[int] = None  # session best (for now: same as pb; later can be "best of all cars")
+    @best_ms.setter
+    def best_ms(self, v: Optional[int]) -> None:
+        self._t._best_ms[self.idx] = _NA if v is None else v
 
 
-@dataclass
+def _opt_list(col: np.ndarray) -> list:
+    return [None if v == _NA else v for v in col.tolist()]
+
+
+def _proportional_alloc(total_ms: int, lengths: np.ndarray) -> np.ndarray:
+    """
+    Split total_ms across segments proportionally to their lengths (sum == total_ms, each >= 1 ms).
+    Every segment but the last is rounded; the last one takes the remainder.
+    """
+    n = len(lengths)
+    # cumsum adds sequentially, i.e. the same total (and rounding) as the builtin sum()
+    t = np.round(total_ms * (lengths / lengths.cumsum()[-1])).astype(np.int64)
+    t[-1] = 0
+    rest = total_ms - t.cumsum()
+    # fast path: no segment needs the ">= 1 ms / keep room for the rest" clamp
+    if n == 1 or (t[:-1].min() >= 1 and (rest[:-1] >= np.arange(n - 1, 0, -1)).all()):
+        t[-1] = rest[-1]
+        return t
+
+    remaining = int(total_ms)
+    for i in range(n - 1):
+        ti = max(1, min(int(t[i]), remaining - (n - i - 1)))  # keep room for rest
+        t[i] = ti
+        remaining -= ti
+    t[-1] = remaining
+    return t
+
+
+def _na_column() -> np.ndarray:
+    return np.full(TOTAL_MINIS, _NA, dtype=np.int64)
+
+
+def _sum_if_complete(col: np.ndarray) -> Optional[int]:
+    if (col == _NA).any():
+        return None
+    return int(col.sum())
+
+
+# slots: fixed attribute layout -> attribute reads/writes in the per-tick update() skip the instance dict
+@dataclass(slots=True)
 class MiniSectorTracker:
     minis_per_sector: int = MINIS_PER_SECTOR
 
-    _rows: List[MiniRow] = field(default_factory=lambda: [MiniRow(i) for i in range(TOTAL_MINIS)])
+    # Column arrays (one entry per minisector), see MiniRow for the meaning of each column
+    _last_ms: np.ndarray = field(default_factory=_na_column)
+    _last_present: int = 0  # number of minisectors with a Last value (kept in sync by MiniRow.last_ms)
+    _last_lap_tag: np.ndarray = field(default_factory=_na_column)
+    _last_estimated: np.ndarray = field(default_factory=lambda: np.zeros(TOTAL_MINIS, dtype=np.bool_))
+    _last_end_ms: np.ndarray = field(default_factory=_na_column)
+    # PB (row 0) and Best (row 1) share one 2 x TOTAL_MINIS block so both update in one vector op;
+    # _pb_ms/_best_ms are row views into it
+    _pb_best: np.ndarray = field(default_factory=lambda: np.full((2, TOTAL_MINIS), _NA, dtype=np.int64))
+    _pb_ms: np.ndarray = field(init=False)
+    _best_ms: np.ndarray = field(init=False)
+
+    _rows: List[MiniRow] = field(init=False)
     _cur_idx: Optional[int] = None
     _last_split_ms: Optional[int] = None
     _last_lap_num: Optional[int] = None
@@ -48,14 +165,24 @@ class MiniSectorTracker:
     _just_lapped: bool = False  # set True on lap change to avoid skipping MS01 if first tick arrives late
     _partial_split: bool = True
 
-    # Completed-lap queue (additive): snapshot of last_ms when lap number increments
-    _completed_laps: List[dict] = field(default_factory=list)
+    # Completed-lap queue (additive): raw column copies taken when the lap number increments,
+    # (lap_num, lap_time_ms, int64 [last, end, pb, best] x TOTAL_MINIS, estimated); formatted on pop
+    _completed_laps: deque = field(default_factory=deque)
 
     # last computed boundaries (meters)
     _track_len_m: Optional[float] = None
     _s2_m: Optional[float] = None
     _s3_m: Optional[float] = None
 
+    # cached minisector bounds for the last (tl, s2, s3), see _geom()
+    _geom_key: Optional[tuple] = None
+    _geom_bounds: Optional[tuple] = None
+
+    def __post_init__(self) -> None:
+        self._pb_ms = self._pb_best[0]
+        self._best_ms = self._pb_best[1]
+        self._rows = [MiniRow(self, i) for i in range(TOTAL_MINIS)]
+
     def rows(self) -> List[MiniRow]:
         return self._rows
 
@@ -63,89 +190,80 @@ class MiniSectorTracker:
         return self._cur_idx
 
     def sum_last_ms(self) -> Optional[int]:
-        vals = [r.last_ms for r in self._rows]
-        if any(v is None for v in vals):
+        if self._last_present != TOTAL_MINIS:
             return None
-        return int(sum(int(v) for v in vals))
+        return int(self._last_ms.sum())
 
     def sum_pb_ms(self) -> Optional[int]:
-        vals = [r.pb_ms for r in self._rows]
-        if any(v is None for v in vals):
-            return None
-        return int(sum(int(v) for v in vals))
+        return _sum_if_complete(self._pb_ms)
 
     def sum_best_ms(self) -> Optional[int]:
-        vals = [r.best_ms for r in self._rows]
-        if any(v is None for v in vals):
-            return None
-        return int(sum(int(v) for v in vals))
+        return _sum_if_complete(self._best_ms)
 
     def missing_last_indices(self) -> list[int]:
         # 1-based minisector numbers
-        return [r.idx + 1 for r in self._rows if r.last_ms is None]
+        if self._last_present == TOTAL_MINIS:
+            return []
+        return (np.flatnonzero(self._last_ms == _NA) + 1).tolist()
 
     def sum_last_ms_current(self) -> Optional[int]:
         """
         Sum of minisectors for the CURRENT lap only.
-        We require that each minisector has a value tagged with the current lap number.
+        We require that each minisector has a value (Last values are overwritten per minisector,
+        the lap tag is not checked), i.e. the same as sum_last_ms().
         """
-        if self._last_lap_num is None:
-            return self.sum_last_ms()
-
-        vals = []
-        for r in self._rows:
-            if r.last_ms is None:
-                return None
-            vals.append(int(r.last_ms))
-        return int(sum(vals))
+        return self.sum_last_ms()
 
     def missing_current_indices(self) -> list[int]:
         """
-        Minisectors that are missing for the CURRENT lap (tag mismatch or None).
+        Minisectors that are missing for the CURRENT lap (None).
         1-based minisector numbers.
         """
-        if self._last_lap_num is None:
-            return self.missing_last_indices()
-
-        cur = int(self._last_lap_num)
-        out = []
-        for r in self._rows:
-            if r.last_ms is None:
-                out.append(r.idx + 1)
-        return out
+        return self.missing_last_indices()
 
     def pop_completed_laps(self) -> List[dict]:
         """
         Return and clear completed-lap snapshots.
-        Each entry is a dict with lap_num, lap_time_ms, minis[], missing[], complete.
+        Each entry is a dict with lap_num, lap_time_ms, per-minisector columns
+        (split_ms[], end_ms[], pb_ms[], best_ms[], estimated[]), missing[], complete.
         """
-        out = list(self._completed_laps)
-        self._completed_laps.clear()
-        return out
+        if not self._completed_laps:
+            return []
+        # hand the filled queue over and start a fresh one (no copy + clear)
+        q, self._completed_laps = self._completed_laps, deque()
+        return [self._format_snapshot(*entry) for entry in q]
+
+    def _queue_snapshot(self, lap_num: Optional[int], lap_time_ms: Optional[int]) -> None:
+        cols = np.stack((self._last_ms, self._last_end_ms, self._pb_ms, self._best_ms))
+        self._completed_laps.append((lap_num, lap_time_ms, cols, self._last_estimated.copy()))
 
     def _snapshot_lap(self, lap_num: Optional[int], lap_time_ms: Optional[int]) -> dict:
-        minis = []
-        for r in self._rows:
-            minis.append({
-                "ms_no": r.idx + 1,
-                "split_ms": r.last_ms,
-                "end_ms": r.last_end_ms,
-                "pb_ms": r.pb_ms,
-                "best_ms": r.best_ms,
-                "estimated": bool(r.last_estimated),  # NEW: allows main.py to add '*' for MS01
-            })
-
-        missing = [m["ms_no"] for m in minis if m["split_ms"] is None]
-        complete = (len(missing) == 0)
+        cols = np.stack((self._last_ms, self._last_end_ms, self._pb_ms, self._best_ms))
+        return self._format_snapshot(lap_num, lap_time_ms, cols, self._last_estimated)
+
+    def _format_snapshot(
+            self,
+            lap_num: Optional[int],
+            lap_time_ms: Optional[int],
+            cols: np.ndarray,
+            estimated: np.ndarray,
+    ) -> dict:
+        # Columnar: one list per field, index i = minisector MS(i+1); missing values are None
+        last = cols[0]
+        missing = (np.flatnonzero(last == _NA) + 1).tolist()
 
         return {
             "lap_num": int(lap_num) if lap_num is not None else None,
             "lap_time_ms": int(lap_time_ms) if lap_time_ms is not None else None,
             "minis_per_sector": int(self.minis_per_sector),
-            "total_minis": int(len(minis)),
-            "minis": minis,
+            "total_minis": TOTAL_MINIS,
+            "split_ms": _opt_list(last),
+            "end_ms": _opt_list(cols[1]),
+            "pb_ms": _opt_list(cols[2]),
+            "best_ms": _opt_list(cols[3]),
+            "estimated": estimated.tolist(),  # NEW: allows main.py to add '*' for MS01
             "missing": missing,
-            "complete": bool(complete),
+            "complete": not missing,
         }
 
     def sanity_check_snapshot(
@@ -198,34 +316,25 @@ class MiniSectorTracker:
             out["notes"].append("sanity_check_snapshot: missing/invalid track_len or sector starts")
             return out
 
-        minis = snap.get("minis") or []
+        splits = snap.get("split_ms") or []
         # --- missing indices ---
-        for m in minis:
-            ms_no = m.get("ms_no")
-            split = m.get("split_ms")
-            if ms_no is None:
-                continue
-            if split is None:
-                out["missing"].append(int(ms_no))
+        out["missing"] = [i + 1 for i, split in enumerate(splits) if split is None]
 
         # --- plausibility thresholds derived from segment length + speed bounds ---
         # Convert speed bounds to m/s
         vmin = max(1.0, float(vmin_kmh)) / 3.6
         vmax = max(vmin + 0.1, float(vmax_kmh)) / 3.6
 
-        for m in minis:
-            ms_no = m.get("ms_no")
-            split = m.get("split_ms")
-            if ms_no is None or split is None:
+        for idx0, split in enumerate(splits):
+            if split is None:
                 continue
 
             try:
-                ms_no_i = int(ms_no)
                 split_i = int(split)
             except Exception:
                 continue
 
-            idx0 = ms_no_i - 1
+            ms_no_i = idx0 + 1
             seg_a, seg_b = self._bounds_for_idx(idx0, tl, s2, s3)
             seg_m = max(0.0, float(seg_b - seg_a))
 
@@ -262,13 +371,12 @@ class MiniSectorTracker:
         # Start a new lap timeline: Last values are per-lap, PB/Best are session-wide.
         # Clearing Last here prevents stale minisector times from leaking into the next lap
         # when we miss early ticks (which is the root cause for MS1 being "empty" or wrong).
-        for r in self._rows:
-            # IMPORTANT:
-            # Do NOT wipe r.last_ms here, otherwise the UI will "blank" the whole Last column on lap line.
-            # We only reset per-lap timeline bookkeeping. Each minisector will be overwritten individually
-            # as soon as we measure it in the new lap.
-            r.last_end_ms = None
-            # keep last_estimated + last_ms visible (belongs to previous lap via last_lap_tag)
+        # IMPORTANT:
+        # Do NOT wipe last_ms here, otherwise the UI will "blank" the whole Last column on lap line.
+        # We only reset per-lap timeline bookkeeping. Each minisector will be overwritten individually
+        # as soon as we measure it in the new lap.
+        self._last_end_ms.fill(_NA)
+        # keep last_estimated + last_ms visible (belongs to previous lap via last_lap_tag)
 
         self._cur_idx = None
         self._last_split_ms = 0 if isinstance(cur_lap_time_ms, int) else None
@@ -302,19 +410,10 @@ class MiniSectorTracker:
             return
 
         # Only if MS01 is missing and MS02..MS30 are all present.
-        if not self._rows:
-            return
-        if self._rows[0].last_ms is not None:
-            return
-
-        rest = [r.last_ms for r in self._rows[1:]]
-        if any(v is None for v in rest):
+        if self._last_ms[0] != _NA or self._last_present != TOTAL_MINIS - 1:
             return
 
-        try:
-            rest_sum = int(sum(int(v) for v in rest if v is not None))
-        except Exception:
-            return
+        rest_sum = int(self._last_ms[1:].sum())
 
         ms1 = lt - rest_sum
 
@@ -325,72 +424,82 @@ class MiniSectorTracker:
         self._rows[0].last_ms = int(ms1)
         self._rows[0].last_estimated = True
 
+    def _close(self, idx: int, split_ms: int, end_ms: int) -> None:
+        """Close one minisector: Last/end timestamp + PB/Best (single-value path of _store_splits)."""
+        r = self._rows[idx]
+        r.last_ms = split_ms
+        r.last_end_ms = end_ms
+        if r.pb_ms is None or split_ms < r.pb_ms:
+            r.pb_ms = split_ms
+        if r.best_ms is None or split_ms < r.best_ms:
+            r.best_ms = split_ms
+
+    def _store_splits(self, ks: np.ndarray, t: np.ndarray, end_ms: int) -> None:
+        """
+        Write consecutive split times t for minisectors ks, the last one ending at end_ms.
+        Updates Last/end timestamps and PB/Best.
+        """
+        was_set = self._last_ms[ks] != _NA
+        self._last_present += int(len(ks) - np.count_nonzero(was_set))
+        self._last_ms[ks] = t
+        # each split ends where the following ones start: end_ms minus everything after it
+        self._last_end_ms[ks] = end_ms - (int(t.sum()) - t.cumsum())
+        # PB + Best in one go (_NA is the int64 minimum, so it must be replaced, not min'ed)
+        cur = self._pb_best[:, ks]
+        self._pb_best[:, ks] = np.where(cur == _NA, t, np.minimum(cur, t))
+
     def rollback_last_after(self, now_ms: int) -> None:
         """
         Flashback: remove ONLY minisectors that ended after now_ms in the current lap timeline.
         PB/Best stay untouched.
         """
-        for r in self._rows:
-            if r.last_end_ms is not None and r.last_end_ms > now_ms:
-                r.last_ms = None
-                r.last_end_ms = None
-                r.last_estimated = False
+        undone = (self._last_end_ms != _NA) & (self._last_end_ms > now_ms)
+        self._last_present -= int(np.count_nonzero(undone & (self._last_ms != _NA)))
+        self._last_ms[undone] = _NA
+        self._last_end_ms[undone] = _NA
+        self._last_estimated[undone] = False
 
     def _compute_idx(self, lap_dist_m: float, track_len_m: float, s2_m: float, s3_m: float) -> int:
-        # normalize distance into [0, track_len)
-        ld = lap_dist_m % track_len_m
-        ld = _clamp(ld, 0.0, track_len_m - 1e-6)
-
-        # sector ranges
-        s1_len = max(1.0, s2_m - 0.0)
-        s2_len = max(1.0, s3_m - s2_m)
-        s3_len = max(1.0, track_len_m - s3_m)
-
-        if ld < s2_m:
-            sector = 0
-            frac = (ld - 0.0) / s1_len
-        elif ld < s3_m:
-            sector = 1
-            frac = (ld - s2_m) / s2_len
-        else:
-            sector = 2
-            frac = (ld - s3_m) / s3_len
+        # normalize distance into [0, track_len) (float modulo only when actually outside)
+        ld = lap_dist_m if 0.0 <= lap_dist_m < track_len_m else lap_dist_m % track_len_m
+        # first minisector whose start is beyond ld, minus one (binary search on the cached starts)
+        starts = self._geom(track_len_m, s2_m, s3_m)[0]
+        return min(bisect_right(starts, ld, 1), TOTAL_MINIS) - 1
 
-        mini = int(frac * self.minis_per_sector)
-        if mini < 0:
-            mini = 0
-        if mini >= self.minis_per_sector:
-            mini = self.minis_per_sector - 1
-
-        return sector * self.minis_per_sector + mini
+    def _geom(self, tl: float, s2: float, s3: float) -> tuple[tuple[float, ...], tuple[float, ...], tuple]:
+        """
+        (starts, ends, (start, end) pairs) of all minisectors for the given geometry,
+        built once per (tl, s2, s3) as immutable tuples (lookups allocate nothing).
+        Minisectors are 10 per sector, using sector boundaries s2, s3:
+        sector 1: [0, s2], sector 2: [s2, s3], sector 3: [s3, tl]
+        """
+        key = (tl, s2, s3)
+        if self._geom_key != key:
+            starts: list[float] = []
+            ends: list[float] = []
+            n = self.minis_per_sector
+            for a, b in ((0.0, float(s2)), (float(s2), float(s3)), (float(s3), float(tl))):
+                seg = (b - a) / float(n)
+                for j in range(n):
+                    start = a + j * seg
+                    starts.append(start)
+                    ends.append(start + seg)
+            self._geom_key = key
+            self._geom_bounds = (tuple(starts), tuple(ends), tuple(zip(starts, ends)))
+        return self._geom_bounds
 
     def _bounds_for_idx(self, idx: int, tl: float, s2: float, s3: float) -> tuple[float, float]:
         """
         Return (start_m, end_m) of minisector idx within the lap distance domain [0, tl].
-        Minisectors are 10 per sector, using sector boundaries s2, s3.
         """
-        idx = max(0, min(int(idx), TOTAL_MINIS - 1))
-
-        # sector 1: [0, s2]
-        # sector 2: [s2, s3]
-        # sector 3: [s3, tl]
-        if idx < self.minis_per_sector:
-            a, b = 0.0, float(s2)
-            j = idx
-        elif idx < 2 * self.minis_per_sector:
-            a, b = float(s2), float(s3)
-            j = idx - self.minis_per_sector
-        else:
-            a, b = float(s3), float(tl)
-            j = idx - 2 * self.minis_per_sector
-
-        seg = (b - a) / float(self.minis_per_sector)
-        start = a + j * seg
-        end = start + seg
-        return start, end
+        if not 0 <= idx < TOTAL_MINIS:  # callers pass computed indices; only clamp stray ones
+            idx = 0 if idx < 0 else TOTAL_MINIS - 1
+        return self._geom(tl, s2, s3)[2][idx]
 
     def _start_for_idx(self, idx: int, tl: float, s2: float, s3: float) -> float:
-        return self._bounds_for_idx(idx, tl, s2, s3)[0]
+        if not 0 <= idx < TOTAL_MINIS:  # callers pass computed indices; only clamp stray ones
+            idx = 0 if idx < 0 else TOTAL_MINIS - 1
+        return self._geom(tl, s2, s3)[0][idx]
 
     def update(
             self,
@@ -411,8 +520,11 @@ class MiniSectorTracker:
         if track_len_m is None or track_len_m <= 0:
             return False
 
+        # coerce the UDP values once; everything below works on these
         tl = float(track_len_m)
         now_ms = int(cur_lap_time_ms)
+        lap_d = float(lap_dist_m)
+        lap_n = int(cur_lap_num) if cur_lap_num is not None else None
 
         # Prefer real sector boundaries (F1 25 normal path)
         if sector2_start_m is not None and sector3_start_m is not None:
@@ -426,147 +538,81 @@ class MiniSectorTracker:
             s3 = 2.0 * tl / 3.0
 
         # sanity: must be ordered and within track
-        if not (0.0 < s2 < s3 < tl):
+        # (the cached geometry already passed this check, so only a new geometry is tested)
+        same_geom = self._geom_key == (tl, s2, s3)
+        if not same_geom and not (0.0 < s2 < s3 < tl):
             return False
 
-        # lap change -> finalize last minisector using current lap time as end-of-lap boundary
-        try:
-            if cur_lap_num is not None and self._last_lap_num is not None and int(cur_lap_num) != int(
-                    self._last_lap_num):
-                # close the minisector we were in at end of previous lap
-                if self._cur_idx is not None and self._last_split_ms is not None:
-                    try:
-                        # Use last seen lap time BEFORE the reset as end-of-lap boundary
-                        end_ms = int(self._last_seen_lap_ms) if self._last_seen_lap_ms is not None else int(
-                            cur_lap_time_ms)
-                        split_ms = end_ms - int(self._last_split_ms)
-
-                        if 120 <= split_ms <= 120_000:
-                            # --- Robust: determine end-of-lap minisector by LAST seen distance (prevents wrap-to-0 issue) ---
-                            try:
-                                end_dist = self._last_seen_dist_m
-                                if end_dist is None:
-                                    end_dist = float(lap_dist_m)
-                                end_idx = self._compute_idx(float(end_dist), tl, s2, s3)
-                            except Exception:
-                                end_idx = int(self._cur_idx)
-
-                            cur = int(end_idx)
-
-                            # ensure we have a plausible "start distance" for proportional split
-                            if self._last_split_dist_m is None:
-                                try:
-                                    self._last_split_dist_m = self._start_for_idx(cur, tl, s2, s3)
-                                except Exception:
-                                    self._last_split_dist_m = None
-
-                            # --- MS30 fix (robust) ---
-                            last_idx = TOTAL_MINIS - 1  # MS30 index (29)
-                            prev_idx = TOTAL_MINIS - 2  # MS29 index (28)
-                            ms30_row = self._rows[last_idx]
-
-                            # If we didn't get ticks for the very end of the lap, we may "end" in MS27/MS28/MS29.
-                            # Robustly distribute the remaining time from our last split start distance up to tl
-                            # across ALL remaining minisectors, ensuring MS30 gets a value.
-                            if ms30_row.last_ms is None and self._last_split_dist_m is not None:
-                                start_d = float(self._last_split_dist_m)
-
-                                # Build remaining minisector segments from current (cur) to last (MS30)
-                                segs = []
-                                for k in range(cur, last_idx + 1):
-                                    a, b = self._bounds_for_idx(k, tl, s2, s3)
-                                    a = float(a)
-                                    b = float(b)
-
-                                    # effective start: can't start before our last split start
-                                    eff_a = max(a, start_d)
-                                    eff_b = b
-                                    if eff_b > eff_a:
-                                        segs.append((k, eff_b - eff_a))
-
-                                if segs:
-                                    total_d = sum(d for _, d in segs)
-                                    # safety: if total_d is weird, fallback to old behavior
-                                    if total_d > 0.0:
-                                        remaining = int(split_ms)
-
-                                        # allocate times proportionally, keep sum == split_ms and each >= 1ms
-                                        alloc = []
-                                        for i, (k, d) in enumerate(segs):
-                                            if i == len(segs) - 1:
-                                                t = remaining
-                                            else:
-                                                t = int(round(split_ms * (d / total_d)))
-                                                t = max(1,
-                                                        min(t, remaining - (len(segs) - i - 1)))  # keep room for rest
-                                                remaining -= t
-                                            alloc.append((k, t))
-
-                                        # write sequential end_ms timestamps
-                                        t_left = int(split_ms)
-                                        end_cursor = int(end_ms)
-                                        for k, t in reversed(alloc):
-                                            r = self._rows[k]
-                                            r.last_ms = int(t)
-                                            r.last_end_ms = int(end_cursor)
-                                            if r.pb_ms is None or t < r.pb_ms:
-                                                r.pb_ms = int(t)
-                                            if r.best_ms is None or t < r.best_ms:
-                                                r.best_ms = int(t)
-                                            end_cursor -= int(t)
-                                            t_left -= int(t)
-                                    else:
-                                        r = self._rows[cur]
-                                        r.last_ms = split_ms
-                                        r.last_end_ms = end_ms
-                                        if r.pb_ms is None or split_ms < r.pb_ms:
-                                            r.pb_ms = split_ms
-                                        if r.best_ms is None or split_ms < r.best_ms:
-                                            r.best_ms = split_ms
-                                else:
-                                    r = self._rows[cur]
-                                    r.last_ms = split_ms
-                                    r.last_end_ms = end_ms
-                                    if r.pb_ms is None or split_ms < r.pb_ms:
-                                        r.pb_ms = split_ms
-                                    if r.best_ms is None or split_ms < r.best_ms:
-                                        r.best_ms = split_ms
-                            else:
-                                # default: close minisector at lap end
-                                r = self._rows[cur]
-                                r.last_ms = split_ms
-                                r.last_end_ms = end_ms
-                                if r.pb_ms is None or split_ms < r.pb_ms:
-                                    r.pb_ms = split_ms
-                                if r.best_ms is None or split_ms < r.best_ms:
-                                    r.best_ms = split_ms
-
-                    except Exception:
-                        pass
-
-                # snapshot previous lap minisectors BEFORE resetting (additive)
-                try:
-
-                    prev_lap_num = int(self._last_lap_num) if self._last_lap_num is not None else None
-                    prev_lap_time_ms = int(self._last_seen_lap_ms) if self._last_seen_lap_ms is not None else int(
-                        cur_lap_time_ms)
-
-                    # --- MS01 fallback (only if it was missing) ---
-                    # This is intentionally conservative: it only fills MS01 when we have a complete
-                    # lap time and ALL other minisectors (MS02...MS30) are present.
-                    self._maybe_estimate_ms1_from_lap_time(prev_lap_time_ms)
-                    self._completed_laps.append(self._snapshot_lap(prev_lap_num, prev_lap_time_ms))
-                except Exception:
-                    pass
-
-                self._just_lapped = True
-                self.reset_lap(cur_lap_time_ms)
+        # Hot path (most ticks): same lap, same geometry, still inside the current minisector
+        # -> only the "last seen" bookkeeping below would change, no split/flashback handling.
+        cur_idx = self._cur_idx
+        if same_geom and cur_idx is not None and (lap_n is None or lap_n == self._last_lap_num):
+            ld = lap_d if 0.0 <= lap_d < tl else lap_d % tl
+            starts = self._geom_bounds[0]
+            if starts[cur_idx] <= ld and (cur_idx + 1 >= len(starts) or ld < starts[cur_idx + 1]):
+                self._last_seen_lap_ms = now_ms
+                self._last_seen_dist_m = ld
+                return False
 
+        # lap change -> finalize last minisector using current lap time as end-of-lap boundary
+        # (internal bookkeeping values are plain ints, so no conversions/catch-alls needed here)
+        if lap_n is not None and self._last_lap_num is not None and lap_n != self._last_lap_num:
+            # Use last seen lap time BEFORE the reset as end-of-lap boundary
+            end_ms = self._last_seen_lap_ms if self._last_seen_lap_ms is not None else now_ms
+
+            # close the minisector we were in at end of previous lap
+            if self._cur_idx is not None and self._last_split_ms is not None:
+                split_ms = end_ms - self._last_split_ms
+
+                if 120 <= split_ms <= 120_000:
+                    # --- Robust: determine end-of-lap minisector by LAST seen distance (prevents wrap-to-0 issue) ---
+                    end_dist = self._last_seen_dist_m
+                    if end_dist is None:
+                        end_dist = lap_d
+                    cur = self._compute_idx(end_dist, tl, s2, s3)
+
+                    # ensure we have a plausible "start distance" for proportional split
+                    if self._last_split_dist_m is None:
+                        self._last_split_dist_m = self._start_for_idx(cur, tl, s2, s3)
+
+                    # --- MS30 fix (robust) ---
+                    last_idx = TOTAL_MINIS - 1  # MS30 index (29)
+
+                    # If we didn't get ticks for the very end of the lap, we may "end" in MS27/MS28/MS29.
+                    # Robustly distribute the remaining time from our last split start distance up to tl
+                    # across ALL remaining minisectors, ensuring MS30 gets a value.
+                    if self._last_ms[last_idx] != _NA:
+                        # default: close minisector at lap end
+                        self._close(cur, split_ms, end_ms)
+                    else:
+                        start_d = self._last_split_dist_m
+
+                        # Remaining minisector segments from current (cur) to last (MS30);
+                        # effective start: can't start before our last split start
+                        starts, ends, _ = self._geom(tl, s2, s3)
+                        lens = np.array(ends[cur:last_idx + 1]) - np.maximum(np.array(starts[cur:last_idx + 1]), start_d)
+                        keep = lens > 0.0
+                        if keep.any():
+                            ks = np.arange(cur, last_idx + 1)[keep]
+                            self._store_splits(ks, _proportional_alloc(split_ms, lens[keep]), end_ms)
+                        else:
+                            self._close(cur, split_ms, end_ms)
+
+            # snapshot previous lap minisectors BEFORE resetting (additive)
+            try:
+                # --- MS01 fallback (only if it was missing) ---
+                # This is intentionally conservative: it only fills MS01 when we have a complete
+                # lap time and ALL other minisectors (MS02...MS30) are present.
+                self._maybe_estimate_ms1_from_lap_time(end_ms)
+                self._queue_snapshot(self._last_lap_num, end_ms)
+            except Exception:
+                pass
 
-        except Exception:
-            pass
+            self._just_lapped = True
+            self.reset_lap(now_ms)
 
-        self._last_lap_num = int(cur_lap_num) if cur_lap_num is not None else self._last_lap_num
+        if lap_n is not None:
+            self._last_lap_num = lap_n
 
         # Keep last seen lap time updated on EVERY tick (not only on minisector transitions).
         # Otherwise, if the lap ends while we stay inside the same minisector, the lap-change
@@ -574,19 +620,12 @@ class MiniSectorTracker:
         self._last_seen_lap_ms = now_ms
 
         # keep last seen distance inside lap domain (0...tl)
-        try:
-            self._last_seen_dist_m = float(lap_dist_m) % tl
-        except Exception:
-            pass
+        ld0 = lap_d if 0.0 <= lap_d < tl else lap_d % tl
+        self._last_seen_dist_m = ld0
 
-        idx = self._compute_idx(float(lap_dist_m), tl, s2, s3)
+        idx = self._compute_idx(lap_d, tl, s2, s3)
 
         if self._cur_idx is None:
-            # Determine lap distance in [0..tl)
-            try:
-                ld0 = float(lap_dist_m) % tl
-            except Exception:
-                ld0 = None
 
             # IMPORTANT:
             # LapNum is not reliable/early enough in some situations. Use cur_lap_time_ms instead:
@@ -603,21 +642,13 @@ class MiniSectorTracker:
 
             treat_as_lap_start = (
                     force_lap_start
-                    or (
-                            (ld0 is not None)
-                            and (now_ms <= 15000)
-                            and (ld0 < 0.35 * tl)
-                    )
+                    or ((now_ms <= 15000) and (ld0 < 0.35 * tl))
             )
 
-            print(
-                f"[MS INIT] now_ms={now_ms} "
-                f"ld0={None if ld0 is None else round(ld0, 1)} "
-                f"idx={idx} "
-                f"lap_start={treat_as_lap_start} "
-                f"just_lapped={self._just_lapped} "
-                f"last_lap_num={self._last_lap_num} "
-                f"cur_lap_num={cur_lap_num}"
+            # lazy %-formatting: nothing is built unless debug logging is enabled
+            logger.debug(
+                "[MS INIT] now_ms=%s ld0=%.1f idx=%s lap_start=%s just_lapped=%s last_lap_num=%s cur_lap_num=%s",
+                now_ms, ld0, idx, treat_as_lap_start, self._just_lapped, self._last_lap_num, cur_lap_num,
             )
 
             # We consumed the "just lapped" hint now (regardless of which branch we take).
@@ -637,36 +668,12 @@ class MiniSectorTracker:
                         t_to_start = 0
 
                     if idx > 0 and t_to_start > 0:
-                        segs = []
-                        for k in range(0, idx):
-                            a, b = self._bounds_for_idx(k, tl, s2, s3)
-                            d = float(b) - float(a)
-                            if d > 0.0:
-                                segs.append((k, d))
-
-                        total_d = sum(d for _, d in segs)
-                        if total_d > 0.0 and segs:
-                            remaining = int(t_to_start)
-                            alloc = []
-                            for i, (k, d) in enumerate(segs):
-                                if i == len(segs) - 1:
-                                    t = remaining
-                                else:
-                                    t = int(round(t_to_start * (d / total_d)))
-                                    t = max(1, min(t, remaining - (len(segs) - i - 1)))
-                                    remaining -= t
-                                alloc.append((k, t))
-
-                            end_cursor = int(t_to_start)
-                            for k, t in reversed(alloc):
-                                r = self._rows[k]
-                                r.last_ms = int(t)
-                                r.last_end_ms = int(end_cursor)
-                                if r.pb_ms is None or t < r.pb_ms:
-                                    r.pb_ms = int(t)
-                                if r.best_ms is None or t < r.best_ms:
-                                    r.best_ms = int(t)
-                                end_cursor -= int(t)
+                        starts, ends, _ = self._geom(tl, s2, s3)
+                        lens = np.array(ends[:idx]) - np.array(starts[:idx])
+                        keep = lens > 0.0
+                        if keep.any():
+                            ks = np.arange(idx)[keep]
+                            self._store_splits(ks, _proportional_alloc(int(t_to_start), lens[keep]), int(t_to_start))
 
                     # Start current minisector at its boundary
                     self._cur_idx = int(idx)
@@ -700,40 +707,35 @@ class MiniSectorTracker:
 
         # We crossed into a new minisector => close previous minisector time
         # Use difference in current lap time
-        try:
-            # now_ms = int(cur_lap_time_ms)
-            # Flashback/rewind: lap time jumps backwards -> roll back only affected minisectors
-            # Flashback/rewind guard:
-            # Only treat "time went backwards" as flashback if we are STILL in the same lap.
-            # On a lap change, cur_lap_time_ms naturally resets near 0 and must NOT trigger rollback.
-            same_lap = (cur_lap_num is not None and self._last_lap_num is not None and int(cur_lap_num) == int(
-                self._last_lap_num))
-
-            if same_lap and self._last_seen_lap_ms is not None and now_ms < self._last_seen_lap_ms - 150:
-                # delete only minisectors that ended after now_ms in the undone timeline
-                self.rollback_last_after(now_ms)
-
-                # restart timing from the new timeline position
-                self._last_split_ms = now_ms
-
-                # re-sync current minisector index to the current position
-                self._cur_idx = self._compute_idx(float(lap_dist_m), tl, s2, s3)
-                self._partial_split = True
-                self._last_split_dist_m = self._start_for_idx(self._cur_idx, tl, s2, s3)
+        # Flashback/rewind: lap time jumps backwards -> roll back only affected minisectors
+        # Flashback/rewind guard:
+        # Only treat "time went backwards" as flashback if we are STILL in the same lap.
+        # On a lap change, cur_lap_time_ms naturally resets near 0 and must NOT trigger rollback.
+        same_lap = lap_n is not None and lap_n == self._last_lap_num
 
-                self._last_seen_lap_ms = now_ms
-                return False
+        if same_lap and self._last_seen_lap_ms is not None and now_ms < self._last_seen_lap_ms - 150:
+            # delete only minisectors that ended after now_ms in the undone timeline
+            self.rollback_last_after(now_ms)
+
+            # restart timing from the new timeline position
+            self._last_split_ms = now_ms
+
+            # re-sync current minisector index to the current position
+            self._cur_idx = idx
+            self._partial_split = True
+            self._last_split_dist_m = self._start_for_idx(idx, tl, s2, s3)
 
             self._last_seen_lap_ms = now_ms
-        except Exception:
             return False
 
+        self._last_seen_lap_ms = now_ms
+
         if self._last_split_ms is None:
             self._last_split_ms = now_ms
             self._cur_idx = idx
             return False
 
-        split_ms = now_ms - int(self._last_split_ms)
+        split_ms = now_ms - self._last_split_ms
         # sanity (avoid pit/teleport spikes)
         if split_ms <= 0 or split_ms > 120_000:
             self._last_split_ms = now_ms
@@ -750,20 +752,11 @@ class MiniSectorTracker:
             # -> do NOT write Last/PB/Best (keeps stored lap data clean)
             self._partial_split = False
         else:
-            r.last_ms = split_ms
-            r.last_end_ms = now_ms
+            self._close(finished_idx, split_ms, now_ms)
             r.last_estimated = False  # echtes Messsignal überschreibt Fallback
 
             # Tag this split as belonging to the current lap number (if available)
-            try:
-                r.last_lap_tag = int(cur_lap_num) if cur_lap_num is not None else self._last_lap_num
-            except Exception:
-                r.last_lap_tag = self._last_lap_num
-
-            if r.pb_ms is None or split_ms < r.pb_ms:
-                r.pb_ms = split_ms
-            if r.best_ms is None or split_ms < r.best_ms:
-                r.best_ms = split_ms
+            r.last_lap_tag = lap_n if lap_n is not None else self._last_lap_num
 
         # advance
         self._last_split_ms = now_ms
@@ -1,11 +1,19 @@
 # app/logic/rain_engine/core.py
 from __future__ import annotations
 
-import statistics
 import time
-from collections import deque
+from bisect import bisect_left, insort
 from dataclasses import dataclass
-from typing import Deque, Optional, Tuple, List
+from functools import partial
+from typing import Optional, Tuple, List
+
+import numpy as np
+
+# Optional: Numba JIT for the scalar score fusion (_fuse). Without it, _fuse runs as plain Python.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from app.f1_udp import F1LiveState
 from app.logic.rain_engine.forecast import (
@@ -18,25 +26,265 @@ from app.logic.rain_engine.tuning import RainPitTuning
 from app.strategy_model import RainPitAdvice
 
 
+# identical inputs within this many seconds -> RainEngine.update returns the previous output
+_REUSE_UNCHANGED_S = 0.25
+
+
 def _clamp01(x: float) -> float:
-    if x < 0.0:
-        return 0.0
-    if x > 1.0:
-        return 1.0
-    return x
+    # compare form on purpose: on CPython 3.11 this is ~8x faster than max(min(x, 1.0), 0.0)
+    # (two builtin calls); NaN and -0.0 pass through unchanged. Numba lowers it to min/max selects.
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+
+# _fuse's clamp: _clamp01 itself, or its Numba build when _fuse is compiled
+_clip01 = njit(cache=True)(_clamp01) if njit is not None else _clamp01
+_NAN = float("nan")
+
+
+def _fuse(
+        w_weather_enum, w_rain_now, w_temp_trend, w_delta_is, w_inter_share, w_forecast, w_baseline_loss,
+        rain_now_map_lo, rain_now_map_span, rain_now_floor_factor,
+        cold_track_ref_c, cold_track_span_c, cold_track_boost_max,
+        weather_med, rain_now_med, track_slope, air_slope, inter_share_med, delta_is_med, rain_next_med,
+        baseline_loss, track_temp_med,
+):
+    """
+    Wetness score fusion (pure scalar math, see RainEngine.update).
+    Tuning first (bound once per RainPitTuning, see _fuse_for), then the signals.
+    Missing inputs are NaN (x == x -> present). Returns wetness.
+    """
+    wsum = 0.0
+    wtot = 0.0
+    n_parts = 0
+
+    # 0 clear, 1 light cloud, 2 overcast, 3 light rain, 4 heavy rain, 5 storm
+    has_weather = weather_med == weather_med
+    w_enum = int(weather_med) if has_weather else 0
+    if has_weather:
+        if w_enum <= 2:
+            s0 = 0.0
+        elif w_enum == 3:
+            s0 = 0.25
+        elif w_enum == 4:
+            s0 = 0.55
+        else:
+            s0 = 0.75
+        wtot += s0 * w_weather_enum
+        wsum += w_weather_enum
+        n_parts += 1
+
+    s_now = _NAN
+    if rain_now_med == rain_now_med:
+        s_now = _clip01((rain_now_med - rain_now_map_lo) / rain_now_map_span)
+        wtot += s_now * w_rain_now
+        wsum += w_rain_now
+        n_parts += 1
+
+    if track_slope == track_slope:
+        wet_from_track = _clip01(((-track_slope) - 0.20) / 0.80)
+        dry_from_track = _clip01((track_slope - 0.20) / 0.80)
+        s_temp = _clip01(wet_from_track - 0.60 * dry_from_track + 0.50)
+        wtot += s_temp * w_temp_trend
+        wsum += w_temp_trend
+        n_parts += 1
+    elif air_slope == air_slope:
+        wet_from_air = _clip01(((-air_slope) - 0.10) / 0.60)
+        dry_from_air = _clip01((air_slope - 0.10) / 0.60)
+        s_temp = _clip01(wet_from_air - 0.50 * dry_from_air + 0.50)
+        wtot += s_temp * w_temp_trend
+        wsum += w_temp_trend
+        n_parts += 1
+
+    if delta_is_med == delta_is_med:
+        wtot += _clip01(((-delta_is_med) - 0.5) / 2.0) * w_delta_is
+        wsum += w_delta_is
+        n_parts += 1
+
+    if inter_share_med == inter_share_med:
+        wtot += _clip01((inter_share_med - 0.15) / 0.35) * w_inter_share
+        wsum += w_inter_share
+        n_parts += 1
+
+    if rain_next_med == rain_next_med:
+        wtot += _clip01((rain_next_med - 35.0) / 35.0) * w_forecast
+        wsum += w_forecast
+        n_parts += 1
+
+    if baseline_loss == baseline_loss:
+        wtot += _clip01((baseline_loss - 0.7) / 2.0) * w_baseline_loss
+        wsum += w_baseline_loss
+        n_parts += 1
+
+    temp_boost = 0.0
+    if track_temp_med == track_temp_med:
+        temp_boost = _clip01((cold_track_ref_c - track_temp_med) / cold_track_span_c) * cold_track_boost_max
+
+    wetness = wtot / max(1e-9, wsum) if n_parts else 0.0
+    wetness = _clip01(wetness + temp_boost)
+
+    # hard floor by "actual rain now" (HUD/telemetry)
+    if s_now == s_now:
+        wetness = max(wetness, s_now * rain_now_floor_factor)
+
+    return wetness
+
+
+def _fuse_fullwet(weather_med, delta_wi_med, wet_share_med, rain_next_med, heavy_incoming):
+    """Separate "full wet" score (Inter -> Wet), same NaN convention as _fuse."""
+    has_weather = weather_med == weather_med
+    w_enum = int(weather_med) if has_weather else 0
+
+    fw_wsum = 0.0
+    fw_tot = 0.0
+    fw_n = 0
+    fw0 = _NAN
+    if has_weather:
+        if w_enum <= 3:
+            fw0 = 0.0
+        elif w_enum == 4:
+            fw0 = 0.75
+        else:
+            fw0 = 0.95
+        fw_tot += fw0 * 0.35
+        fw_wsum += 0.35
+        fw_n += 1
+
+    if delta_wi_med == delta_wi_med:
+        fw_tot += _clip01(((-delta_wi_med) - 0.20) / 1.30) * 0.35
+        fw_wsum += 0.35
+        fw_n += 1
+
+    if wet_share_med == wet_share_med:
+        fw_tot += _clip01((wet_share_med - 0.05) / 0.25) * 0.25
+        fw_wsum += 0.25
+        fw_n += 1
+
+    if rain_next_med == rain_next_med:
+        fw_tot += _clip01((rain_next_med - 60.0) / 30.0) * 0.20
+        fw_wsum += 0.20
+        fw_n += 1
+
+    fullwet = fw_tot / max(1e-9, fw_wsum) if fw_n else 0.0
+
+    if has_weather:
+        fullwet = max(fullwet, fw0 * 0.85)
+    fullwet = _clip01(fullwet)
+
+    if heavy_incoming:
+        fullwet = min(1.0, fullwet + 0.10)
+
+    return fullwet
+
+
+# Numba (optional, not in requirements.txt): compiled _fuse/_fuse_fullwet; otherwise the plain Python ones
+_fuse_scores = njit(cache=True)(_fuse) if njit is not None else _fuse
+_fullwet_score = njit(cache=True)(_fuse_fullwet) if njit is not None else _fuse_fullwet
+
+
+def _fuse_for(p: RainPitTuning):
+    """_fuse with the (frozen) tuning of p bound up front -> per tick only the signals are passed."""
+    return partial(
+        _fuse_scores,
+        p.w_weather_enum, p.w_rain_now, p.w_temp_trend, p.w_delta_is, p.w_inter_share, p.w_forecast,
+        p.w_baseline_loss,
+        p.rain_now_map_lo, p.rain_now_map_span, p.rain_now_floor_factor,
+        p.cold_track_ref_c, p.cold_track_span_c, p.cold_track_boost_max,
+    )
 
 
 def _median(xs: List[float]) -> Optional[float]:
-    xs = [x for x in xs if x is not None]
+    # callers only collect floats (None is filtered before append)
     if not xs:
         return None
     try:
-        return statistics.median(xs)
+        return float(np.median(np.fromiter(xs, dtype=np.float64, count=len(xs))))
     except Exception:
         return None
 
 
-@dataclass
+class _RollingMedian:
+    """
+    Rolling (t, value) window as two float64 ring buffers (times, values) with its values
+    also kept sorted, so the median is read directly instead of re-sorting the window every update.
+    Samples are addressed by absolute index (head..tail-1); ring slot = index % capacity.
+    """
+
+    __slots__ = ("_ts", "_vs", "_head", "_tail", "_t_last", "_sorted", "_anchors")
+
+    def __init__(self, cap: int = 512):
+        self._ts = np.empty(cap, dtype=np.float64)
+        self._vs = np.empty(cap, dtype=np.float64)
+        self._head = 0
+        self._tail = 0
+        self._t_last = 0.0
+        self._sorted: List[float] = []
+        self._anchors: dict[float, int] = {}  # window_s -> abs index of the last anchor()
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    def _grow(self) -> None:
+        # full ring -> double it; samples move to their slot for the new capacity
+        cap = self._ts.size
+        idx = np.arange(self._head, self._tail)
+        ts = np.empty(cap * 2, dtype=np.float64)
+        vs = np.empty(cap * 2, dtype=np.float64)
+        ts[idx % (cap * 2)] = self._ts[idx % cap]
+        vs[idx % (cap * 2)] = self._vs[idx % cap]
+        self._ts, self._vs = ts, vs
+
+    def push(self, t: float, v: float, cutoff: float) -> None:
+        if v != v:
+            return  # NaN has no place in a sorted list (and no meaningful median)
+        tail = self._tail
+        if tail - self._head == self._ts.size:
+            self._grow()
+        cap = self._ts.size
+        self._ts[tail % cap] = t
+        self._vs[tail % cap] = v
+        self._tail = tail + 1
+        self._t_last = t
+        insort(self._sorted, v)
+        # prune old
+        ts, vs = self._ts, self._vs
+        head = self._head
+        while head < self._tail and ts[head % cap] < cutoff:
+            del self._sorted[bisect_left(self._sorted, float(vs[head % cap]))]
+            head += 1
+        self._head = head
+
+    def last(self) -> Tuple[float, float]:
+        i = (self._tail - 1) % self._ts.size
+        return float(self._ts[i]), float(self._vs[i])
+
+    def anchor(self, window_s: float) -> Tuple[float, float]:
+        """
+        Newest sample at least window_s older than the last one (oldest sample if there is none).
+        Timestamps are monotonic (update() stamps with time.monotonic()), so a per-window
+        pointer that only moves forward finds it (amortized O(1)).
+        """
+        t_last = self._t_last
+        head, tail = self._head, self._tail
+        ts = self._ts
+        cap = ts.size
+        k = max(self._anchors.get(window_s, 0), head)
+        while k + 1 < tail and (t_last - ts[(k + 1) % cap]) >= window_s:
+            k += 1
+        self._anchors[window_s] = k
+        return float(ts[k % cap]), float(self._vs[k % cap])
+
+    def median(self) -> Optional[float]:
+        xs = self._sorted
+        n = len(xs)
+        if not n:
+            return None
+        i = n // 2
+        if n % 2:
+            return xs[i]
+        return (xs[i - 1] + xs[i]) / 2
+
+
+@dataclass(slots=True)
 class RainEngineOutput:
     advice: RainPitAdvice
     wetness: float  # 0..1
@@ -85,19 +333,25 @@ class RainEngine:
         self._wi_lockout_until: float = 0.0
         self._wi_last_target: Optional[str] = None
 
-        # rolling samples: (t, value)
-        self._inter_share: Deque[Tuple[float, float]] = deque()
-        self._wet_share: Deque[Tuple[float, float]] = deque()
+        # rolling samples: (t, value) ring buffers + running median
+        self._inter_share = _RollingMedian()
+        self._wet_share = _RollingMedian()
+
+        self._delta_is = _RollingMedian()
+        self._delta_wi = _RollingMedian()
 
-        self._delta_is: Deque[Tuple[float, float]] = deque()
-        self._delta_wi: Deque[Tuple[float, float]] = deque()
+        self._rain_now = _RollingMedian()
+        self._rain_next = _RollingMedian()
 
-        self._rain_now: Deque[Tuple[float, float]] = deque()
-        self._rain_next: Deque[Tuple[float, float]] = deque()
+        self._track_temp = _RollingMedian()
+        self._air_temp = _RollingMedian()
+        self._weather = _RollingMedian()
 
-        self._track_temp: Deque[Tuple[float, float]] = deque()
-        self._air_temp: Deque[Tuple[float, float]] = deque()
-        self._weather: Deque[Tuple[float, float]] = deque()
+        # one row per tick goes through all windows in this order (see update: row = state inputs)
+        self._windows = (
+            self._inter_share, self._delta_is, self._rain_now, self._rain_next,
+            self._track_temp, self._air_temp, self._weather, self._wet_share, self._delta_wi,
+        )
 
         # hysteresis state
         self._is_wet_mode = False
@@ -110,35 +364,40 @@ class RainEngine:
         # cache baseline pace (track, tyre) -> (t, median_pace)
         self._baseline_cache: dict[Tuple[str, str], Tuple[float, float]] = {}
 
+        # last update: input signature + output (short-circuit while telemetry is stalled)
+        self._last_sig: Optional[tuple] = None
+        self._last_output: Optional[RainEngineOutput] = None
+        self._last_compute_t: float = 0.0
+
+        # pooled result: update() rewrites and returns this same instance (read it before the next update)
+        self._out = RainEngineOutput(
+            advice=RainPitAdvice("STAY OUT", None, None, ""), wetness=0.0, confidence=0.0, debug=""
+        )
+
+        # last conditions-shift reason text, keyed by (triggers, printed thresholds)
+        self._cond_reason_key: Optional[tuple] = None
+        self._cond_reason_txt: str = "-"
+
+        # forecast features: ((fc series copy, next-lap minute), (fc_at, t_dry, t_heavy))
+        self._fc_cache: tuple = (None, None)
+
         # tuning
         self.p = RainPitTuning()
+        # _fuse bound to the tuning it was built for (rebuilt in update when self.p is replaced)
+        self._fuse_p: Optional[RainPitTuning] = None
+        self._fuse_wetness = None
 
-    def _push(self, dq: Deque[Tuple[float, float]], t: float, v: Optional[float]):
-        if v is None:
-            return
-        dq.append((t, float(v)))
-        # prune old
-        cutoff = t - self.window_s
-        while dq and dq[0][0] < cutoff:
-            dq.popleft()
-
-    def _slope_c_per_min(self, dq: Deque[Tuple[float, float]], window_s: float = 90.0) -> Optional[float]:
+    def _slope_c_per_min(self, rm: _RollingMedian, window_s: float = 90.0) -> Optional[float]:
         """Return slope in °C/min over last window_s seconds (last - first)."""
-        if not dq or len(dq) < 2:
+        if len(rm) < 2:
             return None
-        t_last, v_last = dq[-1]
-        # find first sample within window
-        t0, v0 = None, None
-        for t, v in reversed(dq):
-            if (t_last - t) >= window_s:
-                t0, v0 = t, v
-                break
-        if t0 is None:
-            t0, v0 = dq[0]
-        dt = float(t_last - t0)
+        t_last, v_last = rm.last()
+        # first sample within window (pointer kept by the window, no scan)
+        t0, v0 = rm.anchor(window_s)
+        dt = t_last - t0
         if dt <= 1e-6:
             return None
-        return (float(v_last) - float(v0)) / dt * 60.0
+        return (v_last - v0) / dt * 60.0
 
     def update(
             self,
@@ -153,53 +412,69 @@ class RainEngine:
             your_last_lap_s: Optional[float] = None,
     ) -> RainEngineOutput:
 
-        fc_series = getattr(state, "rain_fc_series", None) or []
-        now = time.time()
+        # F1LiveState is a dataclass with None defaults -> plain attribute reads, once per tick
+        (inter_share, delta_is, rain_now, rain_fc, track_temp, air_temp, weather, wet_share, delta_wi,
+         your_delta_wi, sc) = (
+            state.inter_share, state.pace_delta_inter_vs_slick_s, state.rain_now_pct, state.rain_fc_pct,
+            state.track_temp_c, state.air_temp_c, state.weather, state.wet_share, state.pace_delta_wet_vs_inter_s,
+            state.your_delta_wet_vs_inter_s, state.safety_car_status,
+        )
+        fc_series = state.rain_fc_series or []
+        fc_key = tuple(fc_series)  # copy: the live state may update the list in place
+        now = time.monotonic()  # immune to wall-clock steps (NTP) that would prune the windows
+
+        # nothing new since the last tick (UDP idle, UI still polling) -> same result, skip the pipeline
+        sig = (
+            inter_share, delta_is, rain_now, rain_fc, track_temp, air_temp, weather, wet_share, delta_wi,
+            your_delta_wi, sc, fc_key,
+            track, current_tyre, laps_remaining, pit_loss_s, your_last_lap_s, id(db_rows),
+        )
+        if (
+                self._last_output is not None
+                and sig == self._last_sig
+                and (now - self._last_compute_t) < _REUSE_UNCHANGED_S
+        ):
+            return self._last_output
+
         p = self.p
+        # RainPitTuning is frozen -> the fusion weights only change when self.p is replaced
+        if p is not self._fuse_p:
+            self._fuse_wetness = _fuse_for(p)
+            self._fuse_p = p
+        # tuning values read on every update -> locals once (branch-only ones stay p.*)
+        cond_rain_now_on, cond_track_drop_cpm, cond_delta_is_on, cond_fc_ramp_3to5 = (
+            p.cond_rain_now_on, p.cond_track_drop_cpm, p.cond_delta_is_on, p.cond_fc_ramp_3to5,
+        )
 
         # --- Rolling inputs (state -> windows) ---
-        self._push(self._inter_share, now, getattr(state, "inter_share", None))
-        self._push(self._delta_is, now, getattr(state, "pace_delta_inter_vs_slick_s", None))
-
-        # rain: NOW + forecast
-        self._push(self._rain_now, now, getattr(state, "rain_now_pct", None))
-        self._push(self._rain_next, now, getattr(state, "rain_fc_pct", None))
-
-        # temps
-        self._push(self._track_temp, now, getattr(state, "track_temp_c", None))
-        self._push(self._air_temp, now, getattr(state, "air_temp_c", None))
-
-        # weather enum (0..5) as weak hint only
-        self._push(self._weather, now, getattr(state, "weather", None))
-
-        self._push(self._wet_share, now, getattr(state, "wet_share", None))
-        self._push(self._delta_wi, now, getattr(state, "pace_delta_wet_vs_inter_s", None))
+        # one row per tick, one cutoff; missing values are skipped. Each window still prunes only when
+        # its own signal reports, so a signal that drops out keeps its last samples (held median).
+        # rain: NOW + forecast; temps; weather enum (0..5) as weak hint only
+        cutoff = now - self.window_s
+        row = (inter_share, delta_is, rain_now, rain_fc, track_temp, air_temp, weather, wet_share, delta_wi)
+        for rm, v in zip(self._windows, row):
+            if v is not None:
+                rm.push(now, float(v), cutoff)
 
         # --- Medians (robust) ---
-        inter_share_med = _median([v for _, v in self._inter_share])
-        delta_is_med = _median([v for _, v in self._delta_is])  # I - S (sec); negative = inter faster
-        rain_next_med = _median([v for _, v in self._rain_next])  # 0..100
-        rain_now_med = _median([v for _, v in self._rain_now])  # 0..100
-        air_temp_med = _median([v for _, v in self._air_temp])  # °C
-        track_temp_med = _median([v for _, v in self._track_temp])  # °C
-        weather_med = _median([v for _, v in self._weather])
-        wet_share_med = _median([v for _, v in self._wet_share])
-        delta_wi_field_med = _median([v for _, v in self._delta_wi])  # W - I (sec); negative = wet faster
-
-        # Also learn W-I from YOUR reference deltas (more stable than field in some sessions)
-        your_delta_wi = getattr(state, "your_delta_wet_vs_inter_s", None)
-
-        # Combine: prefer field if present, otherwise your; if both, blend lightly
-        delta_wi_med = None
-        if delta_wi_field_med is not None and your_delta_wi is not None:
-            try:
-                delta_wi_med = 0.6 * float(delta_wi_field_med) + 0.4 * float(your_delta_wi)
-            except Exception:
-                delta_wi_med = float(delta_wi_field_med)
-        elif delta_wi_field_med is not None:
-            delta_wi_med = float(delta_wi_field_med)
-        elif your_delta_wi is not None:
+        inter_share_med = self._inter_share.median()
+        delta_is_med = self._delta_is.median()  # I - S (sec); negative = inter faster
+        rain_next_med = self._rain_next.median()  # 0..100
+        rain_now_med = self._rain_now.median()  # 0..100
+        air_temp_med = self._air_temp.median()  # °C
+        track_temp_med = self._track_temp.median()  # °C
+        weather_med = self._weather.median()
+        wet_share_med = self._wet_share.median()
+        delta_wi_field_med = self._delta_wi.median()  # W - I (sec); negative = wet faster
+
+        # Also learn W-I from YOUR reference deltas (your_delta_wi; more stable than field in some sessions)
+        # Combine: prefer field if present, otherwise your; if both, blend lightly (0.6 / 0.4)
+        if your_delta_wi is None:
+            delta_wi_med = delta_wi_field_med
+        elif delta_wi_field_med is None:
             delta_wi_med = float(your_delta_wi)
+        else:
+            delta_wi_med = 0.6 * delta_wi_field_med + 0.4 * float(your_delta_wi)
 
         track_slope_cpm = self._slope_c_per_min(self._track_temp, window_s=90.0)  # °C/min
         air_slope_cpm = self._slope_c_per_min(self._air_temp, window_s=120.0)  # °C/min
@@ -207,9 +482,16 @@ class RainEngine:
         # --- Forecast-derived features (ausgelagert) ---
         next_lap_min_int = estimate_next_lap_minute(your_last_lap_s=your_last_lap_s)
 
-        # Classic horizons + NextLap
-        mins = sorted(set([next_lap_min_int, 3, 5, 10, 15, 20]))
-        fc_at = fc_window_stats(fc_series, mins)
+        # Classic horizons + NextLap (forecast changes ~1 Hz, update runs 10-20 Hz -> reuse while unchanged)
+        cached_key, cached_fc = self._fc_cache
+        if cached_key is not None and cached_key == (fc_key, next_lap_min_int):
+            fc_at, t_dry, t_heavy = cached_fc
+        else:
+            mins = sorted(set([next_lap_min_int, 3, 5, 10, 15, 20]))
+            fc_at = fc_window_stats(fc_series, mins)
+            t_dry = fc_time_to_below(fc_series, threshold=25)
+            t_heavy = fc_time_to_above(fc_series, threshold=60)
+            self._fc_cache = ((fc_key, next_lap_min_int), (fc_at, t_dry, t_heavy))
 
         rain_nl = fc_at.get(next_lap_min_int)
         rain_3 = fc_at.get(3)
@@ -222,10 +504,7 @@ class RainEngine:
         rain_soon = rain_nl if rain_nl is not None else rain_3
 
         # drying/heavy flags
-        t_dry = fc_time_to_below(fc_series, threshold=25)
         drying_soon = (t_dry is not None and t_dry <= 15)
-
-        t_heavy = fc_time_to_above(fc_series, threshold=60)
         heavy_incoming = (t_heavy is not None and t_heavy <= 10)
 
         # --- Baseline: expected slick pace (minimal) ---
@@ -235,171 +514,62 @@ class RainEngine:
 
         baseline_loss = None
         if expected_pace is not None and your_last_lap_s is not None:
-            baseline_loss = float(your_last_lap_s) - float(expected_pace)
-
-        # --- Scoring (wie vorher, nur hier zentral) ---
-        s0 = None
-        if weather_med is not None:
-            w = int(weather_med)
-            # 0 clear, 1 light cloud, 2 overcast, 3 light rain, 4 heavy rain, 5 storm
-            if w <= 2:
-                s0 = 0.0
-            elif w == 3:
-                s0 = 0.25
-            elif w == 4:
-                s0 = 0.55
-            else:
-                s0 = 0.75
-
-        s_now = None
-        if rain_now_med is not None:
-            s_now = _clamp01((float(rain_now_med) - p.rain_now_map_lo) / p.rain_now_map_span)
-
-        s_temp = None
-        if track_slope_cpm is not None:
-            wet_from_track = _clamp01(((-track_slope_cpm) - 0.20) / 0.80)
-            dry_from_track = _clamp01((track_slope_cpm - 0.20) / 0.80)
-            s_temp = _clamp01(wet_from_track - 0.60 * dry_from_track + 0.50)
-
-        if s_temp is None and air_slope_cpm is not None:
-            wet_from_air = _clamp01(((-air_slope_cpm) - 0.10) / 0.60)
-            dry_from_air = _clamp01((air_slope_cpm - 0.10) / 0.60)
-            s_temp = _clamp01(wet_from_air - 0.50 * dry_from_air + 0.50)
-
-        s1 = None
-        if inter_share_med is not None:
-            s1 = _clamp01((inter_share_med - 0.15) / 0.35)
-
-        s2 = None
-        if delta_is_med is not None:
-            s2 = _clamp01(((-delta_is_med) - 0.5) / 2.0)
-
-        s3 = None
-        if rain_next_med is not None:
-            s3 = _clamp01((rain_next_med - 35.0) / 35.0)
-
-        s4 = None
-        if baseline_loss is not None:
-            s4 = _clamp01((baseline_loss - 0.7) / 2.0)
-
-        temp_boost = 0.0
-        if track_temp_med is not None:
-            temp_boost = _clamp01((p.cold_track_ref_c - track_temp_med) / p.cold_track_span_c) * p.cold_track_boost_max
-
-        parts: list[float] = []
-        weights: list[float] = []
-
-        def add(sig: Optional[float], w: float):
-            if sig is None:
-                return
-            parts.append(float(sig))
-            weights.append(float(w))
-
-        add(s0, p.w_weather_enum)
-        add(s_now, p.w_rain_now)
-        add(s_temp, p.w_temp_trend)
-        add(s2, p.w_delta_is)
-        add(s1, p.w_inter_share)
-        add(s3, p.w_forecast)
-        add(s4, p.w_baseline_loss)
-
-        if parts and weights:
-            wsum = sum(weights)
-            wetness = sum(v * w for v, w in zip(parts, weights)) / max(1e-9, wsum)
-        else:
-            wetness = 0.0
-
-        wetness = _clamp01(wetness + temp_boost)
-
-        # hard floor by "actual rain now" (HUD/telemetry)
-        if s_now is not None:
-            wetness = max(wetness, float(s_now) * p.rain_now_floor_factor)
-
-        # --- Separate "full wet" score (Inter -> Wet) ---
-        fw0 = None
-        if weather_med is not None:
-            w = int(weather_med)
-            if w <= 3:
-                fw0 = 0.0
-            elif w == 4:
-                fw0 = 0.75
-            else:
-                fw0 = 0.95
-
-        fw1 = None
-        if wet_share_med is not None:
-            fw1 = _clamp01((wet_share_med - 0.05) / 0.25)
-
-        fw2 = None
-        if delta_wi_med is not None:
-            fw2 = _clamp01(((-delta_wi_med) - 0.20) / 1.30)
-
-        fw3 = None
-        if rain_next_med is not None:
-            fw3 = _clamp01((rain_next_med - 60.0) / 30.0)
-
-        fw_parts, fw_weights = [], []
-
-        def fw_add(sig: Optional[float], w: float):
-            if sig is None:
-                return
-            fw_parts.append(float(sig))
-            fw_weights.append(float(w))
-
-        fw_add(fw0, 0.35)
-        fw_add(fw2, 0.35)
-        fw_add(fw1, 0.25)
-        fw_add(fw3, 0.20)
-
-        if fw_parts and fw_weights:
-            fw_wsum = sum(fw_weights)
-            fullwet = sum(v * w for v, w in zip(fw_parts, fw_weights)) / max(1e-9, fw_wsum)
-        else:
-            fullwet = 0.0
-
-        if fw0 is not None:
-            fullwet = max(fullwet, float(fw0) * 0.85)
-        fullwet = _clamp01(fullwet)
-
-        if heavy_incoming:
-            fullwet = min(1.0, fullwet + 0.10)
-
-        wet_score = fullwet
+            baseline_loss = float(your_last_lap_s) - expected_pace
+
+        # --- Scoring (wie vorher, nur hier zentral; pure math in _fuse, missing = NaN) ---
+        wetness = self._fuse_wetness(
+            _NAN if weather_med is None else weather_med,
+            _NAN if rain_now_med is None else rain_now_med,
+            _NAN if track_slope_cpm is None else track_slope_cpm,
+            _NAN if air_slope_cpm is None else air_slope_cpm,
+            _NAN if inter_share_med is None else inter_share_med,
+            _NAN if delta_is_med is None else delta_is_med,
+            _NAN if rain_next_med is None else rain_next_med,
+            _NAN if baseline_loss is None else baseline_loss,
+            _NAN if track_temp_med is None else track_temp_med,
+        )
 
         # Confidence: more signals + enough samples -> higher confidence
-        n_signals = sum(x is not None for x in (s1, s2, s3, s4))
+        n_signals = (
+                (inter_share_med is not None) + (delta_is_med is not None)
+                + (rain_next_med is not None) + (baseline_loss is not None)
+        )
         n_samples = len(self._rain_next) + len(self._delta_is) + len(self._inter_share)
         conf = _clamp01(0.15 + 0.20 * n_signals + 0.15 * _clamp01(n_samples / (self.min_samples * 3)))
 
         # SC/VSC: allow earlier pit call
-        sc = getattr(state, "safety_car_status", None)
         under_sc = sc in (1, 2)
         if under_sc:
             wetness = _clamp01(wetness + 0.06)
             conf = _clamp01(conf + 0.05)
 
         # --- Conditions Shift detector ---
-        cond_shift = False
-        cond_reason = []
-
-        if rain_now_med is not None and rain_now_med >= p.cond_rain_now_on:
-            cond_shift = True
-            cond_reason.append(f"rain_now>={p.cond_rain_now_on:g}")
-
-        if track_slope_cpm is not None and track_slope_cpm <= p.cond_track_drop_cpm:
-            cond_shift = True
-            cond_reason.append("trackTemp_drop")
-
-        if delta_is_med is not None and delta_is_med <= p.cond_delta_is_on:
-            cond_shift = True
-            cond_reason.append(f"ΔIS<={p.cond_delta_is_on:g}")
+        trig = (
+            rain_now_med is not None and rain_now_med >= cond_rain_now_on,
+            track_slope_cpm is not None and track_slope_cpm <= cond_track_drop_cpm,
+            delta_is_med is not None and delta_is_med <= cond_delta_is_on,
+            rain_3 is not None and rain_5 is not None and (rain_5 - rain_3) >= cond_fc_ramp_3to5,
+        )
+        cond_shift = any(trig)
 
-        if rain_3 is not None and rain_5 is not None and (rain_5 - rain_3) >= p.cond_fc_ramp_3to5:
-            cond_shift = True
-            cond_reason.append("fc_ramp_3to5")
+        # reason text only changes with the triggers (or the thresholds it prints) -> rebuild only then
+        reason_key = (trig, cond_rain_now_on, cond_delta_is_on)
+        if reason_key == self._cond_reason_key:
+            cond_reason_txt = self._cond_reason_txt
+        else:
+            cond_reason = []
+            if trig[0]:
+                cond_reason.append(f"rain_now>={cond_rain_now_on:g}")
+            if trig[1]:
+                cond_reason.append("trackTemp_drop")
+            if trig[2]:
+                cond_reason.append(f"ΔIS<={cond_delta_is_on:g}")
+            if trig[3]:
+                cond_reason.append("fc_ramp_3to5")
+            cond_reason_txt = ",".join(cond_reason) if cond_reason else "-"
+            self._cond_reason_key, self._cond_reason_txt = reason_key, cond_reason_txt
 
         cond_shift_txt = "COND_SHIFT" if cond_shift else "stable"
-        cond_reason_txt = ",".join(cond_reason) if cond_reason else "-"
 
         # shift boost
         shift_boost = 0.0
@@ -428,12 +598,25 @@ class RainEngine:
         if self._is_wet_mode and self._off_counter >= self.hold_off_updates:
             self._is_wet_mode = False
 
+        # Full-wet score: only read by the full-wet hysteresis (wet mode) and the Inter/Wet tyre advice
+        # -> on slicks in dry mode (the common dry case) it is not computed at all
+        tyre = (current_tyre or "").strip().upper()
+        wet_score = None
+        if self._is_wet_mode or "INTER" in tyre or "WET" in tyre:
+            wet_score = _fullwet_score(
+                _NAN if weather_med is None else weather_med,
+                _NAN if delta_wi_med is None else delta_wi_med,
+                _NAN if wet_share_med is None else wet_share_med,
+                _NAN if rain_next_med is None else rain_next_med,
+                heavy_incoming,
+            )
+
         # --- Hysteresis: full wet mode ---
         if self._is_wet_mode:
-            if fullwet >= self.wet_on_th:
+            if wet_score >= self.wet_on_th:
                 self._wet_on_counter += 1
                 self._wet_off_counter = 0
-            elif fullwet <= self.wet_off_th:
+            elif wet_score <= self.wet_off_th:
                 self._wet_off_counter += 1
                 self._wet_on_counter = 0
             else:
@@ -450,27 +633,19 @@ class RainEngine:
             self._wet_off_counter = 0
 
         # --- Advice (unveraendert inhaltlich, nur lokal) ---
-        tyre = (current_tyre or "").strip().upper()
         lr = max(0, int(laps_remaining))
 
-        def stay(reason: str) -> RainPitAdvice:
-            return RainPitAdvice("STAY OUT", None, None, reason)
-
-        def box_in(n: int, target: str, reason: str) -> RainPitAdvice:
-            n = max(1, int(n))
-            return RainPitAdvice(f"BOX IN {n}", target, n, reason)
-
         if lr <= 1:
-            advice = stay("≤1 lap remaining.")
+            advice = self._stay("≤1 lap remaining.")
         else:
             is_slick = tyre.startswith("C") or tyre in ("SLICK", "DRY")
             is_inter = ("INTER" in tyre) or (tyre == "INTERMEDIATE") or (tyre == "INTER")
             is_wet = ("WET" in tyre)
 
             if is_slick:
-                track_slope_cpm2 = self._slope_c_per_min(self._track_temp, window_s=90.0)
-                track_falling_fast = (track_slope_cpm2 is not None and track_slope_cpm2 <= p.cond_track_drop_cpm)
-                track_rising_fast = (track_slope_cpm2 is not None and track_slope_cpm2 >= p.slick_hold_warming_cpm)
+                # same window as track_slope_cpm above (no new samples since) -> reuse it
+                track_falling_fast = (track_slope_cpm is not None and track_slope_cpm <= cond_track_drop_cpm)
+                track_rising_fast = (track_slope_cpm is not None and track_slope_cpm >= p.slick_hold_warming_cpm)
 
                 w_enum = int(weather_med) if weather_med is not None else None
 
@@ -491,9 +666,9 @@ class RainEngine:
 
                 if not self._is_wet_mode:
                     if cond_shift2:
-                        advice = stay(f"Conditions shifting ({cond_reason2_txt}) → Inter likely soon.")
+                        advice = self._stay(f"Conditions shifting ({cond_reason2_txt}) → Inter likely soon.")
                     else:
-                        advice = stay("On Slick: wetness not high enough for Inter yet.")
+                        advice = self._stay("On Slick: wetness not high enough for Inter yet.")
                 else:
                     if (
                             track_rising_fast
@@ -502,61 +677,61 @@ class RainEngine:
                             and laps_remaining > 3
                             and (delta_is_med is None or delta_is_med > -0.8)
                     ):
-                        advice = stay("Track warming again → try to stay out on slick.")
+                        advice = self._stay("Track warming again → try to stay out on slick.")
                     else:
                         hard_weather = (w_enum is not None and w_enum >= p.slick_hard_weather_enum)
                         hard_wetness = (wetness >= p.slick_hard_wetness)
 
                         if hard_weather or hard_wetness or cond_shift2:
-                            advice = box_in(1, "Intermediate", f"Slicks unsafe: COND_SHIFT({cond_reason2_txt})")
+                            advice = self._box_in(1, "Intermediate", f"Slicks unsafe: COND_SHIFT({cond_reason2_txt})")
                         else:
                             if delta_is_med is not None and delta_is_med < p.slick_delta_is_box:
-                                advice = box_in(1, "Intermediate", "Δpace(I-S): Inter faster.")
+                                advice = self._box_in(1, "Intermediate", "Δpace(I-S): Inter faster.")
                             else:
                                 n = 1 if wetness > 0.80 else 2
                                 if under_sc:
                                     n = 1
-                                advice = box_in(n, "Intermediate", "Wetness trend suggests Inter.")
+                                advice = self._box_in(n, "Intermediate", "Wetness trend suggests Inter.")
             else:
                 if is_inter and self._is_fullwet_mode:
-                    if delta_wi_med is not None and float(delta_wi_med) < -p.wi_delta_min:
-                        wet_gain_per_lap = max(0.0, -float(delta_wi_med))
+                    if delta_wi_med is not None and delta_wi_med < -p.wi_delta_min:
+                        wet_gain_per_lap = max(0.0, -delta_wi_med)
                         buffer_laps = 0 if under_sc else 1
                         laps_to_payback = int((pit_loss_s / max(p.wi_payback_min_gain, wet_gain_per_lap)) + 0.999)
                         if laps_remaining >= (laps_to_payback + buffer_laps + 1):
                             n = 1 if under_sc or wet_gain_per_lap >= p.wi_fast_gain else 2
-                            advice = box_in(n, "Wet",
+                            advice = self._box_in(n, "Wet",
                                             f"Wet faster by ~{wet_gain_per_lap:.2f}s/lap → payback ~{laps_to_payback} lap(s).")
                         else:
-                            advice = stay("Wet faster, but not enough laps left to pay back a stop.")
+                            advice = self._stay("Wet faster, but not enough laps left to pay back a stop.")
                     else:
                         n = 1 if wet_score > 0.88 else 2
                         if under_sc:
                             n = 1
-                        advice = box_in(n, "Wet", "Rain intensity suggests switching to Full Wet.")
+                        advice = self._box_in(n, "Wet", "Rain intensity suggests switching to Full Wet.")
                 elif is_wet and (not self._is_fullwet_mode) and self._is_wet_mode:
-                    if delta_wi_med is not None and float(delta_wi_med) > p.wi_delta_min:
-                        inter_gain_per_lap = max(0.0, float(delta_wi_med))
+                    if delta_wi_med is not None and delta_wi_med > p.wi_delta_min:
+                        inter_gain_per_lap = max(0.0, delta_wi_med)
                         buffer_laps = 0 if under_sc else 1
                         laps_to_payback = int((pit_loss_s / max(p.wi_payback_min_gain, inter_gain_per_lap)) + 0.999)
                         if laps_remaining >= (laps_to_payback + buffer_laps + 1):
                             n = 1 if under_sc or inter_gain_per_lap >= p.wi_fast_gain else 2
-                            advice = box_in(n, "Intermediate",
+                            advice = self._box_in(n, "Intermediate",
                                             f"Inter faster by ~{inter_gain_per_lap:.2f}s/lap → payback ~{laps_to_payback} lap(s).")
                         else:
-                            advice = stay("Inter faster, but not enough laps left to pay back a stop.")
+                            advice = self._stay("Inter faster, but not enough laps left to pay back a stop.")
                     else:
                         drying_now = (wet_score <= 0.72 and conf >= p.dry_temp_conf_min)
                         forecast_dry = False
                         if rain_3 is not None and rain_5 is not None:
                             forecast_dry = (rain_3 < p.fc_dry_3 and rain_5 < p.fc_dry_5)
                         elif rain_next_med is not None:
-                            forecast_dry = (rain_next_med < float(p.fc_dry_5))
+                            forecast_dry = (rain_next_med < p.fc_dry_5)
                         if drying_now and (forecast_dry or under_sc):
                             n = 1 if under_sc else 2
-                            advice = box_in(n, "Intermediate", "Drying trend + forecast: switch Wet → Inter.")
+                            advice = self._box_in(n, "Intermediate", "Drying trend + forecast: switch Wet → Inter.")
                         else:
-                            advice = stay("On Wet: signals not strong enough to go back to Inter yet.")
+                            advice = self._stay("On Wet: signals not strong enough to go back to Inter yet.")
                 else:
                     hard_dry_exit = (
                             wetness <= 0.20
@@ -570,7 +745,7 @@ class RainEngine:
                             hard_dry_exit = True
 
                     if hard_dry_exit:
-                        advice = box_in(1, "C4", "Track dry: Inter no longer justified.")
+                        advice = self._box_in(1, "C4", "Track dry: Inter no longer justified.")
                     else:
                         w_enum = int(weather_med) if weather_med is not None else None
                         track_warming = (track_slope_cpm is not None and track_slope_cpm >= p.dry_track_warming_cpm)
@@ -594,24 +769,24 @@ class RainEngine:
                         if (hard_dry or (not self._is_wet_mode)) and not (w_enum is not None and w_enum >= 3):
                             if fc_dry and (track_warming or drying_soon) and wetness < 0.60 and low_inter_share:
                                 n = 1
-                                advice = box_in(n, "C4",
+                                advice = self._box_in(n, "C4",
                                                 "Drying confirmed: forecast low + track warming + low I/W share.")
                             elif fc_dry and wetness < 0.72 and (track_warming_fast or low_inter_share):
                                 n = 1 if under_sc else 2
-                                advice = box_in(n, "C4", "Drying trend: slick soon (moderate confidence).")
+                                advice = self._box_in(n, "C4", "Drying trend: slick soon (moderate confidence).")
                             else:
-                                advice = stay("Drying not confirmed enough for slick yet.")
+                                advice = self._stay("Drying not confirmed enough for slick yet.")
                         else:
                             if is_wet:
-                                advice = stay("Stay on Wet: wet-mode still active.")
+                                advice = self._stay("Stay on Wet: wet-mode still active.")
                             else:
-                                advice = stay("Stay on Inter: wet-mode still active.")
+                                advice = self._stay("Stay on Inter: wet-mode still active.")
 
                 if drying_soon and (not under_sc) and lr > 3 and (advice.target_tyre in (None, "Intermediate", "Wet")):
-                    advice = stay("Forecast: drying soon → avoid unnecessary tyre refresh.")
+                    advice = self._stay("Forecast: drying soon → avoid unnecessary tyre refresh.")
 
                 if is_slick and self._is_wet_mode and drying_soon and (wetness < 0.80) and (not under_sc):
-                    advice = stay("Forecast: rain phase short → try to stay out on slick.")
+                    advice = self._stay("Forecast: rain phase short → try to stay out on slick.")
 
         # --- Wet <-> Inter lockout (anti flip-flop) ---
         if advice.action.startswith("BOX") and advice.target_tyre:
@@ -627,7 +802,7 @@ class RainEngine:
                 emergency = False
                 try:
                     emergency = (
-                            (delta_wi_med is not None and abs(float(delta_wi_med)) >= 0.90)
+                            (delta_wi_med is not None and abs(delta_wi_med) >= 0.90)
                             or wet_score >= 0.97
                             or wet_score <= 0.25
                     )
@@ -636,9 +811,9 @@ class RainEngine:
 
                 if (now < self._wi_lockout_until) and (not emergency):
                     remaining = int(self._wi_lockout_until - now)
-                    advice = stay(f"Lockout active ({remaining}s) to avoid Wet↔Inter flip-flop.")
+                    advice = self._stay(f"Lockout active ({remaining}s) to avoid Wet↔Inter flip-flop.")
                 else:
-                    lap_s = float(expected_pace) if expected_pace is not None else 85.0
+                    lap_s = expected_pace if expected_pace is not None else 85.0
                     if cur == "WET" and tgt == "INTERMEDIATE":
                         lock_laps = self.lockout_laps_wet_to_inter
                     elif cur == "INTERMEDIATE" and tgt == "WET":
@@ -646,13 +821,14 @@ class RainEngine:
                     else:
                         lock_laps = 1.0
 
-                    dur = max(45.0, float(lock_laps) * lap_s)
+                    dur = max(45.0, lock_laps * lap_s)
                     self._wi_lockout_until = now + dur
                     self._wi_last_target = tgt
 
         dbg = (
             f"wetness={wetness:.2f} conf={conf:.2f} mode={'INTER' if self._is_wet_mode else 'DRY'} "
-            f"fullwet={'ON' if self._is_fullwet_mode else 'OFF'} wetScore={wet_score:.2f} | "
+            f"fullwet={'ON' if self._is_fullwet_mode else 'OFF'} "
+            f"wetScore={'-' if wet_score is None else format(wet_score, '.2f')} | "
             f"share(I+W)={None if inter_share_med is None else round(inter_share_med, 3)} "
             f"share(W)={None if wet_share_med is None else round(wet_share_med, 3)} "
             f"ΔI-S={None if delta_is_med is None else round(delta_is_med, 2)} "
@@ -666,7 +842,21 @@ class RainEngine:
             f" lockoutUntil={int(self._wi_lockout_until - now) if now < self._wi_lockout_until else 0}s"
         )
 
-        return RainEngineOutput(advice=advice, wetness=wetness, confidence=conf, debug=dbg)
+        out = self._out
+        out.advice, out.wetness, out.confidence, out.debug = advice, wetness, conf, dbg
+        self._last_sig, self._last_output, self._last_compute_t = sig, out, now
+        return out
+
+    def _stay(self, reason: str) -> RainPitAdvice:
+        ad = self._out.advice
+        ad.action, ad.target_tyre, ad.laps_until, ad.reason = "STAY OUT", None, None, reason
+        return ad
+
+    def _box_in(self, n: int, target: str, reason: str) -> RainPitAdvice:
+        n = max(1, int(n))
+        ad = self._out.advice
+        ad.action, ad.target_tyre, ad.laps_until, ad.reason = f"BOX IN {n}", target, n, reason
+        return ad
 
     def _expected_pace_from_rows(self, track: str, tyre: str, rows: list) -> Optional[float]:
         """
@@ -674,7 +864,7 @@ class RainEngine:
         (created_at, session, track, tyre, weather, lap_time_s, fuel_load, wear_fl, wear_fr, wear_rl, wear_rr)
         """
         key = (track.strip(), tyre.strip().upper())
-        now = time.time()
+        now = time.monotonic()
         cached = self._baseline_cache.get(key)
         if cached and (now - cached[0]) < 10.0:
             return cached[1]
@@ -3,15 +3,80 @@ from __future__ import annotations
 
 import csv
 import io
+import locale
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 import pandas as pd
 
+# Optional: PyArrow's multithreaded CSV reader for the telemetry block (not in requirements.txt).
+# Without it, pandas.read_csv is used as before.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# same default text encoding as open() without an explicit encoding
+_ENCODING = locale.getpreferredencoding(False)
+
+# read_csv's default na_values (pandas 2.3): cells read as NaN, compared unstripped like pandas does
+_NA_VALUES = frozenset((
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+))
+
+# line ends as text mode (universal newlines) sees them: \r\n, \n and a lone \r
+_EOL = re.compile(rb"\r\n|\r|\n")
+_EOL_STR = re.compile(r"\r\n|\r|\n")
+
+
+def _iter_raw_lines(f, block: int = 8192):
+    """Raw lines (with their line end) of a binary file; \r\n, \n and a lone \r all end a line."""
+    buf = b""
+    while True:
+        chunk = f.read(block)
+        if not chunk:
+            if buf:
+                yield buf
+            return
+        buf += chunk
+        start = 0
+        for m in _EOL.finditer(buf):
+            if m.end() == len(buf) and m.group() == b"\r":
+                break  # may be the first half of \r\n -> decide with the next chunk
+            yield buf[start:m.end()]
+            start = m.end()
+        buf = buf[start:]
+
+
+def _rfind_eol(data: bytes, lo: int, hi: int) -> int:
+    """Index of the last line-end byte (\n or \r) in data[lo:hi], -1 if there is none."""
+    return max(data.rfind(b"\n", lo, hi), data.rfind(b"\r", lo, hi))
+
+
+def _find_eol(data: bytes, pos: int) -> int:
+    """Index of the first line-end byte (\n or \r) at/after pos, len(data) if there is none."""
+    m = _EOL.search(data, pos)
+    return m.start() if m else len(data)
+
 
 def _parse_two_line_block(header_line: str, data_line: str) -> Dict[str, str]:
-    header = next(csv.reader([header_line]))
-    data = next(csv.reader([data_line]))
+    if '"' not in header_line and '"' not in data_line:
+        # plain key/value lines (the usual case): no quoting -> str.split is enough
+        header = header_line.split(",") if header_line else []
+        data = data_line.split(",") if data_line else []
+    else:
+        # one reader for both lines; an unterminated quote would swallow the data line -> per-line parse
+        rows = list(csv.reader([header_line, data_line]))
+        if len(rows) == 2:
+            header, data = rows
+        else:
+            header = next(csv.reader([header_line]))
+            data = next(csv.reader([data_line]))
     if len(data) < len(header):
         data += [""] * (len(header) - len(data))
     return {h.strip(): d.strip() for h, d in zip(header, data)}
@@ -27,7 +92,11 @@ class OvertakeCSVError(ValueError):
         self.path = Path(path)
         self.block = str(block)
         self.reason = str(reason)
-        super().__init__(f"{self.path.name} | block={self.block} | {self.reason}")
+        # raw args only; message built in __str__
+        super().__init__(path, block, reason)
+
+    def __str__(self) -> str:
+        return f"{self.path.name} | block={self.block} | {self.reason}"
 
 
 def _safe_csv_row(line: str) -> list[str]:
@@ -37,74 +106,160 @@ def _safe_csv_row(line: str) -> list[str]:
         return []
 
 
-def _safe_parse_two_line_block(lines: list[str], header_i: int, data_i: int, *, path: Path, block: str) -> Dict[
-    str, str]:
+def _parse_meta_blocks(lines: list[str], specs: tuple, *, path: Path) -> tuple[Dict[str, str], ...]:
     """
-    Try parsing a (header,data) block.
-    If indices are missing -> return {} (block missing is tolerated).
+    Try parsing the (header,data) blocks given as (header_i, data_i, block) specs, one dict per spec.
+    If indices are missing -> {} (block missing is tolerated).
     If present but malformed -> raise OvertakeCSVError with details.
     """
-    if header_i >= len(lines) or data_i >= len(lines):
-        return {}
+    n = len(lines)
+    out = []
+    for header_i, data_i, block in specs:
+        if header_i >= n or data_i >= n:
+            out.append({})
+            continue
 
-    header_line = lines[header_i].strip()
-    data_line = lines[data_i].strip()
+        header_line = lines[header_i].strip()
+        data_line = lines[data_i].strip()
 
-    # Empty lines -> treat as missing block
-    if not header_line and not data_line:
-        return {}
+        # Empty lines -> treat as missing block
+        # If one of those looks like telemetry header, don't treat as block
+        if (not header_line and not data_line) \
+                or header_line.startswith("LapDistance") or data_line.startswith("LapDistance"):
+            out.append({})
+            continue
 
-    # If one of those looks like telemetry header, don't treat as block
-    if header_line.startswith("LapDistance") or data_line.startswith("LapDistance"):
-        return {}
+        try:
+            out.append(_parse_two_line_block(header_line, data_line))
+        except Exception as e:
+            raise OvertakeCSVError(path, block,
+                                   f"Malformed 2-line block at lines {header_i + 1}/{data_i + 1}: {type(e).__name__}: {e}")
+    return tuple(out)
 
-    try:
-        return _parse_two_line_block(header_line, data_line)
-    except Exception as e:
-        raise OvertakeCSVError(path, block,
-                               f"Malformed 2-line block at lines {header_i + 1}/{data_i + 1}: {type(e).__name__}: {e}")
+
+# (header_i, data_i, block) of the meta blocks, see _parse_meta
+_META_BLOCKS = ((1, 2, "game"), (3, 4, "track"), (5, 6, "setup"))
 
 
-def _find_telemetry_start(lines: list[str]) -> int | None:
+def _is_telemetry_header(raw: str) -> bool:
     """
-    Find the telemetry header start line.
+    True for the telemetry header line.
     Robust against leading spaces/BOM and minor formatting.
     """
-    for i, raw in enumerate(lines):
-        l = (raw or "").lstrip("\ufeff").strip()
-        # strict: standard header begins with LapDistance
-        if l.startswith("LapDistance"):
-            return i
-        # fallback: sometimes there's whitespace before it
-        if "LapDistance" in l and l.split(",")[0].strip() == "LapDistance":
-            return i
-    return None
+    l = (raw or "").lstrip("\ufeff").strip()
+    # strict: standard header begins with LapDistance
+    if l.startswith("LapDistance"):
+        return True
+    # fallback: sometimes there's whitespace before it
+    return "LapDistance" in l and l.split(",")[0].strip() == "LapDistance"
 
 
-def parse_overtake_csv(path: Path) -> Dict[str, Any]:
-    """
-    Parse the Overtake Telemetry Tool CSV format (multi-block).
-    Returns dict with: player, game, track, setup, telemetry (DataFrame)
+def _find_telemetry_header(data: bytes) -> int:
+    """Offset of the first telemetry header line in data, -1 if there is none."""
+    pos = data.find(b"LapDistance")
+    while pos >= 0:
+        line_start = _rfind_eol(data, 0, pos) + 1
+        line_end = _find_eol(data, pos)
+        if _is_telemetry_header(data[line_start:line_end].decode(_ENCODING, errors="replace")):
+            return line_start
+        pos = data.find(b"LapDistance", line_end)
+    return -1
 
-    Robustness goals:
-    - tolerate missing/empty meta blocks
-    - give better errors: file + block + reason
-    - handle minor header formatting differences
+
+# meta blocks live in lines 0..6 (player, game, track, setup), see parse_overtake_csv
+_META_LINES = 7
+
+
+def _read_telemetry(f, offset: int, header: list[str], usecols: frozenset | None = None) -> pd.DataFrame:
     """
+    Telemetry block -> DataFrame; PyArrow if available, else pandas.
+    f: binary file, read from offset (start of the header line) straight by the reader,
+    no Python-side copy or decode of the block.
+    header: the parsed header line (column names for usecols).
+    usecols: only these columns are converted (others are skipped by the tokenizer); None = all.
+    """
+    if pacsv is not None:
+        # pyarrow wants existing names (missing ones would come back as null columns)
+        include = [c for c in header if c in usecols] if usecols is not None else []
+        f.seek(offset)
+        try:
+            table = pacsv.read_csv(
+                f,
+                read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20, encoding=_ENCODING),
+                convert_options=pacsv.ConvertOptions(
+                    null_values=list(_NA_VALUES), strings_can_be_null=True, include_columns=include,
+                ),
+            )
+        except (pa.ArrowException, UnicodeError):
+            table = None  # e.g. header-only block without trailing newline, bad encoding -> pandas below
+        # undecodable text comes back as binary columns -> pandas below (replacement chars, as before)
+        if table is not None and not any(pa.types.is_binary(t) for t in table.schema.types):
+            # all-empty columns are inferred as null type (-> None in pandas); pandas gives float NaN
+            for i, field in enumerate(table.schema):
+                if pa.types.is_null(field.type):
+                    table = table.set_column(i, field.name, pa.nulls(table.num_rows, pa.float64()))
+            return table.to_pandas(self_destruct=True)
+    cols = (lambda c: c in usecols) if usecols is not None else None
+    f.seek(offset)
+    eol = _EOL.search(f.read(65536))
+    f.seek(offset)
+    if eol is not None and eol.group() == b"\r":
+        # lone-CR line ends: pandas' C tokenizer can return the header again as a data row
+        # -> universal-newline text, as the text-mode read did before
+        text = io.TextIOWrapper(f, encoding=_ENCODING, errors="replace", newline=None)
+        try:
+            return pd.read_csv(text, usecols=cols)
+        finally:
+            text.detach()  # f stays open for the caller
+    return pd.read_csv(f, encoding=_ENCODING, encoding_errors="replace", usecols=cols)
+
+
+def _read_head(path: Path) -> tuple[list[str], int, int]:
+    """
+    Read line by line only until the telemetry header and the meta lines are in hand;
+    only these head lines are decoded.
+    Returns (head lines, telemetry header index, byte offset of the header line).
+    """
+    start_idx = None
+    header_offset = 0
+    lines: list[str] = []
     try:
-        text = path.read_text(errors="replace")
+        with path.open("rb") as f:
+            pos = 0
+            for raw in _iter_raw_lines(f):
+                line = raw.decode(_ENCODING, errors="replace").rstrip("\r\n")
+                lines.append(line)
+                if start_idx is None and "LapDistance" in line and _is_telemetry_header(line):
+                    start_idx = len(lines) - 1
+                    header_offset = pos
+                pos += len(raw)
+                if len(lines) >= _META_LINES:
+                    break
+            if start_idx is None:
+                # header not within the meta lines (rare): substring search on the rest, no per-line loop
+                f.seek(pos)  # _iter_raw_lines reads ahead in blocks
+                rest = f.read()
+                found = _find_telemetry_header(rest)
+                if found >= 0:
+                    head = rest[:_find_eol(rest, found)].decode(_ENCODING, errors="replace")
+                    lines.extend(_EOL_STR.split(head))
+                    start_idx = len(lines) - 1
+                    header_offset = pos + found
     except Exception as e:
         raise OvertakeCSVError(path, "file", f"Cannot read file: {type(e).__name__}: {e}")
 
-    lines = text.splitlines()
     if len(lines) < 3:
         raise OvertakeCSVError(path, "file", f"CSV too short (lines={len(lines)})")
 
     # --- Telemetry start index (required) ---
-    start_idx = _find_telemetry_start(lines)
     if start_idx is None:
         raise OvertakeCSVError(path, "telemetry", "Telemetry header 'LapDistance' not found")
 
+    return lines, start_idx, header_offset
+
+
+def _parse_meta(lines: list[str], path: Path) -> tuple[Dict[str, Any], Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """Player line + game/track/setup blocks from the head lines."""
     # --- Player line (best-effort, optional) ---
     player_row = _safe_csv_row(lines[0]) if lines else []
     player = {
@@ -118,16 +273,47 @@ def parse_overtake_csv(path: Path) -> Dict[str, Any]:
     # --- Meta blocks: best-effort (do NOT hard fail if missing) ---
     # Typical layout: [0]=player, (1,2)=game, (3,4)=track, (5,6)=setup
     # If those lines overlap with telemetry start or are missing, block becomes {}.
-    game = _safe_parse_two_line_block(lines, 1, 2, path=path, block="game")
-    track = _safe_parse_two_line_block(lines, 3, 4, path=path, block="track")
-    setup = _safe_parse_two_line_block(lines, 5, 6, path=path, block="setup")
+    game, track, setup = _parse_meta_blocks(lines, _META_BLOCKS, path=path)
+    return player, game, track, setup
+
+
+def parse_overtake_csv(path: Path, columns: Sequence[str] | None = None) -> Dict[str, Any]:
+    """
+    Parse the Overtake Telemetry Tool CSV format (multi-block).
+    Returns dict with: player, game, track, setup, telemetry (DataFrame)
+    columns: restrict the telemetry DataFrame to these columns (e.g. SUMMARY_COLS); None = all.
+
+    Robustness goals:
+    - tolerate missing/empty meta blocks
+    - give better errors: file + block + reason
+    - handle minor header formatting differences
+
+    Memoized on (path, mtime, size): re-opening an unchanged file returns the same
+    parsed dict (shared DataFrame -> callers must not modify it).
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except Exception as e:
+        raise OvertakeCSVError(path, "file", f"Cannot read file: {type(e).__name__}: {e}")
+    usecols = frozenset(columns) if columns is not None else None
+    return _parse_cached(str(path), st.st_mtime_ns, st.st_size, usecols)
+
+
+# small on purpose: every entry holds a full telemetry DataFrame
+@lru_cache(maxsize=8)
+def _parse_cached(path_str: str, mtime_ns: int, size: int, usecols: frozenset | None) -> Dict[str, Any]:
+    path = Path(path_str)
+    lines, start_idx, header_offset = _read_head(path)
+    player, game, track, setup = _parse_meta(lines, path)
 
     # --- Telemetry dataframe (required, but empty is allowed) ---
-    telemetry_text = "\n".join(lines[start_idx:])
     try:
-        df = pd.read_csv(io.StringIO(telemetry_text))
+        header = next(csv.reader([lines[start_idx]]), [])
+        with path.open("rb") as f:
+            df = _read_telemetry(f, header_offset, header, usecols)
     except Exception as e:
-        raise OvertakeCSVError(path, "telemetry", f"pandas.read_csv failed: {type(e).__name__}: {e}")
+        raise OvertakeCSVError(path, "telemetry", f"read_csv failed: {type(e).__name__}: {e}")
 
     # Sanity: must contain LapDistance column (or a known alias)
     if isinstance(df, pd.DataFrame):
@@ -141,12 +327,130 @@ def parse_overtake_csv(path: Path) -> Dict[str, Any]:
     return {"player": player, "game": game, "track": track, "setup": setup, "telemetry": df}
 
 
+# tail window for parse_overtake_csv_summary (one telemetry row is well below 64 KiB)
+_TAIL_BYTES = 65536
+
+
+def parse_overtake_csv_summary(path: Path) -> Dict[str, Any]:
+    """
+    Like parse_overtake_csv, but without building the telemetry DataFrame:
+    only the meta blocks and the LAST telemetry row are read (tail read from the file end).
+    Returns dict with: player, game, track, setup, telemetry_last ({column: raw value}).
+    Enough for lap_summary() (DB ingest); falls back to the full parse if the tail is unusable.
+    """
+    lines, start_idx, _ = _read_head(path)
+    player, game, track, setup = _parse_meta(lines, path)
+
+    try:
+        with path.open("rb") as fb:
+            size = fb.seek(0, io.SEEK_END)
+            offset = max(0, size - _TAIL_BYTES)
+            fb.seek(offset)
+            tail = fb.read()
+    except Exception as e:
+        raise OvertakeCSVError(path, "file", f"Cannot read file: {type(e).__name__}: {e}")
+
+    # Scan back from the end for the last non-empty line (bytes.rfind, C-level);
+    # only that one line is decoded, the rest of the window never is.
+    if offset == 0:
+        # whole file in the window: only rows after the telemetry header count
+        lo = 0
+        for _ in range(start_idx + 1):
+            m = _EOL.search(tail, lo)
+            if m is None:
+                lo = len(tail)
+                break
+            lo = m.end()
+    else:
+        # first line is cut by the seek
+        m = _EOL.search(tail)
+        lo = m.end() if m else len(tail)
+
+    last_line = None
+    hi = len(tail)
+    while hi > lo:
+        nl = _rfind_eol(tail, lo, hi)
+        start = nl + 1 if nl >= 0 else lo
+        if tail[start:hi].strip():
+            last_line = tail[start:hi].decode(_ENCODING, errors="replace")
+            break
+        hi = nl if nl >= 0 else lo
+
+    if last_line is None and offset > 0:
+        # no complete row inside the window -> full parse (summary columns only)
+        return parse_overtake_csv(path, columns=SUMMARY_COLS)
+
+    last: Dict[str, str] = {}
+    if last_line is not None:
+        try:
+            header, data = csv.reader([lines[start_idx].lstrip("\ufeff"), last_line])
+        except Exception as e:
+            raise OvertakeCSVError(path, "telemetry", f"Malformed last row: {type(e).__name__}: {e}")
+        if len(data) > len(header) or len(set(header)) < len(header):
+            # extra fields / duplicate names: read_csv has its own rules (error, index, "X.1") -> full parse
+            return parse_overtake_csv(path, columns=SUMMARY_COLS)
+        # short row: missing trailing cells are empty (-> NaN), as in read_csv
+        data += [""] * (len(header) - len(data))
+        last = dict(zip(header, data))
+
+    return {"player": player, "game": game, "track": track, "setup": setup, "telemetry_last": last}
+
+
+# Telemetry column aliases in priority order (first present one wins), see lap_summary()
+_FUEL_COLS = (
+    "FuelInTank [kg]",
+    "Fuel in tank [kg]",
+    "FuelInTank",
+    "FuelRemaining [kg]",
+    "Fuel Remaining [kg]",
+    "FuelRemaining",
+    "Fuel [kg]",
+    "Fuel",
+)
+_FUEL_SETUP_KEYS = ("FuelLoad", "FuelLoad [kg]", "Fuel Load", "FuelLoad[kg]")
+_WEAR_COLS = (
+    (("TyreWearFrontLeft [%]", "Tyre Wear Front Left [%]", "TyreWearFL [%]", "TyreWearFL"), "wear_fl"),
+    (("TyreWearFrontRight [%]", "Tyre Wear Front Right [%]", "TyreWearFR [%]", "TyreWearFR"), "wear_fr"),
+    (("TyreWearRearLeft [%]", "Tyre Wear Rear Left [%]", "TyreWearRL [%]", "TyreWearRL"), "wear_rl"),
+    (("TyreWearRearRight [%]", "Tyre Wear Rear Right [%]", "TyreWearRR [%]", "TyreWearRR"), "wear_rr"),
+)
+
+
+# everything lap_summary() reads from the telemetry (+ LapDistance and its aliases)
+SUMMARY_COLS = frozenset(
+    ("LapDistance", "Lap Distance", "LapDistance [m]", "LapDistance[m]", *_FUEL_COLS)
+    + tuple(c for cols, _ in _WEAR_COLS for c in cols)
+)
+
+
+def _first_present(aliases: tuple, present: frozenset) -> str | None:
+    return next((c for c in aliases if c in present), None)
+
+
+@lru_cache(maxsize=16)
+def _resolve_cols(present: frozenset) -> Dict[str, str]:
+    """
+    Column set -> {"fuel": column, "wear_fl": column, ...} for the aliases that are present.
+    Memoized: files from the same game/tool share one column set. Shared dict, read-only.
+    """
+    out = {}
+    fuel = _first_present(_FUEL_COLS, present)
+    if fuel is not None:
+        out["fuel"] = fuel
+    for cols, key in _WEAR_COLS:
+        chosen = _first_present(cols, present)
+        if chosen is not None:
+            out[key] = chosen
+    return out
+
+
 def lap_summary(parsed: Dict[str, Any]) -> Dict[str, Any]:
     """Create a compact summary row for the database."""
     game = parsed.get("game") or {}
     track = parsed.get("track") or {}
     setup = parsed.get("setup") or {}
     df: pd.DataFrame = parsed.get("telemetry")
+    last = parsed.get("telemetry_last")  # from parse_overtake_csv_summary: {column: value} of the last row
 
     # Lap time (best-effort)
     lap_time_s = None
@@ -163,69 +467,48 @@ def lap_summary(parsed: Dict[str, Any]) -> Dict[str, Any]:
     track_name = game.get("Track", game.get("track", "")) or track.get("Track", "")
     game_name = game.get("Game", game.get("game", ""))
 
-    # fuel = None
-    # for k in ("FuelLoad", "FuelLoad [kg]", "Fuel Load", "FuelLoad[kg]"):
-    #     if k in setup:
-    #         try:
-    #             fuel = float(setup[k])
-    #         except Exception:
-    #             fuel = None
-    #         break
-
     # Fuel: prefer "remaining fuel" from telemetry (changes each lap), fallback to setup fuel load
     fuel = None
 
-    # 1) Try telemetry columns (end-of-lap value)
-    if isinstance(df, pd.DataFrame) and not df.empty:
-        for col in (
-                "FuelInTank [kg]",
-                "Fuel in tank [kg]",
-                "FuelInTank",
-                "FuelRemaining [kg]",
-                "Fuel Remaining [kg]",
-                "FuelRemaining",
-                "Fuel [kg]",
-                "Fuel",
-        ):
-            if col in df.columns:
-                try:
-                    fuel = float(df[col].iloc[-1])
-                except Exception:
-                    fuel = None
-                break
+    # column names -> resolved alias columns (memoized per column set)
+    if isinstance(last, dict):
+        present = frozenset(last)
+        end_value = lambda c: "nan" if last[c] in _NA_VALUES else last[c]  # NA tokens -> NaN, like read_csv
+    else:
+        # last telemetry row as a plain dict once -> no per-column pandas indexing below
+        row = df.iloc[-1].to_dict() if isinstance(df, pd.DataFrame) and not df.empty else {}
+        present = frozenset(row)
+        end_value = row.__getitem__
+    resolved = _resolve_cols(present)
 
-    # 2) Fallback: setup fuel (static)
+    # 1) Try telemetry columns (end-of-lap value)
+    col = resolved.get("fuel")
+    if col is not None:
+        try:
+            fuel = float(end_value(col))
+        except Exception:
+            fuel = None
+
+    # 2) Fallback: setup fuel (static), first present key
     if fuel is None:
-        for k in ("FuelLoad", "FuelLoad [kg]", "Fuel Load", "FuelLoad[kg]"):
-            if k in setup:
-                try:
-                    fuel = float(setup[k])
-                except Exception:
-                    fuel = None
-                break
-
-    # Wear: try a couple of common column spellings/variants
-    wear_map = [
-        (("TyreWearFrontLeft [%]", "Tyre Wear Front Left [%]", "TyreWearFL [%]", "TyreWearFL"), "wear_fl"),
-        (("TyreWearFrontRight [%]", "Tyre Wear Front Right [%]", "TyreWearFR [%]", "TyreWearFR"), "wear_fr"),
-        (("TyreWearRearLeft [%]", "Tyre Wear Rear Left [%]", "TyreWearRL [%]", "TyreWearRL"), "wear_rl"),
-        (("TyreWearRearRight [%]", "Tyre Wear Rear Right [%]", "TyreWearRR [%]", "TyreWearRR"), "wear_rr"),
-    ]
-    wear: Dict[str, Any] = {k: None for _, k in wear_map}
-
-    if isinstance(df, pd.DataFrame) and not df.empty:
-        for cols, out in wear_map:
-            chosen = None
-            for c in cols:
-                if c in df.columns:
-                    chosen = c
-                    break
-            if chosen is None:
-                continue
+        raw = next((setup[k] for k in _FUEL_SETUP_KEYS if k in setup), None)
+        if raw is not None:
             try:
-                wear[out] = float(df[chosen].iloc[-1])
+                fuel = float(raw)
             except Exception:
-                wear[out] = None
+                fuel = None
+
+    # Wear: try a couple of common column spellings/variants (_WEAR_COLS)
+    wear: Dict[str, Any] = {k: None for _, k in _WEAR_COLS}
+
+    for _, out in _WEAR_COLS:
+        chosen = resolved.get(out)
+        if chosen is None:
+            continue
+        try:
+            wear[out] = float(end_value(chosen))
+        except Exception:
+            wear[out] = None
 
     # ✅ IMPORTANT: Always return a dict (never None)
     return {
@@ -237,3 +520,4 @@ def lap_summary(parsed: Dict[str, Any]) -> Dict[str, Any]:
         "fuel_load": fuel,
         **wear,
     }
+
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def app_dir() -> Path:
+    # resolved + created once per process (lru_cache); LOCALAPPDATA is read at first call
     # Windows: %LOCALAPPDATA%\SimRacingStrategist
     local = os.environ.get("LOCALAPPDATA")
     if local:
@@ -21,17 +24,26 @@ def config_path() -> Path:
     return app_dir() / "config.json"
 
 
+@lru_cache(maxsize=1)
 def cache_dir() -> Path:
     p = app_dir() / "cache"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@lru_cache(maxsize=1)
 def data_dir() -> Path:
     p = app_dir() / "data"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@lru_cache(maxsize=1)
 def db_path() -> Path:
     return app_dir() / "data.db"
+
+
+@lru_cache(maxsize=1)
+def db_path_str() -> str:
+    # str form for sqlite3.connect
+    return os.fspath(db_path())
@@ -448,7 +448,7 @@ def pit_windows_two_stop(race_laps: int, max_stint_laps: float, min_stint_laps:
     return s1_earliest, s1_latest, s2_earliest, s2_latest
 
 
-@dataclass
+@dataclass(slots=True)
 class RainPitAdvice:
     action: str  # "BOX NOW", "BOX IN N", "STAY OUT"
     target_tyre: Optional[str]
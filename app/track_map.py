@@ -1,6 +1,8 @@
 # app/track_map.py
 from __future__ import annotations
 
+from functools import lru_cache
+
 # F1 25 trackId -> human name (partial; unknown ids fall back to TrackId:<n>)
 # Keep this dict minimal and extend it as you confirm IDs.
 TRACK_ID_TO_NAME: dict[int, str] = {
@@ -40,6 +42,8 @@ TRACK_ID_TO_NAME: dict[int, str] = {
 }
 
 
+# Called per lap commit (DB summary + CSV path) with the same id all session long.
+@lru_cache(maxsize=64)
 def track_label_from_id(track_id: int | None) -> str:
     """
     Returns a human-friendly track label.
@@ -8,20 +8,28 @@ Phase B (echte Auslagerung):
 """
 
 import csv
+import hashlib
+import io
+import operator
+import os
 import re
 import shutil
+import tempfile
+from bisect import bisect_left
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from PySide6 import QtCore, QtWidgets, QtGui
 
 from app.config import load_config, save_config, AppConfig
-from app.db import upsert_lap, latest_laps, distinct_tracks, laps_for_track, export_laps_to_csv
+from app.db import upsert_lap, latest_laps, distinct_tracks, laps_for_track, export_laps_to_csv, db_signature
 from app.f1_udp import F1UDPListener, F1UDPReplayListener, F1LiveState
 from app.logging_util import AppLogger
 from app.logic.minisectors import MiniSectorTracker
-from app.overtake_csv import parse_overtake_csv, lap_summary
+from app.overtake_csv import parse_overtake_csv_summary, lap_summary
 from app.paths import cache_dir
 from app.rain_engine import RainEngine
 from app.strategy_model import LapRow, estimate_degradation_for_track_tyre, pit_window_one_stop, pit_windows_two_stop
@@ -40,9 +48,335 @@ from app.watcher import FolderWatcher
 _RE_RACE = re.compile(r"(^|_)r($|_)")
 _RE_QUALI = re.compile(r"(^|_)q($|_)|(^|_)q[123]($|_)")
 _RE_PRACTICE = re.compile(r"(^|_)p($|_)|(^|_)p[123]($|_)")
+_RE_TT = re.compile(r"^tt_|_tt_|_tt$", re.IGNORECASE)  # TT-Format: hungary_DRY_TT_79.111_mclaren
+
+# Common Codemasters sessionType mapping (coarse), see MainWindow._session_label_from_udp:
+# Practice: 1..4   (P1/P2/P3 + short/one-shot practice depending on year)
+# Quali:    5..9   (Q1/Q2/Q3 + short + one-shot)
+# Race:    10..11  (Race + Race2)
+# TT:      12      (Time Trial)
+_SESSION_LABEL_LUT: dict[int, str] = {
+    1: "P", 2: "P", 3: "P", 4: "P",
+    5: "Q", 6: "Q", 7: "Q", 8: "Q", 9: "Q",
+    10: "R", 11: "R",
+    12: "TT",
+}
+
+def _fc_nearest(fc_times: list[int], fc_pcts: list[int], tmin_float: float) -> Optional[int]:
+    """
+    Nearest-sample forecast lookup:
+    returns the rain% of the sample whose timeOffset (minutes) is closest to tmin_float.
+    fc_times must be sorted ascending. On a tie the earlier sample wins. Empty -> None.
+    """
+    if not fc_times:
+        return None
+    idx = bisect_left(fc_times, tmin_float)
+    if idx >= len(fc_times):
+        return fc_pcts[-1]
+    if idx > 0 and (tmin_float - fc_times[idx - 1]) <= (fc_times[idx] - tmin_float):
+        return fc_pcts[idx - 1]
+    return fc_pcts[idx]
+
+
+def _file_sig(path: Path, size: int) -> tuple[int, int]:
+    """
+    Dedupe signature for watcher events: (size, 64-bit blake2b of the first 4 KiB).
+    Content-based, so coarse/unchanged mtimes neither merge new files nor split duplicates.
+    """
+    with path.open("rb") as f:
+        head = f.read(4096)
+    return size, int.from_bytes(hashlib.blake2b(head, digest_size=8).digest(), "little")
+
+
+def _import_snapshot(cached: Path) -> Path:
+    """
+    Private copy of a watcher cache file for one queued import (CsvImportTask deletes it).
+    The watcher copies the next event for the same src onto the cache file in place,
+    which would truncate it under an import still reading it.
+    """
+    fd, name = tempfile.mkstemp(prefix=f"{cached.name}.", suffix=".import", dir=cached.parent)
+    os.close(fd)
+    shutil.copyfile(cached, name)
+    return Path(name)
+
+
+def _fmt_lap_ms(ms_total: Optional[int]) -> str:
+    """Format integer milliseconds as M:SS.mmm (e.g. 94123 -> '1:34.123'); None -> '—'."""
+    if ms_total is None:
+        return "—"
+    m, rem = divmod(int(ms_total), 60_000)
+    return f"{m}:{rem // 1000:02d}.{rem % 1000:03d}"
+
+
+# Table text colors for dark/bright cell backgrounds (see _readable_fg)
+_FG_BLACK = QtGui.QColor(0, 0, 0)
+_FG_WHITE = QtGui.QColor(255, 255, 255)
+
+
+@lru_cache(maxsize=64)
+def _readable_fg(rgb: int) -> QtGui.QColor:
+    """Black or white text for a background QRgb (0xAARRGGBB), by perceived luminance (0..255)."""
+    r = (rgb >> 16) & 0xFF
+    g = (rgb >> 8) & 0xFF
+    b = rgb & 0xFF
+    lum = 0.2126 * r + 0.7152 * g + 0.0722 * b
+    return _FG_BLACK if lum > 140 else _FG_WHITE
+
+
+# Windows-illegal filename chars: <>:"/\|?*  (plus control chars), see _append_udp_lap_csv
+_FS_ILLEGAL_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+
+# Filename-safe token: letters/numbers/_/-. only (see MainWindow._safe_token)
+_SAFE_TOKEN_RE = re.compile(r"[^A-Za-z0-9_\-\.]+")
+
+
+@lru_cache(maxsize=256)
+def _safe_token_cached(s: str, fallback: str) -> str:
+    # Inputs repeat lap after lap (session label, team, track) -> memoize.
+    t = s.strip()
+    if not t:
+        t = fallback
+    # Replace illegal filename chars with "_"
+    t = _SAFE_TOKEN_RE.sub("_", t)
+    # Avoid absurd length
+    return t[:80]
+
+
+# Minisector CSV cell formatting (see MainWindow._append_udp_minisector_lap_csv).
+# Same dialect as csv.writer defaults: "\r\n" line ends, quote only when needed.
+_CSV_EOL = "\r\n"
+
+
+def _csv_num(v, fmt: str = "%d") -> str:
+    return "" if v is None else fmt % v
+
+
+def _csv_text(v) -> str:
+    if v is None:
+        return ""
+    t = str(v)
+    if "," in t or '"' in t or "\n" in t or "\r" in t:
+        return '"' + t.replace('"', '""') + '"'
+    return t
+
+
+# Minisector CSV metadata columns; MS01_ms..MSnn_ms follow (see _ms_csv_header).
+_MS_CSV_FIXED_COLS: tuple[str, ...] = (
+    "created_at_utc",
+    "game",
+    "session",
+    "session_uid",
+    "team",
+    "track_id",
+    "track",
+    "lap_num",
+    "lap_time_ms",
+    "sector1_ms",
+    "sector2_ms",
+    "sector3_ms",
+    "tyre_cat",
+    "tyre_class",
+    "weather_enum",
+    "rain_now_pct",
+    "rain_fc_pct",
+    "safety_car_status",
+    "track_flag",
+    "player_fia_flag",
+
+    "fuel_in_tank",
+    "fuel_remaining_laps",
+    "wear_fl_pct",
+    "wear_fr_pct",
+    "wear_rl_pct",
+    "wear_rr_pct",
+    "ms01_estimated",
+    "complete",
+    "missing_minisectors",
+    "minis_sum_ms",
+)
+_MS_CSV_FIXED = len(_MS_CSV_FIXED_COLS)
+
+
+@lru_cache(maxsize=4)
+def _ms_csv_header(total_minis: int) -> str:
+    ms_cols = [f"MS{n:02d}_ms" for n in range(1, total_minis + 1)]
+    return ",".join((*_MS_CSV_FIXED_COLS, *ms_cols)) + _CSV_EOL
+
+
+# Tyre values as stored in the DB -> tagging key; known spellings skip strip()/upper()
+_TYRE_KEYS: dict[str, str] = {
+    t: t for t in ("C0", "C1", "C2", "C3", "C4", "C5", "C6", "SOFT", "MEDIUM", "HARD", "INTER", "WET")
+}
+
+
+def _tyre_key(v) -> str | None:
+    if v is None:
+        return None
+    k = _TYRE_KEYS.get(v)
+    return k if k is not None else str(v).strip().upper()
+
+
+# DB view lap tagging thresholds (see _lap_numbers_and_tags)
+WEAR_DROP_THR = 2.0  # avg wear drop between consecutive laps -> pit stop (IN/OUT)
+SHIFT_SEC = 1.2  # moderate outlier vs normal pace on same tyre
+SLOW_SEC = 6.0  # big outlier (ERS recharge etc.) on same tyre
+
+
+def _lap_numbers_and_tags(rows: list) -> tuple[dict[int, int], list[str]]:
+    """
+    Lap numbers + lap tags (OK/IN/OUT/SHIFT/SLOW) for latest_laps() rows.
+    Row indices: 0 created_at,1 game,2 track,3 session,4 session_uid,5 tyre,6 weather,7 lap_time_s,8 fuel,9..12 wear
+
+    Works on NumPy columns (wear avg, lap time, tyre key) lifted once from the rows;
+    per group only index/mask operations remain.
+    """
+    n = len(rows)
+    lapno: dict[int, int] = {}  # row_index -> lap number
+    tags = np.full(n, "OK", dtype=object)
+    if n == 0:
+        return lapno, []
+
+    def _f(v) -> float:
+        if v is None:
+            return np.nan
+        try:
+            return float(v)
+        except Exception:
+            return np.nan
+
+    # one flat pass over the four wear columns (no per-row list), reshaped to (n, 4)
+    wear = np.fromiter((_f(v) for r in rows for v in r[9:13]), dtype=np.float64, count=4 * n).reshape(n, 4)
+    have = ~np.isnan(wear)
+    cnt = have.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        wear_avg = np.where(have, wear, 0.0).sum(axis=1) / cnt  # nan if no wear value
+    times = np.array([_f(r[7]) for r in rows], dtype=np.float64)
+    tyre_key = np.array([_tyre_key(r[5]) for r in rows], dtype=object)
+    has_tyre = tyre_key != None  # noqa: E711 (elementwise)
+
+    # Gruppieren nach (game, track, session, session_uid) → damit Boxenstopp über Tyre-Wechsel erkannt wird
+    by_group: dict[tuple, list[int]] = {}
+    for i, row in enumerate(rows):
+        by_group.setdefault((row[1], row[2], row[3], row[4]), []).append(i)
+
+    for idxs in by_group.values():
+        # rows sind newest-first (latest_laps: ORDER BY id DESC) → für Lapnummern umdrehen.
+        # Only sort if created_at is not monotonic (it normally follows id; upserts keep both).
+        idxs.reverse()
+        if any(rows[a][0] > rows[b][0] for a, b in zip(idxs, idxs[1:])):
+            idxs.sort(key=lambda j: rows[j][0])
+        idxs = np.array(idxs, dtype=np.intp)
+
+        # Lapnummern
+        for k, j in enumerate(idxs.tolist(), start=1):
+            lapno[j] = k
+
+        # Wear-Drop → IN / OUT (OUT first so a lap that is both OUT and the next IN ends up IN)
+        w = wear_avg[idxs]
+        with np.errstate(invalid="ignore"):
+            drop = (w[:-1] - w[1:]) > WEAR_DROP_THR  # nan -> False
+        tags[idxs[1:][drop]] = "OUT"
+        tags[idxs[:-1][drop]] = "IN"
+
+        # --- Time outliers → SHIFT / SLOW (per-tyre ONLY; no cross-tyre fallback!) ---
+        t = times[idxs]
+        tk = tyre_key[idxs]
+        g_tyre = has_tyre[idxs]
+        g_ok = tags[idxs] == "OK"
+        with np.errstate(invalid="ignore"):
+            sample = g_ok & g_tyre & (t > 10.0) & (t < 400.0)  # ignore IN/OUT and implausible times
+
+        for key in set(tk[sample].tolist()):
+            ts = t[sample & (tk == key)]
+            # Baseline per tyre: if not enough samples, DON'T tag that tyre at all
+            # (prevents "Inter slower than Slick" false SLOW)
+            if len(ts) < 3:
+                continue
+            mid = len(ts) // 2
+            base = np.partition(ts, mid)[mid]  # element at sorted position n//2, O(n) selection
+
+            on_tyre = g_ok & (tk == key)
+            with np.errstate(invalid="ignore"):
+                slow = on_tyre & (t > base + SLOW_SEC)
+                shift = on_tyre & ~slow & (t > base + SHIFT_SEC)
+            tags[idxs[slow]] = "SLOW"
+            tags[idxs[shift]] = "SHIFT"
+
+    return lapno, tags.tolist()
+
+
+# Bulk field lookup for the lap-commit paths (DB summary + minisector CSV).
+# F1LiveState is a dataclass with defaults for every field, so no getattr(..., None) fallback needed.
+_STATE_GET = operator.attrgetter(
+    "track_id",
+    "weather",
+    "player_tyre_cat",
+    "player_tyre_compound",
+    "session_type_id",
+    "game_year",
+    "player_fuel_in_tank",
+    "player_wear_fl",
+    "player_wear_fr",
+    "player_wear_rl",
+    "player_wear_rr",
+)
+
+# Additional fields only the minisector CSV writes.
+_STATE_GET_CSV = operator.attrgetter(
+    "session_uid",
+    "player_team_name",
+    "player_team_id",
+    "player_sector1_time_ms",
+    "player_sector2_time_ms",
+    "rain_now_pct",
+    "rain_fc_pct",
+    "safety_car_status",
+    "track_flag",
+    "player_fia_flag",
+    "player_fuel_remaining_laps",
+    "track_length_m",
+    "sector2_start_m",
+    "sector3_start_m",
+)
+
+
+class CsvImportTask(QtCore.QRunnable):
+    """Runs MainWindow._import_csv for one watched file on a worker thread, then deletes its snapshot."""
+
+    def __init__(self, window: "MainWindow", src: Path, cached: Path, session: str, mtime_ns: int):
+        super().__init__()
+        self._window = window
+        self._args = (src, cached, session, mtime_ns)
+
+    def run(self) -> None:
+        try:
+            self._window._import_csv(*self._args)
+        finally:
+            try:
+                self._args[1].unlink(missing_ok=True)
+            except OSError:
+                pass
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # Minisector index (0..29) -> tblMini row. Layout rows (NO gaps):
+    # 0      : SECTOR 1 header
+    # 1-10   : minis 0..9
+    # 11     : SECTOR 2 header
+    # 12-21  : minis 10..19
+    # 22     : SECTOR 3 header
+    # 23-32  : minis 20..29
+    _MINI_ROW: tuple[int, ...] = (
+        tuple(range(1, 11)) + tuple(range(12, 22)) + tuple(range(23, 33))
+    )
+
+    # tblMini cell colors (text color per background: see _readable_fg)
+    _MINI_PURPLE = QtGui.QColor(160, 32, 240)
+    _MINI_GREEN = QtGui.QColor(0, 255, 0)  # (WIP, not tested yet)
+    _MINI_YELLOW = QtGui.QColor(255, 239, 0)
+    _MINI_NEUTRAL = QtGui.QColor(45, 45, 45)  # dark neutral
+    _MINI_CURRENT = QtGui.QColor(60, 90, 140)  # current minisector (blue-ish)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("SimRacingStrategist – Prototype")
@@ -57,7 +391,65 @@ class MainWindow(QtWidgets.QMainWindow):
         self.out_watcher: Optional[FolderWatcher] = None  # NEW: watch udp_output_root too
 
         self.udp: Optional[F1UDPListener] = None
-        self._dedupe_mtime = {}  # src_path -> last_mtime_ns
+        self._dedupe_mtime = {}  # src_path -> last (size, head hash) signature, see _file_sig
+
+        # Health panel repaint coalescing (see _schedule_health_refresh);
+        # separate from _health_timer, which is the periodic UDP-age tick.
+        self._health_dirty = False
+        self._health_refresh_timer = QtCore.QTimer(self)
+        self._health_refresh_timer.setSingleShot(True)
+        self._health_refresh_timer.setInterval(50)
+        self._health_refresh_timer.timeout.connect(self._flush_health_panel)
+
+        # CSV imports run here, one at a time, in arrival order
+        self._csv_pool = QtCore.QThreadPool(self)
+        self._csv_pool.setMaxThreadCount(1)
+        # Own UDP lap CSVs grow by one row per lap: src path -> (byte offset after the last
+        # imported row, rows imported), so an append only upserts the new rows (pool thread only)
+        self._own_udp_done: dict[str, tuple[int, int]] = {}
+
+        # Lap-event timestamp, shared per live-state callback (see _lap_event_ts)
+        self._lap_ts: Optional[tuple[str, str]] = None
+
+        # Minisector CSV (one file per session): keep the active session file open
+        self._csv_fh = None
+        self._csv_fh_path: Optional[str] = None
+        self._csv_header_paths: set[str] = set()
+        # Output directories already created this run (see _ensure_dir)
+        self._mkdir_cache: set[str] = set()
+        # Lap-summary CSV (_append_udp_lap_csv): path -> (open file, DictWriter)
+        self._csv_writers: dict[str, tuple] = {}
+
+        # RainEngine DB rows for the selected track (loaded off the UI thread, see _reload_db_cache)
+        self._db_cache_track: Optional[str] = None
+        self._db_cache_rows: Optional[list] = None
+        self._db_cache_loaded: Optional[tuple[str, Optional[list]]] = None
+        self._db_reload_in_flight = False
+
+        # _refresh_db_views result keyed by db_signature(): (sig, rows)
+        self._views_cache: tuple = (None, None)
+
+        # Coalesces queued _after_db_update calls (see _queue_after_db_update)
+        self._after_db_pending = False
+
+        # tblMini sector header rows are painted once (see _init_minisector_headers)
+        self._mini_headers_init = False
+        # Shared fonts for the current-minisector highlight (item default font, bold / not bold)
+        self._mini_bold_font = QtGui.QFont()
+        self._mini_bold_font.setBold(True)
+        self._mini_norm_font = QtGui.QFont()
+        self._mini_norm_font.setBold(False)
+        self._mini_header_items: list[QtWidgets.QTableWidgetItem] = []
+
+        # Last text pushed to each live label (compare in Python instead of reading QLabel.text())
+        self._last_label_text: dict[str, str] = {}
+        # Field share/delta lines, keyed by the state values they are built from
+        self._last_field_key: Optional[tuple] = None
+        self._last_field_txt: tuple[str, str] = ("", "")
+
+        # Rain forecast as flat (times, pcts) lists; rebuilt only when the series object changes
+        self._fc_flat_src = None
+        self._fc_flat_cache: tuple[list[int], list[int]] = ([], [])
 
         self._build_ui()
         self._build_tools_menu()
@@ -102,6 +494,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self._your_last_lap_s = None
         self._your_last_tyre = None
         self._your_last_track = None
+        # (lap_time_s, tyre, track) from the CSV import pool, applied on the UI thread in _after_db_update
+        self._your_last_loaded: Optional[tuple] = None
 
         self._udp_last_recorded_lastlap_ms = None
 
@@ -136,21 +530,7 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             return ""
 
-        # Common Codemasters sessionType mapping (coarse):
-        # Practice: 1..4   (P1/P2/P3 + short/one-shot practice depending on year)
-        # Quali:    5..9   (Q1/Q2/Q3 + short + one-shot)
-        # Race:    10..11  (Race + Race2)
-        # TT:      12      (Time Trial)
-        if 1 <= v <= 4:
-            return "P"
-        if 5 <= v <= 9:
-            return "Q"
-        if 10 <= v <= 11:
-            return "R"
-        if v == 12:
-            return "TT"
-
-        return ""
+        return _SESSION_LABEL_LUT.get(v, "")
 
     def _on_estimate_deg(self):
         track = self.cmbTrack.currentText().strip()
@@ -298,6 +678,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.btnRefreshDb = self.db_tab.btnRefreshDb
         self.tbl = self.db_tab.tbl
+        self._laps_model = self.db_tab.laps_model
 
         # wire DB tab tool buttons to the same handlers as the Tools menu
         self.btnExportDb = self.db_tab.btnExportDb
@@ -467,13 +848,32 @@ class MainWindow(QtWidgets.QMainWindow):
             return "—"
 
     # -------------------- Data Health helpers --------------------
+    def _schedule_health_refresh(self) -> None:
+        """
+        Mark the health panel dirty and repaint it once ~50 ms later (bursts collapse into one refresh).
+        Callable from worker threads: the timer is only ever started on the UI thread.
+        """
+        self._health_dirty = True
+        if QtCore.QThread.currentThread() == self.thread():
+            if not self._health_refresh_timer.isActive():
+                self._health_refresh_timer.start()
+        else:
+            QtCore.QMetaObject.invokeMethod(self._health_refresh_timer, "start", QtCore.Qt.QueuedConnection)
+
+    @QtCore.Slot()
+    def _flush_health_panel(self) -> None:
+        if not self._health_dirty:
+            return
+        self._health_dirty = False
+        self._refresh_health_panel()
+
     def _mark_db_ok(self) -> None:
         """Mark DB health as OK with timestamp."""
         try:
             self._health["db"]["status"] = "OK"
             self._health["db"]["ts"] = self._health_now_str()
             self._health["db"]["err"] = ""
-            self._refresh_health_panel()
+            self._schedule_health_refresh()
         except Exception:
             pass
 
@@ -486,7 +886,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self._health["db"]["status"] = "FAIL"
             self._health["db"]["ts"] = self._health_now_str()
             self._health["db"]["err"] = reason
-            self._refresh_health_panel()
+            self._schedule_health_refresh()
         except Exception:
             pass
 
@@ -631,7 +1031,7 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
-        self._refresh_health_panel()
+        self._schedule_health_refresh()
 
         self.status.showMessage("Settings saved. Restarting services…", 3000)
         self._restart_services()
@@ -697,6 +1097,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.btnApplyLang.setText(self.tr.t("settings.language_apply", "Apply language"))
 
         # Live labels: set defaults (actual content updated by _update_live_labels)
+        self._last_label_text = {}
+        self._last_field_key = None
         self.lblSC.setText(self.tr.t("live.sc_na", "SC/VSC: n/a"))
         self.lblWeather.setText(self.tr.t("live.weather_na", "Weather: n/a"))
         self.lblRain.setText(self.tr.t("live.rain_na", "Rain(next): n/a"))
@@ -822,6 +1224,7 @@ class MainWindow(QtWidgets.QMainWindow):
     @QtCore.Slot(object)
     def _on_live_state(self, state: F1LiveState):
         self._live_state = state
+        self._lap_ts = None  # new callback -> fresh lap-event timestamp (see _lap_event_ts)
 
         # NEW: optional UDP lap recorder (writes lap summaries into DB, does NOT touch CSV import path)
         try:
@@ -895,13 +1298,25 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    def _lap_event_ts(self) -> tuple[str, str]:
+        """
+        (isoformat, filename token) of the current lap event, UTC.
+        Computed once per _on_live_state callback and shared by the DB summary and the CSV writers.
+        """
+        ts = self._lap_ts
+        if ts is None:
+            ts_utc = datetime.now(timezone.utc)
+            ts = (ts_utc.isoformat(timespec="seconds"), ts_utc.strftime("%Y%m%dT%H%M%SZ"))
+            self._lap_ts = ts
+        return ts
+
     def _maybe_record_udp_lap(self, state: F1LiveState) -> None:
         """
         Record a lap summary into DB when UDP reports a new lastLapTime.
         This is additive and runs in parallel to Overtake CSV import.
         """
-        last_ms = getattr(state, "player_last_lap_time_ms", None)
-        cur_lap_num = getattr(state, "player_current_lap_num", None)
+        last_ms = state.player_last_lap_time_ms
+        cur_lap_num = state.player_current_lap_num
 
         # We only record when last lap time is known and plausible
         if last_ms is None:
@@ -928,14 +1343,13 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             lap_n = None
 
-        sess_uid = getattr(state, "session_uid", None) or "nosess"
-        # track_id = getattr(state, "track_id", None)
+        sess_uid = state.session_uid or "nosess"
+        (track_id, weather_enum, tc, tl, sid, gy, fuel, wfl, wfr, wrl, wrr) = _STATE_GET(state)
 
         # Track label: prefer pretty names, fallback to TrackId:<n>
-        track_label = track_label_from_id(getattr(state, "track_id", None))
+        track_label = track_label_from_id(track_id)
 
         # Weather label (UDP enum)
-        weather_enum = getattr(state, "weather", None)
         weather_map = {
             0: "Clear",
             1: "Light cloud",
@@ -947,17 +1361,17 @@ class MainWindow(QtWidgets.QMainWindow):
         weather_label = weather_map.get(int(weather_enum), "Unknown") if weather_enum is not None else "Unknown"
 
         # Coarse class for rain engine: SLICK/INTER/WET
-        tyre_class = (getattr(state, "player_tyre_cat", None) or "").upper().strip()
+        tyre_class = (tc or "").upper().strip()
         if tyre_class not in ("SLICK", "INTER", "WET"):
             tyre_class = ""
 
         # Exact label for DB/strategy: C1..C6 for slicks, else INTER/WET.
-        tyre_label = (getattr(state, "player_tyre_compound", None) or "").upper().strip()
+        tyre_label = (tl or "").upper().strip()
         if not tyre_label:
             tyre_label = tyre_class
 
         # Session type from UDP (coarse P/Q/R/TT). Keep old fallback to "R".
-        session_label = self._session_label_from_udp(getattr(state, "session_type_id", None)) or "R"
+        session_label = self._session_label_from_udp(sid) or "R"
 
         lap_time_s = float(last_ms) / 1000.0
 
@@ -982,7 +1396,6 @@ class MainWindow(QtWidgets.QMainWindow):
         source = f"udp://{sess_uid}/lap{lap_n if lap_n is not None else 'x'}/t{last_ms}"
 
         # Game label best-effort (keeps old behavior if unknown)
-        gy = getattr(state, "game_year", None)
         game_label = "F1 25"
         try:
             if int(gy) == 20:
@@ -1000,12 +1413,12 @@ class MainWindow(QtWidgets.QMainWindow):
             "lap_time_s": lap_time_s,
 
             # NEW (additive): pulled from UDP state if available
-            "fuel_load": getattr(state, "player_fuel_in_tank", None),
+            "fuel_load": fuel,
 
-            "wear_fl": getattr(state, "player_wear_fl", None),
-            "wear_fr": getattr(state, "player_wear_fr", None),
-            "wear_rl": getattr(state, "player_wear_rl", None),
-            "wear_rr": getattr(state, "player_wear_rr", None),
+            "wear_fl": wfl,
+            "wear_fr": wfr,
+            "wear_rl": wrl,
+            "wear_rr": wrr,
         }
 
         upsert_lap(source, summ)
@@ -1015,7 +1428,7 @@ class MainWindow(QtWidgets.QMainWindow):
         try:
             if bool(getattr(self.cfg, "udp_write_csv_laps", False)):
                 self._append_udp_lap_csv({
-                    "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "created_at": self._lap_event_ts()[0],
                     "game": "F1 25",
                     "track": track_label,
                     "session": session_label,
@@ -1030,7 +1443,7 @@ class MainWindow(QtWidgets.QMainWindow):
             pass
 
         # Update UI/DB views like the CSV path does
-        QtCore.QMetaObject.invokeMethod(self, "_after_db_update", QtCore.Qt.QueuedConnection)
+        self._queue_after_db_update()
 
     def _safe_token(self, s: object, fallback: str = "NA") -> str:
         """
@@ -1040,13 +1453,7 @@ class MainWindow(QtWidgets.QMainWindow):
             t = str(s) if s is not None else ""
         except Exception:
             t = ""
-        t = t.strip()
-        if not t:
-            t = fallback
-        # Replace illegal filename chars with "_"
-        t = re.sub(r"[^A-Za-z0-9_\-\.]+", "_", t)
-        # Avoid absurd length
-        return t[:80]
+        return _safe_token_cached(t, fallback)
 
     def _fmt_laptime_token(self, lap_time_ms: int | None) -> str:
         """
@@ -1059,14 +1466,41 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception:
             return "NA"
 
+    def _ms_csv_handle(self, out_path: Path):
+        """
+        Append handle for the per-session minisector CSV.
+        Kept open for the active session; switching sessions closes the old file.
+        """
+        key = str(out_path)
+        if self._csv_fh is not None and self._csv_fh_path == key:
+            return self._csv_fh
+
+        self._close_ms_csv()
+        self._csv_fh = out_path.open("a", newline="", encoding="utf-8")
+        self._csv_fh_path = key
+        return self._csv_fh
+
+    def _close_ms_csv(self) -> None:
+        fh = self._csv_fh
+        self._csv_fh = None
+        self._csv_fh_path = None
+        if fh is not None:
+            try:
+                fh.close()
+            except Exception:
+                pass
+
     def _append_udp_minisector_lap_csv(self, state: F1LiveState, lap: dict) -> None:
         """
-        One file per completed lap (your custom format):
+        Write one completed lap (your custom format):
 
         Folder: <output_root>/<Track>/
-        Filename: <session>_<team>_lap<lap>_t<laptime_ms>_<timestamp>.csv
+        Filename (default, cfg.udp_csv_one_file_per_session=True):
+            <session>_<team>_<session_uid>.csv   -> one row appended per lap
+        Filename (legacy, one file per lap):
+            <session>_<team>_lap<lap>_t<laptime_ms>_<timestamp>.csv
 
-        CSV contains ONE row (wide format) with metadata + MS01..MS30.
+        Each row (wide format) holds metadata + MS01..MS30.
 
         Additive + safe:
         - Does not affect Iko/Overtake CSV import.
@@ -1078,41 +1512,47 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             base = Path(out_root)
-            base.mkdir(parents=True, exist_ok=True)
+
+            (track_id, weather, tyre_class, tyre_compound, sid, gy,
+             fuel_in_tank, wear_fl, wear_fr, wear_rl, wear_rr) = _STATE_GET(state)
+            (sess_uid, team, tid, s1, s2, rain_now, rain_fc, sc, track_flag, player_flag,
+             fuel_remaining_laps, tl, s2m, s3m) = _STATE_GET_CSV(state)
 
             # ---- track folder ----
-            track_id = getattr(state, "track_id", None)
             track_label = track_label_from_id(track_id)
             track_dir = base / self._safe_token(track_label, fallback="UnknownTrack")
-            track_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(track_dir)
 
             # ---- session label (P/Q/R/TT) from UDP session_type_id ----
-            session_label = self._session_label_from_udp(getattr(state, "session_type_id", None))
+            session_label = self._session_label_from_udp(sid)
 
             # ---- team ----
-            team = getattr(state, "player_team_name", None)
             if not team:
-                tid = getattr(state, "player_team_id", None)
                 team = f"TEAM{int(tid)}" if tid is not None else "UNK"
 
             lap_num = lap.get("lap_num")
             lap_time_ms = lap.get("lap_time_ms")
 
-            ts_utc = datetime.now(timezone.utc)
-            ts_token = ts_utc.strftime("%Y%m%dT%H%M%SZ")
-
-            fn = (
-                f"{self._safe_token(session_label or 'NA')}_"
-                f"{self._safe_token(team)}_"
-                f"lap{self._safe_token(lap_num)}_"
-                f"t{self._fmt_laptime_token(lap_time_ms)}_"
-                f"{ts_token}.csv"
-            )
+            ts_iso, ts_token = self._lap_event_ts()
+
+            one_file_per_session = bool(getattr(self.cfg, "udp_csv_one_file_per_session", True))
+            if one_file_per_session:
+                fn = (
+                    f"{self._safe_token(session_label or 'NA')}_"
+                    f"{self._safe_token(team)}_"
+                    f"{self._safe_token(sess_uid or 'nosess')}.csv"
+                )
+            else:
+                fn = (
+                    f"{self._safe_token(session_label or 'NA')}_"
+                    f"{self._safe_token(team)}_"
+                    f"lap{self._safe_token(lap_num)}_"
+                    f"t{self._fmt_laptime_token(lap_time_ms)}_"
+                    f"{ts_token}.csv"
+                )
             out_path = track_dir / fn
 
             # ---- sector times (best-effort) ----
-            s1 = getattr(state, "player_sector1_time_ms", None)
-            s2 = getattr(state, "player_sector2_time_ms", None)
             s3 = None
             try:
                 if lap_time_ms is not None and s1 is not None and s2 is not None:
@@ -1121,69 +1561,42 @@ class MainWindow(QtWidgets.QMainWindow):
                 s3 = None
 
             # ---- other metadata ----
-            sess_uid = getattr(state, "session_uid", None) or "nosess"
+            sess_uid = sess_uid or "nosess"
             # Write exact compound label into CSV for later strategy work.
             # Keep class separately to not break rain logic / debugging.
-            tyre_class = getattr(state, "player_tyre_cat", None)
-            tyre = getattr(state, "player_tyre_compound", None) or tyre_class
-            weather = getattr(state, "weather", None)
-
-            rain_now = getattr(state, "rain_now_pct", None)
-            rain_fc = getattr(state, "rain_fc_pct", None)
-
-            sc = getattr(state, "safety_car_status", None)
-            track_flag = getattr(state, "track_flag", None)
-            player_flag = getattr(state, "player_fia_flag", None)
-
-            # ---- fuel + wear (NEW) ----
-            fuel_in_tank = getattr(state, "player_fuel_in_tank", None)
-            fuel_remaining_laps = getattr(state, "player_fuel_remaining_laps", None)
-
-            wear_fl = getattr(state, "player_wear_fl", None)
-            wear_fr = getattr(state, "player_wear_fr", None)
-            wear_rl = getattr(state, "player_wear_rl", None)
-            wear_rr = getattr(state, "player_wear_rr", None)
+            tyre = tyre_compound or tyre_class
 
             # ---- minisector completion ----
             complete = int(bool(lap.get("complete")))
             missing = lap.get("missing") or []
             missing_str = ",".join(str(x) for x in missing)
 
-            minis = (lap.get("minis") or [])
+            splits = lap.get("split_ms") or []
+            estimated = lap.get("estimated") or []
             total_minis = int(lap.get("total_minis") or 30)
 
-            ms_map: dict[int, int | str] = {}
+            # Whole CSV row allocated once: fixed metadata cells first, then MS01..MSnn.
+            # Minisector cells are written in place (index _MS_CSV_FIXED + i for MS(i+1)); unknown -> ""
+            row = [""] * (_MS_CSV_FIXED + total_minis)
             minis_sum = 0
             ms01_estimated = 0
 
-            for m in minis:
-                no = m.get("ms_no")
-                v = m.get("split_ms")
-                est = bool(m.get("estimated"))
-
-                if no is None:
+            for i, v in enumerate(splits[:total_minis]):
+                if v is None:
                     continue
+                iv = int(v)
 
-                if v is None:
-                    ms_map[int(no)] = ""
+                # Mark only MS01 with '*' (visual hint in CSV).
+                if i == 0 and estimated and estimated[0]:
+                    ms01_estimated = 1
+                    row[_MS_CSV_FIXED] = f"{iv}*"
                 else:
-                    iv = int(v)
-
-                    # Mark only MS01 with '*' (visual hint in CSV).
-                    if est and int(no) == 1:
-                        ms01_estimated = 1
-                        ms_map[int(no)] = f"{iv}*"
-                    else:
-                        ms_map[int(no)] = iv
+                    row[_MS_CSV_FIXED + i] = "%d" % iv
 
-                    minis_sum += iv
+                minis_sum += iv
 
             # ---- Minisector debug dump + sanity check (per lap snapshot) ----
             try:
-                tl = getattr(state, "track_length_m", None)
-                s2m = getattr(state, "sector2_start_m", None)
-                s3m = getattr(state, "sector3_start_m", None)
-
                 # Compact one-liner dump (good for scanning app.log)
                 miss_txt = ("none" if not missing else ",".join(str(x) for x in missing))
                 self.logger.info(
@@ -1244,98 +1657,102 @@ class MainWindow(QtWidgets.QMainWindow):
                 # Never break lap writing due to debug tooling
                 pass
 
-            ms_cols = [f"MS{n:02d}_ms" for n in range(1, total_minis + 1)]
-
             # ---- game label (best-effort) ----
             game_label = "F1 25"
             try:
-                if int(getattr(state, "game_year", 25)) == 20:
+                if int(gy if gy is not None else 25) == 20:
                     game_label = "F1 2020"
             except Exception:
                 pass
 
-            cols = [
-                "created_at_utc",
-                "game",
-                "session",
-                "session_uid",
-                "team",
-                "track_id",
-                "track",
-                "lap_num",
-                "lap_time_ms",
-                "sector1_ms",
-                "sector2_ms",
-                "sector3_ms",
-                "tyre_cat",
-                "tyre_class",
-                "weather_enum",
-                "rain_now_pct",
-                "rain_fc_pct",
-                "safety_car_status",
-                "track_flag",
-                "player_fia_flag",
-
-                "fuel_in_tank",
-                "fuel_remaining_laps",
-                "wear_fl_pct",
-                "wear_fr_pct",
-                "wear_rl_pct",
-                "wear_rr_pct",
-                "ms01_estimated",
-                "complete",
-                "missing_minisectors",
-                "minis_sum_ms",
-                *ms_cols,
-            ]
-
-            row = [
-                ts_utc.isoformat(timespec="seconds"),
-                game_label,
-                session_label,
-                str(sess_uid),
-                str(team),
-                "" if track_id is None else int(track_id),
-                track_label,
-                "" if lap_num is None else int(lap_num),
-                "" if lap_time_ms is None else int(lap_time_ms),
-                "" if s1 is None else int(s1),
-                "" if s2 is None else int(s2),
-                "" if s3 is None else int(s3),
-                "" if tyre is None else str(tyre),
-                "" if weather is None else int(weather),
-                "" if weather is None else int(weather),
-                "" if rain_now is None else int(rain_now),
-                "" if rain_fc is None else int(rain_fc),
-                "" if sc is None else int(sc),
-                "" if track_flag is None else int(track_flag),
-                "" if player_flag is None else int(player_flag),
+            # Row is formatted straight to text (numbers need no quoting; free-text cells go through _csv_text).
+            row[:_MS_CSV_FIXED] = (
+                ts_iso,
+                _csv_text(game_label),
+                _csv_text(session_label),
+                _csv_text(sess_uid),
+                _csv_text(team),
+                _csv_num(track_id),
+                _csv_text(track_label),
+                _csv_num(lap_num),
+                _csv_num(lap_time_ms),
+                _csv_num(s1),
+                _csv_num(s2),
+                _csv_num(s3),
+                _csv_text(tyre),
+                _csv_num(weather),
+                _csv_num(weather),
+                _csv_num(rain_now),
+                _csv_num(rain_fc),
+                _csv_num(sc),
+                _csv_num(track_flag),
+                _csv_num(player_flag),
 
                 # NEW:
-                "" if fuel_in_tank is None else float(fuel_in_tank),
-                "" if fuel_remaining_laps is None else float(fuel_remaining_laps),
-                "" if wear_fl is None else float(wear_fl),
-                "" if wear_fr is None else float(wear_fr),
-                "" if wear_rl is None else float(wear_rl),
-                "" if wear_rr is None else float(wear_rr),
-
-                complete,
-                missing_str,
-                minis_sum,
-            ]
+                _csv_num(fuel_in_tank, "%.3f"),
+                _csv_num(fuel_remaining_laps, "%.3f"),
+                _csv_num(wear_fl, "%.3f"),
+                _csv_num(wear_fr, "%.3f"),
+                _csv_num(wear_rl, "%.3f"),
+                _csv_num(wear_rr, "%.3f"),
+
+                "%d" % ms01_estimated,
+                "%d" % complete,
+                _csv_text(missing_str),
+                "%d" % minis_sum,
+            )
+
+            line = ",".join(row) + _CSV_EOL
 
-            for n in range(1, total_minis + 1):
-                row.append(ms_map.get(n, ""))
+            if not one_file_per_session:
+                with out_path.open("w", newline="", encoding="utf-8") as f:
+                    f.write(_ms_csv_header(total_minis))
+                    f.write(line)
+                return
 
-            with out_path.open("w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(cols)
-                w.writerow(row)
+            f = self._ms_csv_handle(out_path)
+            key = str(out_path)
+            if key not in self._csv_header_paths:
+                # existing file (app restart within the same session) already has its header
+                if f.tell() == 0:
+                    f.write(_ms_csv_header(total_minis))
+                self._csv_header_paths.add(key)
+            f.write(line)
+            # Laps arrive ~1/min: flush each row so the output watcher sees it right away.
+            f.flush()
 
         except Exception:
             # Never break live loop
             pass
 
+    def _set_label(self, lbl: QtWidgets.QLabel, key: str, line: str) -> None:
+        """setText only if the text changed since our last update of this label."""
+        if self._last_label_text.get(key) == line:
+            return
+        self._last_label_text[key] = line
+        lbl.setText(line)
+
+    def _fc_flat(self, series) -> tuple[list[int], list[int]]:
+        """
+        Split the UDP forecast series [(timeOffsetMin, rain%, weather), ...] into two flat lists
+        sorted by time. The session packet publishes a fresh list per update, so we cache by identity.
+        """
+        if series is self._fc_flat_src:
+            return self._fc_flat_cache
+
+        pairs = []
+        for tup in series:
+            try:
+                tm, pct, _w = tup
+                pairs.append((int(tm), int(pct)))  # forecast time offset is minute-based (int in UDP feed)
+            except Exception:
+                continue
+        pairs.sort(key=lambda x: x[0])
+
+        self._fc_flat_src = series
+        self._fc_flat_cache = ([t for t, _ in pairs], [p for _, p in pairs])
+        return self._fc_flat_cache
+
     @QtCore.Slot()
     def _update_live_labels(self):
         try:
@@ -1381,8 +1798,7 @@ class MainWindow(QtWidgets.QMainWindow):
             ).format(track=_flag_text(track_flag), you=_flag_text(player_flag))
 
             sc_line = self.tr.t("live.sc_fmt", "SC/VSC: {status}").format(status=sc_text) + flags_suffix
-            if self.lblSC.text() != sc_line:
-                self.lblSC.setText(sc_line)
+            self._set_label(self.lblSC, "sc", sc_line)
 
             # --- Weather as human-readable text (0..5 -> label) ---
             def _weather_text(w: int | None) -> str:
@@ -1409,8 +1825,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 weather_txt = f"{weather_txt} (enum:{weather})"
 
             weather_line = self.tr.t("live.weather_fmt", "Weather: {w}").format(w=weather_txt)
-            if self.lblWeather.text() != weather_line:
-                self.lblWeather.setText(weather_line)
+            self._set_label(self.lblWeather, "weather", weather_line)
 
             # --- Forecast helper (display only) ---
             # We want a "Next lap" horizon derived from estimated lap time, but our forecast samples are minute-based.
@@ -1434,34 +1849,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     r -= 60
                 return f"{m}:{r:02d}"
 
-            def _fc_nearest(series, tmin_float: float):
-                """
-                Nearest-sample forecast lookup:
-                returns the rain% of the sample whose timeOffset (minutes) is closest to tmin_float.
-                If series is empty -> None.
-                """
-                if not series:
-                    return None
-
-                best_pct = None
-                best_dist = None
-
-                for tup in series:
-                    try:
-                        tm, pct, _w = tup
-                        tm_i = int(tm)  # forecast time offset is minute-based (int in UDP feed)
-                        pct_i = int(pct)  # rain %
-                    except Exception:
-                        continue
-
-                    dist = abs(float(tm_i) - float(tmin_float))
-                    if best_dist is None or dist < best_dist:
-                        best_dist = dist
-                        best_pct = pct_i
-
-                return best_pct
-
-            fc = getattr(state, "rain_fc_series", None) or []
+            fc_times, fc_pcts = self._fc_flat(getattr(state, "rain_fc_series", None) or [])
 
             # --- estimate lap time ---
             # Prefer the app's known "your last lap" estimate if available.
@@ -1487,7 +1875,7 @@ class MainWindow(QtWidgets.QMainWindow):
             horizons = [("NL", next_lap_min), ("3", 3.0), ("5", 5.0), ("10", 10.0), ("15", 15.0), ("20", 20.0)]
             fc_list = []
             for _label, tmin in horizons:
-                v = _fc_nearest(fc, tmin)
+                v = _fc_nearest(fc_times, fc_pcts, tmin)
                 if v is None:
                     fc_list.append(self.tr.t("common.na", "n/a"))
                 else:
@@ -1508,8 +1896,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 fc=fc_txt
             )
 
-            if self.lblRain.text() != rain_line:
-                self.lblRain.setText(rain_line)
+            self._set_label(self.lblRain, "rain", rain_line)
 
             # --- Rain pit advice (WIP) ---
             try:
@@ -1554,13 +1941,14 @@ class MainWindow(QtWidgets.QMainWindow):
                     track = ""
 
             # DB rows: nicht jedes UI-Tick neu laden -> simple cache
+            # Reload runs on the thread pool; until it lands we keep using the previous rows.
             db_rows_list = None
             try:
                 if track:
-                    if getattr(self, "_db_cache_track", None) != track:
-                        self._db_cache_track = track
-                        self._db_cache_rows = laps_for_track(track, limit=5000)
-                    db_rows_list = getattr(self, "_db_cache_rows", None)
+                    if self._db_cache_track != track and not self._db_reload_in_flight:
+                        self._db_reload_in_flight = True
+                        QtCore.QThreadPool.globalInstance().start(lambda t=track: self._reload_db_cache(t))
+                    db_rows_list = self._db_cache_rows
             except Exception:
                 db_rows_list = None
 
@@ -1595,54 +1983,64 @@ class MainWindow(QtWidgets.QMainWindow):
                 reason=ad.reason
             )
 
-            if self.lblRainAdvice.text() != advice_line:
-                self.lblRainAdvice.setText(advice_line)
+            self._set_label(self.lblRainAdvice, "rain_advice", advice_line)
 
             # WIP/DEBUG UI: verbose internal diagnostics (can be noisy; shown for dev visibility).
             self.status.showMessage(out.debug)
 
             # --- Field signals (share + pace deltas) ---
-            if state.inter_share is None or state.inter_count is None or state.slick_count is None:
-                share_line = self.tr.t("live.field_share_na", "Field: Inter/Wet share: n/a")
-
-            else:
-                total = int(getattr(state, "field_total_cars", (state.inter_count + state.slick_count)))
-                unk = getattr(state, "unknown_tyre_count", 0)
-                share_line = self.tr.t(
-                    "live.field_share_fmt",
-                    "Field: Inter/Wet share: {pct:.0f}% ({inter}/{total})  unk:{unk}"
-                ).format(pct=state.inter_share * 100.0, inter=state.inter_count, total=total, unk=unk)
-
-            if self.lblFieldShare.text() != share_line:
-                self.lblFieldShare.setText(share_line)
-
-            # WIP/TELEMETRY SIGNAL (field-level pace):
-            if state.pace_delta_inter_vs_slick_s is None:
-                field_line = self.tr.t("live.field_delta_na", "Field: Δpace (I-S): n/a")
-            else:
-                field_line = self.tr.t(
-                    "live.field_delta_fmt",
-                    "Field: Δpace (I-S): {delta:+.2f}s"
-                ).format(delta=state.pace_delta_inter_vs_slick_s)
-
-            # WIP/LEARNING SIGNAL (player-specific):
-            rc = getattr(state, "your_ref_counts", None) or "S:0 I:0 W:0"
-            yd = getattr(state, "your_delta_inter_vs_slick_s", None)
-            yw = getattr(state, "your_delta_wet_vs_slick_s", None)
-
-            if yd is None and yw is None:
-                your_line = self.tr.t("live.your_delta_na_fmt", "Your: Δ(I-S): n/a ({rc})").format(rc=rc)
+            # Unchanged inputs (the idle case) -> reuse the last composed lines.
+            field_key = (
+                state.inter_share, state.inter_count, state.slick_count, state.field_total_cars,
+                state.unknown_tyre_count, state.pace_delta_inter_vs_slick_s,
+                state.your_delta_inter_vs_slick_s, state.your_delta_wet_vs_slick_s, state.your_ref_counts,
+            )
+            if field_key == self._last_field_key:
+                share_line, txt = self._last_field_txt
             else:
-                parts = []
-                if yd is not None:
-                    parts.append(self.tr.t("live.your_part_is_fmt", "Δ(I-S) {d:+.2f}s").format(d=yd))
-                if yw is not None:
-                    parts.append(self.tr.t("live.your_part_ws_fmt", "Δ(W-S) {d:+.2f}s").format(d=yw))
-                your_line = self.tr.t("live.your_prefix", "Your: ") + ", ".join(parts) + f" ({rc})"
+                if state.inter_share is None or state.inter_count is None or state.slick_count is None:
+                    share_line = self.tr.t("live.field_share_na", "Field: Inter/Wet share: n/a")
 
-            txt = field_line + "\n" + your_line
-            if self.lblFieldDelta.text() != txt:
-                self.lblFieldDelta.setText(txt)
+                else:
+                    total = state.field_total_cars
+                    if total is None:
+                        total = state.inter_count + state.slick_count
+                    unk = state.unknown_tyre_count or 0
+                    share_line = self.tr.t(
+                        "live.field_share_fmt",
+                        "Field: Inter/Wet share: {pct:.0f}% ({inter}/{total})  unk:{unk}"
+                    ).format(pct=state.inter_share * 100.0, inter=state.inter_count, total=total, unk=unk)
+
+                # WIP/TELEMETRY SIGNAL (field-level pace):
+                if state.pace_delta_inter_vs_slick_s is None:
+                    field_line = self.tr.t("live.field_delta_na", "Field: Δpace (I-S): n/a")
+                else:
+                    field_line = self.tr.t(
+                        "live.field_delta_fmt",
+                        "Field: Δpace (I-S): {delta:+.2f}s"
+                    ).format(delta=state.pace_delta_inter_vs_slick_s)
+
+                # WIP/LEARNING SIGNAL (player-specific):
+                rc = state.your_ref_counts or "S:0 I:0 W:0"
+                yd = state.your_delta_inter_vs_slick_s
+                yw = state.your_delta_wet_vs_slick_s
+
+                if yd is None and yw is None:
+                    your_line = self.tr.t("live.your_delta_na_fmt", "Your: Δ(I-S): n/a ({rc})").format(rc=rc)
+                else:
+                    parts = []
+                    if yd is not None:
+                        parts.append(self.tr.t("live.your_part_is_fmt", "Δ(I-S) {d:+.2f}s").format(d=yd))
+                    if yw is not None:
+                        parts.append(self.tr.t("live.your_part_ws_fmt", "Δ(W-S) {d:+.2f}s").format(d=yw))
+                    your_line = self.tr.t("live.your_prefix", "Your: ") + ", ".join(parts) + f" ({rc})"
+
+                txt = field_line + "\n" + your_line
+                self._last_field_key = field_key
+                self._last_field_txt = (share_line, txt)
+
+            self._set_label(self.lblFieldShare, "field_share", share_line)
+            self._set_label(self.lblFieldDelta, "field_delta", txt)
 
         except Exception as e:
             try:
@@ -1651,6 +2049,31 @@ class MainWindow(QtWidgets.QMainWindow):
                 pass
             print("[UI UPDATE ERROR]", type(e).__name__, e)
 
+    def _init_minisector_headers(self):
+        """Create the SECTOR 1/2/3 header rows of tblMini (static, not touched by refreshes)."""
+        header_rows = {0: "SECTOR 1", 11: "SECTOR 2", 22: "SECTOR 3"}
+        bg = QtGui.QColor(35, 35, 35)
+        fg = QtGui.QColor(220, 220, 220)
+        align = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter
+
+        self._mini_header_items = []
+        for hr, title in header_rows.items():
+            self.tblMini.setRowHeight(hr, 22)
+            for c in range(5):
+                txt = title if c == 0 else ""
+                it = QtWidgets.QTableWidgetItem(txt)
+                it.setFlags(QtCore.Qt.ItemFlag.NoItemFlags)
+                it.setBackground(bg)
+                it.setForeground(fg)
+                it.setTextAlignment(align)
+                f = it.font()
+                f.setBold(True)
+                it.setFont(f)
+                self.tblMini.setItem(hr, c, it)
+                self._mini_header_items.append(it)
+
+        self._mini_headers_init = True
+
     @QtCore.Slot()
     def _update_minisector_table(self):
         try:
@@ -1660,42 +2083,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
             cur_mi = self.ms.current_index()
 
-            # Layout rows (NO gaps):
-            # 0      : SECTOR 1 header
-            # 1-10   : minis 0..9
-            # 11     : SECTOR 2 header
-            # 12-21  : minis 10..19
-            # 22     : SECTOR 3 header
-            # 23-32  : minis 20..29
-            def mini_to_table_row(mi: int) -> int:
-                if mi < 10:
-                    return 1 + mi
-                if mi < 20:
-                    return 12 + (mi - 10)
-                return 23 + (mi - 20)
-
-            header_rows = {0: "SECTOR 1", 11: "SECTOR 2", 22: "SECTOR 3"}
+            # Layout rows: see _MINI_ROW (sector headers at 0/11/22)
 
             # Ensure table has correct row count
             if self.tblMini.rowCount() != 33:
                 self.tblMini.setRowCount(33)
+                self._mini_headers_init = False
 
-            # Paint header rows
-            for hr, title in header_rows.items():
-                self.tblMini.setRowHeight(hr, 22)
-                for c in range(5):
-                    txt = title if c == 0 else ""
-                    it = QtWidgets.QTableWidgetItem(txt)
-                    it.setFlags(QtCore.Qt.ItemFlag.NoItemFlags)
-                    it.setBackground(QtGui.QColor(35, 35, 35))
-                    it.setForeground(QtGui.QColor(220, 220, 220))
-                    it.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-                    f = it.font()
-                    f.setBold(True)
-                    it.setFont(f)
-                    self.tblMini.setItem(hr, c, it)
-
-            cur_row = mini_to_table_row(cur_mi) if cur_mi is not None else None
+            # Header rows are static -> paint once
+            if not self._mini_headers_init:
+                self._init_minisector_headers()
+
+            cur_row = self._MINI_ROW[cur_mi] if cur_mi is not None else None
 
             def fmt(ms, est: bool = False):
                 """Format milliseconds as seconds text, with optional '*' marker for estimated values."""
@@ -1704,13 +2103,19 @@ class MainWindow(QtWidgets.QMainWindow):
                 txt = f"{ms / 1000.0:.3f}"
                 return f"{txt}*" if est else txt
 
+            # --- COLORS (column based), shared class constants ---
+            PURPLE = self._MINI_PURPLE
+            GREEN = self._MINI_GREEN
+            YELLOW = self._MINI_YELLOW
+            NEUTRAL = self._MINI_NEUTRAL
+            bold_font = self._mini_bold_font
+            norm_font = self._mini_norm_font
+
             def set_readable_text_color(item: QtWidgets.QTableWidgetItem, bg: QtGui.QColor):
-                # perceived luminance (0..255)
-                lum = 0.2126 * bg.red() + 0.7152 * bg.green() + 0.0722 * bg.blue()
-                item.setForeground(QtGui.QColor(0, 0, 0) if lum > 140 else QtGui.QColor(255, 255, 255))
+                item.setForeground(_readable_fg(bg.rgb()))
 
             for mi, r in enumerate(rows):
-                i = mini_to_table_row(mi)
+                i = self._MINI_ROW[mi]
 
                 sector = (mi // 10) + 1
 
@@ -1735,22 +2140,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 # grün = personal best (pb_ms)
                 # gelb = slower than PB
                 # (for now best==pb, later best can be "field best")
-                bg = None
-                if r.last_ms is None:
-                    bg = QtGui.QColor(45, 45, 45)  # dark neutral
-                else:
-                    if r.best_ms is not None and r.last_ms == r.best_ms:
-                        bg = QtGui.QColor(160, 32, 240)  # purple
-                    elif r.pb_ms is not None and r.last_ms == r.pb_ms:
-                        bg = QtGui.QColor(0, 255, 0)  # green (WIP, not tested yet)
-                    else:
-                        bg = QtGui.QColor(255, 239, 0)  # yellow
-
-                # --- COLORS (column based) ---
-                PURPLE = QtGui.QColor(160, 32, 240)
-                GREEN = QtGui.QColor(0, 255, 0)
-                YELLOW = QtGui.QColor(255, 239, 0)
-                NEUTRAL = QtGui.QColor(45, 45, 45)
 
                 # 1) base color for Minisector + Last (keep your old logic)
                 # keep EXACT behavior: purple if last==best, green if last==pb else yellow, neutral if none
@@ -1799,42 +2188,30 @@ class MainWindow(QtWidgets.QMainWindow):
                 # highlight current minisector row (blue + bold)
                 is_cur = (cur_row is not None and i == cur_row)
                 if is_cur:
-                    cur_bg = QtGui.QColor(60, 90, 140)  # blue-ish
+                    cur_bg = self._MINI_CURRENT  # blue-ish
                     for c in (0, 1):
                         it = self.tblMini.item(i, c)
                         if not it:
                             continue
                         it.setBackground(cur_bg)
                         set_readable_text_color(it, cur_bg)
-                        f = it.font()
-                        f.setBold(True)
-                        it.setFont(f)
+                        it.setFont(bold_font)
                 else:
                     # ensure non-current rows are not bold (so it doesn't "stick")
                     for c in (0, 1):
                         it = self.tblMini.item(i, c)
                         if not it:
                             continue
-                        f = it.font()
-                        f.setBold(False)
-                        it.setFont(f)
+                        it.setFont(norm_font)
 
             # --- Theo lap times from minisectors ---
-            def fmt_lap(ms_total: int | None) -> str:
-                if ms_total is None:
-                    return "—"
-                s = ms_total / 1000.0
-                m = int(s // 60)
-                ss = s - 60 * m
-                return f"{m}:{ss:06.3f}"
-
             t_last = self.ms.sum_last_ms_current()
             t_pb = self.ms.sum_pb_ms()
             t_best = self.ms.sum_best_ms()
 
-            self.lblTheoLast.setText(f"Theo Last: {fmt_lap(t_last)}")
-            self.lblTheoPB.setText(f"Theo PB: {fmt_lap(t_pb)}")
-            self.lblTheoBest.setText(f"Theo Best: {fmt_lap(t_best)}")
+            self.lblTheoLast.setText(f"Theo Last: {_fmt_lap_ms(t_last)}")
+            self.lblTheoPB.setText(f"Theo PB: {_fmt_lap_ms(t_pb)}")
+            self.lblTheoBest.setText(f"Theo Best: {_fmt_lap_ms(t_best)}")
 
             missing = self.ms.missing_current_indices()
             if missing:
@@ -1863,7 +2240,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # ---- DEDUPE: gleiche Datei (create/modify) nur 1x verarbeiten ----
         try:
             stat = cached.stat()
-            sig = (stat.st_size, stat.st_mtime_ns)
+            sig = _file_sig(cached, stat.st_size)
         except Exception:
             return
 
@@ -1876,12 +2253,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self._dedupe_mtime[key] = sig
 
         # Cooldown entfernt: watcher.copy_to_cache() wartet bereits auf stabile Dateigröße.
-        # Doppel-Events werden durch (size, mtime_ns) dedupe abgefangen.
+        # Doppel-Events werden durch (size, head hash) dedupe abgefangen (see _file_sig).
         #
         # Legacy optional cooldown (kept for reference):
         # - Was used to suppress duplicate FS events via a 1s time-based gate.
         # - Currently disabled because copy_to_cache() already waits for a stable file size
-        #   and we additionally dedupe by (size, mtime_ns) above.
+        #   and we additionally dedupe by (size, head hash) above.
         #
         # Example (disabled):
         #   now = time.time()
@@ -1903,8 +2280,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # -------------------------------------------------------------------
 
-        name = src.stem.lower()
-        if "_tt_" in name or name.endswith("_tt") or name.startswith("tt_"):
+        if _RE_TT.search(src.stem):
             self.logger.info(f"Skipped (time trial): {src.name}")
             return
 
@@ -1919,10 +2295,25 @@ class MainWindow(QtWidgets.QMainWindow):
             self._health["csv"]["last_file"] = src.name
             self._health["csv"]["ts"] = self._health_now_str()
             self._health["csv"]["err"] = ""
-            self._refresh_health_panel()
+            self._schedule_health_refresh()
         except Exception:
             pass
 
+        # Parse + DB write on the import pool (keeps the watcher thread free for the next event),
+        # from a snapshot: the next event for this src rewrites `cached` while the pool reads
+        try:
+            snapshot = _import_snapshot(cached)
+        except Exception as e:
+            self.logger.error(f"IMPORT FAILED for {src.name}: snapshot: {type(e).__name__}: {e}")
+            self._dedupe_mtime.pop(key, None)  # not imported -> let the next event retry
+            return
+        self._csv_pool.start(CsvImportTask(self, src, snapshot, session, stat.st_mtime_ns))
+
+    def _import_csv(self, src: Path, cached: Path, session: str, mtime_ns: int) -> None:
+        """
+        Import one watched CSV into DB (runs on self._csv_pool, see CsvImportTask).
+        Own UDP lap CSV format first, legacy Iko/Overtake CSV otherwise.
+        """
         try:
             # 1) NEW: try your own UDP lap CSV format first
             if self._import_own_udp_lap_csv(src, cached):
@@ -1931,25 +2322,24 @@ class MainWindow(QtWidgets.QMainWindow):
                     self._health["csv"]["status"] = "OK"
                     self._health["csv"]["ts"] = self._health_now_str()
                     self._health["csv"]["err"] = ""
-                    self._refresh_health_panel()
+                    self._schedule_health_refresh()
                 except Exception:
                     pass
 
-                QtCore.QMetaObject.invokeMethod(self, "_after_db_update", QtCore.Qt.QueuedConnection)
+                self._queue_after_db_update()
                 return
 
-            # 2) legacy: Iko/Overtake CSV import (unchanged)
-            parsed = parse_overtake_csv(cached)
+            # 2) legacy: Iko/Overtake CSV import (meta blocks + last telemetry row only, no DataFrame)
+            parsed = parse_overtake_csv_summary(cached)
             summ = lap_summary(parsed)
             try:
-                self._your_last_lap_s = float(summ.get("lap_time_s")) if summ.get("lap_time_s") is not None else None
+                last_lap_s = float(summ.get("lap_time_s")) if summ.get("lap_time_s") is not None else None
             except Exception:
-                self._your_last_lap_s = None
+                last_lap_s = None
 
-            self._your_last_tyre = (summ.get("tyre") or None)
-            self._your_last_track = (summ.get("track") or None)
-            self.logger.info(
-                f"[PLAYER] last_lap={self._your_last_lap_s} tyre={self._your_last_tyre} track={self._your_last_track}")
+            # pool thread: handed to the UI thread via _after_db_update (see _your_last_loaded)
+            self._your_last_loaded = (last_lap_s, summ.get("tyre") or None, summ.get("track") or None)
+            self.logger.info("[PLAYER] last_lap={} tyre={} track={}".format(*self._your_last_loaded))
 
             if not isinstance(summ, dict):
                 raise ValueError("lap_summary did not return a dict")
@@ -1966,7 +2356,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if sess_uid is None:
                 # Fallback: use file timestamp (seconds) as run id so new race doesn't merge into NULL bucket
                 # This is stable enough to separate sessions and avoids "lap continues from previous race".
-                sess_uid = int(stat.st_mtime_ns // 1_000_000_000)
+                sess_uid = int(mtime_ns // 1_000_000_000)
 
             summ["session_uid"] = str(sess_uid)
 
@@ -1983,11 +2373,11 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._health["csv"]["status"] = "OK"
                 self._health["csv"]["ts"] = self._health_now_str()
                 self._health["csv"]["err"] = ""
-                self._refresh_health_panel()
+                self._schedule_health_refresh()
             except Exception:
                 pass
 
-            QtCore.QMetaObject.invokeMethod(self, "_after_db_update", QtCore.Qt.QueuedConnection)
+            self._queue_after_db_update()
 
         except Exception as e:
 
@@ -2006,7 +2396,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._health["csv"]["last_file"] = src.name
                 self._health["csv"]["ts"] = self._health_now_str()
                 self._health["csv"]["err"] = reason
-                self._refresh_health_panel()
+                self._schedule_health_refresh()
 
             except Exception:
                 pass
@@ -2017,8 +2407,47 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtCore.Q_ARG(int, 12000),
             )
 
+    def _reload_db_cache(self, track: str) -> None:
+        """Thread-pool worker: load RainEngine DB rows for track, then hand them to the UI thread."""
+        try:
+            rows = laps_for_track(track, limit=5000)
+        except Exception as e:
+            self.logger.error(f"DB CACHE reload failed for {track}: {type(e).__name__}: {e}")
+            rows = None
+        self._db_cache_loaded = (track, rows)
+        QtCore.QMetaObject.invokeMethod(self, "_apply_db_cache", QtCore.Qt.QueuedConnection)
+
+    @QtCore.Slot()
+    def _apply_db_cache(self):
+        loaded = self._db_cache_loaded
+        self._db_cache_loaded = None
+        self._db_reload_in_flight = False
+        if loaded is None:
+            return
+        # Swap in one go; if the track changed meanwhile the next tick starts another reload.
+        self._db_cache_track, self._db_cache_rows = loaded
+
+    def _queue_after_db_update(self) -> None:
+        """
+        Post _after_db_update to the UI thread (callable from any thread).
+        Bursts of lap commits / imports collapse into one refresh: only the first call posts.
+        """
+        if self._after_db_pending:
+            return
+        self._after_db_pending = True
+        QtCore.QMetaObject.invokeMethod(self, "_after_db_update", QtCore.Qt.QueuedConnection)
+
     @QtCore.Slot()
     def _after_db_update(self):
+        # Clear first so commits landing during the refresh below queue another one.
+        self._after_db_pending = False
+
+        # Last lap/tyre/track from a CSV import (set on the pool thread, see _your_last_loaded)
+        loaded = self._your_last_loaded
+        if loaded is not None:
+            self._your_last_loaded = None
+            self._your_last_lap_s, self._your_last_tyre, self._your_last_track = loaded
+
         # Health: DB refresh happened (NOTE: real DB write OK/FAIL is marked at the write site)
         # Keep this as a lightweight "we refreshed views" hint, but do not overwrite FAIL.
         try:
@@ -2032,132 +2461,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.status.showMessage("DB updated from new CSV.", 2500)
 
     def _refresh_db_views(self):
-        rows = latest_laps(800)
-
-        def wear_avg(row):
-            vals = [row[9], row[10], row[11], row[12]]
-            vals = [v for v in vals if v is not None]
-            return (sum(vals) / len(vals)) if vals else None
-
-        # Gruppieren nach (game, track, session) → damit Boxenstopp über Tyre-Wechsel erkannt wird
-        by_group = {}
-        for i, row in enumerate(rows):
-            key = (row[1], row[2], row[3], row[4])  # (game, track, session, session_uid)
-
-            by_group.setdefault(key, []).append(i)
-
-        lapno = {}  # row_index -> lap number
-
-        tags = ["OK"] * len(rows)
-
-        WEAR_DROP_THR = 2.0
-        OUTLIER_SEC = 2.0
-
-        # ---- Compute lap numbers + tags per (game, track, session, session_uid) ----
-        for idxs in by_group.values():
-            # rows sind newest-first → für Lapnummern umdrehen
-            idxs = sorted(idxs, key=lambda j: rows[j][0])
-
-            # Lapnummern
-            for n, j in enumerate(idxs, start=1):
-                lapno[j] = n
-
-            # Wear-Drop → IN / OUT
-            def wear_avg_idx(j):
-                vals = [rows[j][9], rows[j][10], rows[j][11], rows[j][12]]
-                vals = [v for v in vals if v is not None]
-                return (sum(vals) / len(vals)) if vals else None
-
-            w = [wear_avg_idx(j) for j in idxs]
-
-            for k in range(1, len(idxs)):
-                if w[k - 1] is None or w[k] is None:
-                    continue
-                if (w[k - 1] - w[k]) > WEAR_DROP_THR:
-                    tags[idxs[k - 1]] = "IN"
-                    tags[idxs[k]] = "OUT"
-
-            # --- Time outliers → SHIFT / SLOW (per-tyre ONLY; no cross-tyre fallback!) ---
-            SHIFT_SEC = 1.2  # moderate outlier vs normal pace on same tyre
-            SLOW_SEC = 6.0  # big outlier (ERS recharge etc.) on same tyre
-
-            # Collect lap times per tyre (ignore IN/OUT)
-            times_by_tyre: dict[str, list[float]] = {}
-
-            for j in idxs:
-                if tags[j] in ("IN", "OUT"):
-                    continue
-
-                t = rows[j][7]  # lap_time_s
-                tyre = rows[j][5]  # tyre
-                if t is None or tyre is None:
-                    continue
-
-                try:
-                    tf = float(t)
-                except Exception:
-                    continue
-
-                if not (10.0 < tf < 400.0):
-                    continue
-
-                tyre_key = str(tyre).strip().upper()
-                times_by_tyre.setdefault(tyre_key, []).append(tf)
-
-            def median(ts: list[float]) -> float:
-                s = sorted(ts)
-                return s[len(s) // 2]
-
-            # Baseline per tyre: if not enough samples, DON'T tag that tyre at all
-            baseline: dict[str, float] = {}
-            for tyre_key, ts in times_by_tyre.items():
-                if len(ts) >= 3:
-                    baseline[tyre_key] = median(ts)
-
-            # Apply tagging per tyre
-            for j in idxs:
-                if tags[j] != "OK":
-                    continue
-
-                t = rows[j][7]
-                tyre = rows[j][5]
-                if t is None or tyre is None:
-                    continue
-
-                try:
-                    tf = float(t)
-                except Exception:
-                    continue
-
-                tyre_key = str(tyre).strip().upper()
-                base = baseline.get(tyre_key)
-                if base is None:
-                    continue  # <3 laps on this tyre → do NOT tag (prevents "Inter slower than Slick" false SLOW)
-
-                if tf > base + SLOW_SEC:
-                    tags[j] = "SLOW"
-                elif tf > base + SHIFT_SEC:
-                    tags[j] = "SHIFT"
-
-        # Tabelle rendern
-        self.tbl.setRowCount(len(rows))
-        for r, row in enumerate(rows):
-            # col 0: lap number
-            lap_item = QtWidgets.QTableWidgetItem(str(lapno.get(r, "")))
-            self.tbl.setItem(r, 0, lap_item)
-
-            # cols 1...: original db columns (BUT hide session_uid from display)
-            # row indices now: 0 created_at,1 game,2 track,3 session,4 session_uid,5 tyre,6 weather,7 lap_time_s,8 fuel,9..12 wear
-            # display_row = row[:4] + row[5:]  # remove session_uid
-            display_row = row[:5] + row[5:]
+        # Unchanged DB files -> the model already shows the cached rows/lap numbers/tags
+        try:
+            sig = db_signature()
+        except Exception:
+            sig = None
+        if sig is not None and self._views_cache[0] == sig:
+            return
 
-            for c, val in enumerate(display_row):
-                item = QtWidgets.QTableWidgetItem("" if val is None else str(val))
-                self.tbl.setItem(r, c + 1, item)
+        rows = latest_laps(800)
+        self._views_cache = (sig, rows)
 
-            # last col: lap_tag
-            tag_item = QtWidgets.QTableWidgetItem(tags[r])
-            self.tbl.setItem(r, len(display_row) + 1, tag_item)
+        # Tabelle rendern: the model formats cells lazily (col 0 lap number, then DB columns, last col lap tag);
+        # lap numbers/tags are only computed once a lap/tag cell is actually painted.
+        # row indices: 0 created_at,1 game,2 track,3 session,4 session_uid,5 tyre,6 weather,7 lap_time_s,8 fuel,9..12 wear
+        self._laps_model.set_rows(rows, _lap_numbers_and_tags)
 
     def _refresh_track_combo(self):
         try:
@@ -2169,6 +2487,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         self._stop_services()
+        self._csv_pool.waitForDone(3000)
+        self._close_ms_csv()
+        self._close_udp_lap_csvs()
         super().closeEvent(event)
 
     @QtCore.Slot(str)
@@ -2198,7 +2519,6 @@ class MainWindow(QtWidgets.QMainWindow):
         Safe + additive: never throws.
         """
         try:
-            import re
             from app.track_map import track_label_from_id
 
             out_root = (getattr(self.cfg, "udp_output_root", "") or "").strip()
@@ -2206,13 +2526,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
 
             def _safe_fs_name(s: str) -> str:
-                # Windows-illegal: <>:"/\|?*  (plus control chars)
-                s = (s or "").strip()
-                if not s:
-                    return "Unknown"
-                s = re.sub(r'[<>:"/\\\\|?*\\x00-\\x1F]', "_", s)
-                s = s.rstrip(" .")  # Windows: no trailing dot/space
-                return s or "Unknown"
+                # Windows-illegal chars -> "_"; Windows: no trailing dot/space
+                return _FS_ILLEGAL_RE.sub("_", (s or "").strip()).rstrip(" .") or "Unknown"
 
             # Prefer already-resolved track string in row, otherwise derive from track_id if present
             track_name = (row.get("track") or "").strip()
@@ -2221,7 +2536,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
             track_dir_name = _safe_fs_name(track_name)
             track_dir = Path(out_root) / track_dir_name
-            track_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(track_dir)
 
             session_uid = (row.get("session_uid") or "").strip()
             session_uid_safe = _safe_fs_name(session_uid) if session_uid else "unknown_session"
@@ -2243,101 +2558,156 @@ class MainWindow(QtWidgets.QMainWindow):
                 "source",
             ]
 
-            write_header = (not csv_path.exists())
-
-            with csv_path.open("a", newline="", encoding="utf-8") as f:
+            # Kept-open writer per file; a new session file closes the previous one.
+            key = str(csv_path)
+            entry = self._csv_writers.get(key)
+            if entry is None:
+                self._close_udp_lap_csvs()
+                write_header = (not csv_path.exists())
+                f = csv_path.open("a", newline="", encoding="utf-8", buffering=1)  # line-buffered
                 w = csv.DictWriter(f, fieldnames=cols, extrasaction="ignore")
                 if write_header:
                     w.writeheader()
-                w.writerow({k: row.get(k, "") for k in cols})
+                entry = (f, w)
+                self._csv_writers[key] = entry
+
+            entry[1].writerow({k: row.get(k, "") for k in cols})
         except Exception:
             pass
 
-    def _is_own_udp_lap_csv(self, path: Path) -> bool:
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir(parents=True) once per directory per run; lap writers call this every lap."""
+        key = str(path)
+        if key in self._mkdir_cache:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._mkdir_cache.add(key)
+
+    def _close_udp_lap_csvs(self) -> None:
+        writers = self._csv_writers
+        self._csv_writers = {}
+        for f, _w in writers.values():
+            try:
+                f.close()
+            except Exception:
+                pass
+
+    def _is_own_udp_lap_csv(self, head: bytes) -> bool:
         """
-        Detect your custom one-lap wide CSV format (minisectors).
-        Safe/cheap check: only reads the header line.
+        Detect your custom wide CSV format (minisectors) from the first bytes of the file.
+        Safe/cheap check: bytes only, no text decode (our header has both markers within ~360 bytes).
         """
-        try:
-            with path.open("r", encoding="utf-8", newline="") as f:
-                header = f.readline().strip().lower()
-            # strong signals for your format
-            return ("created_at_utc" in header and "minis_sum_ms" in header) or ("ms01_ms" in header)
-        except Exception:
-            return False
+        head = head.lower()
+        # strong signals for your format
+        return (b"created_at_utc" in head and b"minis_sum_ms" in head) or (b"ms01_ms" in head)
 
-    def _import_own_udp_lap_csv(self, src: Path, cached: Path) -> bool:
+    def _upsert_own_udp_lap_row(self, source: str, row: dict) -> tuple[str, str, Optional[float]]:
         """
-        Import your custom UDP lap CSV into DB.
-        Returns True if it was your format and import succeeded (or at least attempted).
+        Upsert one row of your custom UDP lap CSV into DB.
+        Returns (track, tyre, lap_time_s) for the UI "last lap" bookkeeping.
         """
-        if not self._is_own_udp_lap_csv(cached):
-            return False
+        # mandatory-ish fields
+        track = (row.get("track") or "").strip() or "Unknown"
+        session = (row.get("session") or "").strip()  # "P"/"Q"/"R" or ""
+        session_uid = str(row.get("session_uid") or "nosess")
 
+        # lap time
+        lap_time_s = None
         try:
-            with cached.open("r", encoding="utf-8", newline="") as f:
-                r = csv.DictReader(f)
-                row = next(r, None)
-
-            if not row:
-                return True  # recognized format, but empty
+            if row.get("lap_time_ms"):
+                lap_time_s = float(row["lap_time_ms"]) / 1000.0
+        except Exception:
+            lap_time_s = None
 
-            # mandatory-ish fields
-            track = (row.get("track") or "").strip() or "Unknown"
-            session = (row.get("session") or "").strip()  # "P"/"Q"/"R" or ""
-            session_uid = str(row.get("session_uid") or "nosess")
+        tyre = (row.get("tyre_cat") or "").strip()
+        weather = row.get("weather_enum")
 
-            # lap time
-            lap_time_s = None
+        # fuel + wear (optional)
+        def _f(key):
             try:
-                if row.get("lap_time_ms"):
-                    lap_time_s = float(row["lap_time_ms"]) / 1000.0
+                v = row.get(key, "")
+                return None if v in ("", None) else float(v)
             except Exception:
-                lap_time_s = None
+                return None
 
-            tyre = (row.get("tyre_cat") or "").strip()
-            weather = row.get("weather_enum")
+        summ = {
+            "game": (row.get("game") or "F1").strip(),
+            "track": track,
+            "session": session,
+            "session_uid": session_uid,
+            "weather": ("" if weather in ("", None) else str(weather)),
+            "tyre": tyre,
+            "lap_time_s": lap_time_s,
 
-            # fuel + wear (optional)
-            def _f(key):
-                try:
-                    v = row.get(key, "")
-                    return None if v in ("", None) else float(v)
-                except Exception:
-                    return None
-
-            summ = {
-                "game": (row.get("game") or "F1").strip(),
-                "track": track,
-                "session": session,
-                "session_uid": session_uid,
-                "weather": ("" if weather in ("", None) else str(weather)),
-                "tyre": tyre,
-                "lap_time_s": lap_time_s,
-
-                "fuel_load": _f("fuel_in_tank"),
-                "wear_fl": _f("wear_fl_pct"),
-                "wear_fr": _f("wear_fr_pct"),
-                "wear_rl": _f("wear_rl_pct"),
-                "wear_rr": _f("wear_rr_pct"),
-            }
+            "fuel_load": _f("fuel_in_tank"),
+            "wear_fl": _f("wear_fl_pct"),
+            "wear_fr": _f("wear_fr_pct"),
+            "wear_rl": _f("wear_rl_pct"),
+            "wear_rr": _f("wear_rr_pct"),
+        }
 
-            upsert_lap(str(src), summ)
+        upsert_lap(source, summ)
+        return track, tyre, lap_time_s
 
-            # Keep UI NL horizon in sync when importing our own UDP lap CSV format as well.
-            try:
-                self._your_last_lap_s = float(lap_time_s) if lap_time_s is not None else None
-            except Exception:
-                self._your_last_lap_s = None
+    def _import_own_udp_lap_csv(self, src: Path, cached: Path) -> bool:
+        """
+        Import your custom UDP lap CSV into DB.
+        Returns True if it was your format and import succeeded (or at least attempted).
+        """
+        # One open: sniff the first 512 bytes, then decode + parse the same handle for the rows.
+        try:
+            f = cached.open("rb")
+        except Exception:
+            return False
 
+        with f:
             try:
-                self._your_last_tyre = tyre
+                if not self._is_own_udp_lap_csv(f.read(512)):
+                    return False
             except Exception:
-                pass
+                return False
+            # recognized: from here on failures are reported as OWN-UDP import failures
+            return self._import_own_udp_lap_rows(src, f)
+
+    def _import_own_udp_lap_rows(self, src: Path, f) -> bool:
+        """
+        Upsert the new data rows of a recognized own-format CSV.
+        f: binary handle of the file; rows imported by an earlier call are skipped.
+        """
+        try:
+            f.seek(0)
+            header = next(csv.reader([f.readline().decode("utf-8")]), None) or []
+            body = f.tell()
+            # Rows already in the DB are skipped; a smaller file than last time was rewritten
+            offset, done = self._own_udp_done.get(str(src), (body, 0))
+            if not body <= offset <= os.fstat(f.fileno()).st_size:
+                offset, done = body, 0
+            f.seek(offset)
+            data = f.read()
+            end = data.rfind(b"\n") + 1  # complete rows only; a half-written one waits for the next event
+            reader = csv.reader(io.StringIO(data[:end].decode("utf-8"), newline=""))
+
+            # Per-session files hold one row per lap. Row 1 keeps the plain file path as
+            # source (same key as the legacy one-file-per-lap format), later rows get "#<n>".
+            i = done
+            for vals in reader:
+                if not vals:
+                    continue  # blank line
+                source = str(src) if i == 0 else f"{src}#{i + 1}"
+                track, tyre, lap_time_s = self._upsert_own_udp_lap_row(source, dict(zip(header, vals)))
+                i += 1
+            # only after all upserts went through: a failed import is redone from the old offset
+            self._own_udp_done[str(src)] = (offset + end, i)
+
+            if i == done:
+                return True  # recognized format, but no new rows
+
+            # Keep UI NL horizon in sync when importing our own UDP lap CSV format as well.
             try:
-                self._your_last_track = track
+                last_lap_s = float(lap_time_s) if lap_time_s is not None else None
             except Exception:
-                pass
+                last_lap_s = None
+            self._your_last_loaded = (last_lap_s, tyre, track)  # applied by _after_db_update
 
             self._mark_db_ok()
             return True
@@ -2359,7 +2729,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 if len(msg) > 140:
                     msg = msg[:137] + "..."
                 self._health["csv"]["err"] = msg
-                self._refresh_health_panel()
+                self._schedule_health_refresh()
             except Exception:
                 pass
 
@@ -1,7 +1,93 @@
 # app/ui/tabs/db_tab.py
 from __future__ import annotations
 
-from PySide6 import QtWidgets
+from typing import Callable
+
+from PySide6 import QtCore, QtWidgets
+
+LAPS_HEADERS = [
+    "lap",
+    "created_at",
+    "game",
+    "track",
+    "session",
+    "session_uid",
+    "tyre",
+    "weather",
+    "lap_time_s",
+    "fuel",
+    "wear_FL",
+    "wear_FR",
+    "wear_RL",
+    "wear_RR",
+    "lap_tag",
+]
+_TAG_COL = len(LAPS_HEADERS) - 1  # last column; DB row values sit at 1.._TAG_COL-1
+
+
+class LapsModel(QtCore.QAbstractTableModel):
+    """
+    Read-only model for the DB laps table.
+    Holds the latest_laps() rows as plain lists; cell text is produced lazily in data(),
+    so Qt only formats what is actually visible.
+
+    Lap numbers/tags come from a tagger callable (rows -> (lapno, tags)) that only runs
+    the first time a lap/tag cell is requested, i.e. not at all while the DB tab stays hidden.
+
+    Columns: lap number, the DB row columns, lap tag (see LAPS_HEADERS).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: list = []
+        self._tagger: Callable[[list], tuple[dict[int, int], list[str]]] | None = None
+        self._tags: list[str] | None = None
+        self._lapno: dict[int, int] = {}  # row_index -> lap number
+
+    def set_rows(self, rows: list, tagger: Callable[[list], tuple[dict[int, int], list[str]]]) -> None:
+        self.beginResetModel()
+        self.rows = rows
+        self._tagger = tagger
+        self._tags = None
+        self._lapno = {}
+        self.endResetModel()
+
+    def _ensure_tags(self) -> list[str]:
+        if self._tags is None:
+            try:
+                self._lapno, self._tags = self._tagger(self.rows)
+            except Exception:
+                self._lapno, self._tags = {}, [""] * len(self.rows)
+        return self._tags
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(LAPS_HEADERS)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        r = index.row()
+        c = index.column()
+        if c == 0:
+            self._ensure_tags()
+            return str(self._lapno.get(r, ""))
+        if c == _TAG_COL:
+            return self._ensure_tags()[r]
+        # DB row value straight from the stored tuple (no per-row display copy)
+        row = self.rows[r]
+        if c > len(row):
+            return ""
+        val = row[c - 1]
+        return "" if val is None else str(val)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role == QtCore.Qt.ItemDataRole.DisplayRole and orientation == QtCore.Qt.Orientation.Horizontal:
+            if 0 <= section < len(LAPS_HEADERS):
+                return LAPS_HEADERS[section]
+        return None
 
 
 class DbTabWidget(QtWidgets.QWidget):
@@ -29,26 +115,10 @@ class DbTabWidget(QtWidgets.QWidget):
 
         db_bar.addStretch(1)
 
-        self.tbl = QtWidgets.QTableWidget()
+        self.laps_model = LapsModel(self)
+        self.tbl = QtWidgets.QTableView()
         self.tbl.verticalHeader().setVisible(False)
-        self.tbl.setColumnCount(15)
-        self.tbl.setHorizontalHeaderLabels([
-            "lap",
-            "created_at",
-            "game",
-            "track",
-            "session",
-            "session_uid",
-            "tyre",
-            "weather",
-            "lap_time_s",
-            "fuel",
-            "wear_FL",
-            "wear_FR",
-            "wear_RL",
-            "wear_RR",
-            "lap_tag",
-        ])
+        self.tbl.setModel(self.laps_model)
         self.tbl.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         db_outer.addWidget(self.tbl, 1)
 
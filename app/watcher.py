@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import hashlib
+import re
 import shutil
 import time
 from pathlib import Path
@@ -12,6 +13,8 @@ from watchdog.observers import Observer
 
 from app.paths import cache_dir
 
+_RE_TT = re.compile(r"^tt_|_tt_|_tt$")  # on the lower-cased file stem
+
 
 def _stable_file(path: Path, checks: int = 5, delay: float = 0.25) -> bool:
     """Wait until file size is stable for at least 2 consecutive checks."""
@@ -51,7 +54,7 @@ def copy_to_cache(src: Path) -> Optional[Path]:
         return None
 
     # Dein TT-Format: hungary_DRY_TT_79.111_mclaren
-    if "_tt_" in name or name.endswith("_tt") or name.startswith("tt_"):
+    if _RE_TT.search(name):
         return None
     # -----------------------------------------------
 